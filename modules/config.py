@@ -5,7 +5,7 @@ Centralized settings with precedence: CLI > ENV > YAML > Defaults
 
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 try:
     import yaml
@@ -89,6 +89,30 @@ class Config:
             default=env_profile.get("chromedriver_path", "C:\\WebDriver\\chromedriver.exe")
         )
     
+    @property
+    def chrome_lean(self) -> bool:
+        return bool(self.get("chrome.lean", default=True))
+    
+    @property
+    def chrome_page_load_strategy(self) -> str:
+        return self.get("chrome.page_load_strategy", default="eager")
+    
+    @property
+    def chrome_disable_extensions(self) -> bool:
+        return bool(self.get("chrome.disable_extensions", default=True))
+    
+    @property
+    def chrome_blocked_url_patterns(self) -> List[str]:
+        return list(self.get("chrome.blocked_url_patterns", default=[]) or [])
+    
+    @property
+    def chrome_capture_network(self) -> bool:
+        return bool(self.get("chrome.capture_network", default=False))
+    
+    @property
+    def chrome_capture_url_patterns(self) -> List[str]:
+        return list(self.get("chrome.capture_url_patterns", default=["/reply/"]) or [])
+    
     # Scraper Settings
     @property
     def headless_default(self) -> bool:
@@ -124,6 +148,183 @@ class Config:
     def timeout_seconds(self) -> int:
         return self.get("scraper.timeout_seconds", default=10)
     
+    @property
+    def reveal_quiet_ms(self) -> int:
+        return int(self.get("scraper.reveal_quiet_ms", default=500))
+    
+    @property
+    def fetch_workers(self) -> int:
+        return int(self.get("scraper.fetch_workers", default=8))
+    
+    @property
+    def per_host_connections(self) -> int:
+        return int(self.get("scraper.per_host_connections", default=2))
+    
+    @property
+    def max_page_bytes(self) -> int:
+        return int(float(self.get("scraper.max_page_kb", default=2048)) * 1024)
+    
+    @property
+    def parse_workers(self) -> int:
+        return int(self.get("scraper.parse_workers", default=0))
+    
+    @property
+    def parse_batch(self) -> int:
+        return int(self.get("scraper.parse_batch", default=64))
+    
+    @property
+    def parse_chunksize(self) -> int:
+        return int(self.get("scraper.parse_chunksize", default=4))
+    
+    @property
+    def page_cache_enabled(self) -> bool:
+        return bool(self.get("scraper.page_cache", default=True))
+    
+    @property
+    def page_cache_path(self) -> Path:
+        return Path(self.get("scraper.page_cache_path", default="data/cache/pages.sqlite"))
+    
+    @property
+    def page_cache_max_age_seconds(self) -> float:
+        return float(self.get("scraper.page_cache_max_age_hours", default=12)) * 3600
+    
+    @property
+    def seen_set_enabled(self) -> bool:
+        return bool(self.get("scraper.seen_set", default=True))
+    
+    @property
+    def seen_set_path(self) -> Path:
+        return Path(self.get("scraper.seen_set_path", default="data/cache/seen.sqlite"))
+    
+    @property
+    def revisit_after_seconds(self) -> float:
+        return float(self.get("scraper.revisit_after_days", default=7)) * 86400
+    
+    @property
+    def journal_keep_runs(self) -> int:
+        return int(self.get("scraper.journal_keep_runs", default=3))
+    
+    @property
+    def archive_enabled(self) -> bool:
+        return bool(self.get("scraper.archive", default=False))
+    
+    @property
+    def archive_dir(self) -> Path:
+        return Path(self.get("scraper.archive_dir", default="data/archive"))
+    
+    @property
+    def archive_max_age_seconds(self) -> float:
+        return float(self.get("scraper.archive_max_age_days", default=30)) * 86400
+    
+    @property
+    def archive_max_bytes(self) -> int:
+        return int(float(self.get("scraper.archive_max_mb", default=500)) * 1024 * 1024)
+    
+    # Enrichment Routing
+    @property
+    def http_first(self) -> bool:
+        return bool(self.get("enrichment.http_first", default=True))
+    
+    @property
+    def browser_domains(self) -> List[str]:
+        return list(self.get("enrichment.browser_domains", default=["craigslist.org"]) or [])
+    
+    @property
+    def tier_memory_path(self) -> Path:
+        return Path(self.get("enrichment.tier_memory_path", default="data/cache/tiers.sqlite"))
+    
+    @property
+    def tier_min_samples(self) -> int:
+        return int(self.get("enrichment.tier_min_samples", default=2))
+    
+    @property
+    def browser_pool_size(self) -> int:
+        env_profile = self.get_env_profile()
+        return int(env_profile.get("browser_pool_size",
+            self.get("enrichment.browser_pool_size", default=2)))
+    
+    @property
+    def driver_max_pages(self) -> int:
+        return int(self.get("enrichment.driver_max_pages", default=50))
+    
+    @property
+    def checkpoint_every(self) -> int:
+        return int(self.get("enrichment.checkpoint_every", default=5))
+    
+    @property
+    def resume_fresh_hours(self) -> float:
+        return float(self.get("enrichment.resume_fresh_hours", default=24))
+    
+    @property
+    def skip_cache_enabled(self) -> bool:
+        return bool(self.get("enrichment.skip_cache", default=True))
+    
+    @property
+    def skip_cache_path(self) -> Path:
+        return Path(self.get("enrichment.skip_cache_path", default="data/cache/enrich_skip.sqlite"))
+    
+    @property
+    def skip_base_hours(self) -> float:
+        return float(self.get("enrichment.skip_base_hours", default=12))
+    
+    @property
+    def skip_max_hours(self) -> float:
+        return float(self.get("enrichment.skip_max_days", default=30)) * 24
+    
+    # Curator Settings
+    @property
+    def curator_score_cache_enabled(self) -> bool:
+        return bool(self.get("curator.score_cache", default=True))
+    
+    @property
+    def curator_score_cache_path(self) -> Path:
+        return Path(self.get("curator.score_cache_path", default="data/cache/curator_scores.sqlite"))
+    
+    @property
+    def dedupe_enabled(self) -> bool:
+        return bool(self.get("curator.dedupe", default=True))
+    
+    @property
+    def dedupe_threshold(self) -> float:
+        return float(self.get("curator.dedupe_threshold", default=0.7))
+    
+    @property
+    def dedupe_suppress_seconds(self) -> float:
+        return float(self.get("curator.dedupe_suppress_days", default=7)) * 86400
+    
+    # Search Settings
+    @property
+    def search_mode(self) -> str:
+        return self.get("search.mode", env_var="WSP_SEARCH_MODE", default="async")
+    
+    @property
+    def search_concurrency(self) -> int:
+        return int(self.get("search.concurrency", default=4))
+    
+    @property
+    def search_rate_per_second(self) -> float:
+        return float(self.get("search.rate_per_second", default=2.0))
+    
+    @property
+    def search_burst(self) -> float:
+        return float(self.get("search.burst", default=2.0))
+    
+    @property
+    def search_cache_mode(self) -> str:
+        return self.get("search.cache_mode", env_var="WSP_SEARCH_CACHE", default="read")
+    
+    @property
+    def search_cache_dir(self) -> Path:
+        return Path(self.get("search.cache_dir", default="data/cache/serpapi"))
+    
+    @property
+    def search_cache_ttl_seconds(self) -> float:
+        return float(self.get("search.cache_ttl_hours", default=168)) * 3600
+    
+    @property
+    def search_cache_max_bytes(self) -> int:
+        return int(float(self.get("search.cache_max_mb", default=50)) * 1024 * 1024)
+    
     # Selectors
     @property
     def selectors(self) -> Dict[str, Dict[str, str]]:
@@ -1,12 +1,30 @@
 """
 Curator stage: score scraped contacts and surface top candidates for review.
+
+Scoring is driven by a weighted profile (``config/curator.json`` or a
+``config/curation_profile_*.json``): keyword weights, a budget window and
+contact bonuses. Profiles are loaded and compiled once, then applied to
+whole columns at a time.
 """
 
+import hashlib
+import heapq
+import json
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from .keyword_matcher import KeywordMatcher
+from .score_cache import SCORE_COLUMNS, ScoreCache
+
+# Resolved from the package, not the working directory (streamlit, scripts)
+DEFAULT_PROFILE = Path(__file__).resolve().parent.parent / "config" / "curator.json"
+
+# Fallback weights when no profile file is available
 POSITIVE_KEYWORDS = [
     "owner",
     "owner-occupied",
@@ -33,53 +51,300 @@ NEGATIVE_KEYWORDS = [
     "management company",
 ]
 
+# "$650", "$1,200/mo", "$ 700"
+_PRICE_RE = re.compile(r"\$\s?(\d{1,2},\d{3}|\d{3,4})\b")
 
-def _score_text(value: str) -> int:
-    score = 0
-    text = (value or "").lower()
-    for kw in POSITIVE_KEYWORDS:
-        if kw in text:
-            score += 3
-    for kw in NEGATIVE_KEYWORDS:
-        if kw in text:
-            score -= 2
-    return score
+# Scoring inputs; read as text so chunked and whole-file reads infer the same values
+_TEXT_COLUMNS = ("organization", "snippet", "url", "emails", "phones")
+_TEXT_DTYPES = {c: str for c in _TEXT_COLUMNS}
 
+SHORTLIST_COLUMNS = [
+    "organization", "url", "emails", "phones", "snippet", "score", "score_details", "approved",
+]
+
+
+class CurationProfile:
+    """A weighted scoring profile with its keyword matcher compiled."""
+
+    def __init__(
+        self,
+        positive: Dict[str, float],
+        negative: Dict[str, float],
+        budget_min: Optional[float] = None,
+        budget_max: Optional[float] = None,
+        budget_bonus: float = 0.0,
+        budget_penalty: float = 0.0,
+        contact_bonus: Optional[Dict[str, float]] = None,
+        top_n: int = 10,
+        name: str = "builtin",
+    ):
+        self.name = name
+        self.positive = {k.lower(): float(w) for k, w in positive.items()}
+        self.negative = {k.lower(): float(w) for k, w in negative.items()}
+        self.budget_min = budget_min
+        self.budget_max = budget_max
+        self.budget_bonus = float(budget_bonus)
+        self.budget_penalty = float(budget_penalty)
+        self.contact_bonus = {k: float(v) for k, v in (contact_bonus or {}).items()}
+        self.top_n = int(top_n)
+        self.weights: Dict[str, float] = {}
+        for keyword, weight in list(self.positive.items()) + list(self.negative.items()):
+            self.weights[keyword] = self.weights.get(keyword, 0.0) + weight
+        self.matcher = KeywordMatcher(self.weights)
+        # Identifies everything that affects a row's score (not top_n)
+        self.fingerprint = hashlib.md5(json.dumps({
+            "weights": self.weights,
+            "budget": [budget_min, budget_max, self.budget_bonus, self.budget_penalty],
+            "contact_bonus": self.contact_bonus,
+            "price_re": _PRICE_RE.pattern,
+        }, sort_keys=True).encode()).hexdigest()
+
+    @classmethod
+    def from_dict(cls, data: dict, name: str = "profile") -> "CurationProfile":
+        return cls(
+            positive=data.get("positive", {}),
+            negative=data.get("negative", {}),
+            budget_min=data.get("budget_min"),
+            budget_max=data.get("budget_max"),
+            budget_bonus=data.get("budget_bonus", 0.0),
+            budget_penalty=data.get("budget_penalty", 0.0),
+            contact_bonus=data.get("contact_bonus"),
+            top_n=data.get("top_n", 10),
+            name=name,
+        )
+
+    @property
+    def has_budget(self) -> bool:
+        return self.budget_min is not None and self.budget_max is not None
 
-def curate_contacts(
-    input_csv: str | Path = "data/contacts_raw.csv",
-    out_csv: str | Path = "data/top10_landlords.csv",
-    top_n: int = 10,
-) -> pd.DataFrame:
-    """Produce a scored shortlist CSV for human approval."""
-    input_path = Path(input_csv)
-    if not input_path.exists():
-        raise FileNotFoundError(f"{input_path} not found; run scraper first.")
 
-    df = pd.read_csv(input_path)
-    for column in ("organization", "snippet", "url", "emails"):
+BUILTIN_PROFILE = CurationProfile(
+    positive={kw: 3 for kw in POSITIVE_KEYWORDS},
+    negative={kw: -2 for kw in NEGATIVE_KEYWORDS},
+    contact_bonus={"has_email": 2},
+)
+
+
+@lru_cache(maxsize=None)
+def _load_profile_file(path: Path) -> CurationProfile:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return CurationProfile.from_dict(data, name=path.name)
+
+
+def load_profile(path: str | Path | None = None) -> CurationProfile:
+    """
+    Load (once per path) and compile a curation profile.
+
+    ``None`` means ``config/curator.json``, falling back to the built-in
+    keyword lists if that file does not exist.
+    """
+    if path is None:
+        if not DEFAULT_PROFILE.exists():
+            print(f"[curator] {DEFAULT_PROFILE} not found; using the built-in profile")
+            return BUILTIN_PROFILE
+        path = DEFAULT_PROFILE
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"curation profile {path} not found")
+    return _load_profile_file(path.resolve())
+
+
+def _text_columns(df: pd.DataFrame) -> pd.DataFrame:
+    for column in _TEXT_COLUMNS:
         if column not in df.columns:
             df[column] = ""
+    return df
+
 
-    df["combined"] = (
-        df["organization"].fillna("")
+def _combined(df: pd.DataFrame) -> pd.Series:
+    return (
+        df["organization"].fillna("").astype(str)
         + " "
-        + df["snippet"].fillna("")
+        + df["snippet"].fillna("").astype(str)
         + " "
-        + df["url"].fillna("")
+        + df["url"].fillna("").astype(str)
     )
-    df["score"] = df["combined"].apply(_score_text)
-    df["has_email"] = df["emails"].fillna("").astype(bool)
-    df["score"] += df["has_email"].astype(int) * 2
 
-    shortlisted = df.sort_values("score", ascending=False).head(top_n).copy()
-    shortlisted["approved"] = False
-    shortlisted = shortlisted[
-        ["organization", "url", "emails", "phones", "snippet", "score", "approved"]
+
+def row_hashes(df: pd.DataFrame) -> pd.Series:
+    """Stable 64-bit hash of each row's scoring inputs."""
+    hashed = pd.util.hash_pandas_object(
+        df[list(_TEXT_COLUMNS)].fillna("").astype(str), index=False
+    )
+    return pd.Series(hashed.to_numpy().view("int64"), index=df.index)
+
+
+def _score_columns(df: pd.DataFrame, profile: CurationProfile) -> pd.DataFrame:
+    """
+    ``SCORE_COLUMNS`` for every row of df.
+
+    Keyword matching is one ``matcher.find`` per row; weighting, budget and
+    contact bonuses are column operations.
+    """
+    combined = _combined(df)
+    scores = pd.DataFrame(index=df.index)
+
+    exploded = combined.map(profile.matcher.find).map(sorted).explode().dropna()
+    scores["keyword_score"] = (
+        exploded.map(profile.weights).astype(float).groupby(level=0).sum()
+        .reindex(df.index, fill_value=0.0)
+    )
+
+    scores["price"] = pd.to_numeric(
+        combined.str.extract(_PRICE_RE, expand=False).str.replace(",", "", regex=False),
+        errors="coerce",
+    )
+    if profile.has_budget:
+        in_budget = scores["price"].between(profile.budget_min, profile.budget_max)
+        scores["budget_score"] = np.where(
+            in_budget, profile.budget_bonus,
+            np.where(scores["price"].notna(), profile.budget_penalty, 0.0),
+        )
+    else:
+        scores["budget_score"] = 0.0
+
+    has_email = df["emails"].fillna("").astype(str).str.strip().ne("")
+    has_phone = df["phones"].fillna("").astype(str).str.strip().ne("")
+    scores["contact_score"] = (
+        has_email * profile.contact_bonus.get("has_email", 0.0)
+        + has_phone * profile.contact_bonus.get("has_phone", 0.0)
+    )
+    return scores[SCORE_COLUMNS]
+
+
+def score_frame(
+    df: pd.DataFrame, profile: CurationProfile, cache: Optional[ScoreCache] = None
+) -> pd.DataFrame:
+    """
+    Add ``score`` and its components to a contacts frame.
+
+    With a ``cache``, rows whose inputs and profile are unchanged since an
+    earlier run reuse their stored scores; only new or edited rows are scored.
+    """
+    df = _text_columns(df).reset_index(drop=True)
+    if cache is None:
+        scores = _score_columns(df, profile)
+    else:
+        keys = row_hashes(df)
+        cached = cache.lookup(profile.fingerprint, keys)
+        hit = keys.isin(cached.index)
+        scores = pd.DataFrame(index=df.index, columns=SCORE_COLUMNS, dtype=float)
+        if hit.any():
+            scores.loc[hit] = cached.loc[keys[hit]].to_numpy()
+        if not hit.all():
+            fresh = _score_columns(df[~hit], profile)
+            scores.loc[~hit] = fresh.to_numpy()
+            cache.store(profile.fingerprint, keys[~hit], fresh)
+        cache.count(hits=int(hit.sum()), misses=int((~hit).sum()))
+
+    df[SCORE_COLUMNS] = scores
+    df["score"] = df["keyword_score"] + df["budget_score"] + df["contact_score"]
+    return df
+
+
+def score_details(row: pd.Series, profile: CurationProfile) -> str:
+    """JSON breakdown of a scored row (read by the mission-control template picker)."""
+    hits = row["hits"]
+    price = row["price"]
+    return json.dumps({
+        "profile": profile.name,
+        "positive_hits": [k for k in profile.positive if k in hits],
+        "negative_hits": [k for k in profile.negative if k in hits],
+        "keyword_score": float(row["keyword_score"]),
+        "price": None if pd.isna(price) else float(price),
+        "budget_score": float(row["budget_score"]),
+        "contact_score": float(row["contact_score"]),
+    })
+
+
+def _top_rows(df: pd.DataFrame, top_n: int) -> pd.DataFrame:
+    """Highest scores first; ties keep input order (stable sort)."""
+    return df.sort_values("score", ascending=False, kind="mergesort").head(top_n)
+
+
+def _streamed_top_rows(
+    input_path: Path,
+    profile: CurationProfile,
+    top_n: int,
+    chunksize: int,
+    cache: Optional[ScoreCache] = None,
+) -> pd.DataFrame:
+    """
+    ``_top_rows`` over a CSV read ``chunksize`` rows at a time.
+
+    A min-heap keyed on (score, -row number) holds the best ``top_n`` rows
+    seen so far, so memory is O(top_n + chunksize) and ties resolve to the
+    earlier row exactly as the stable in-memory sort does.
+    """
+    heap: List[Tuple[float, int, dict]] = []
+    offset = 0
+    for chunk in pd.read_csv(input_path, chunksize=chunksize, dtype=_TEXT_DTYPES):
+        scored = score_frame(chunk, profile, cache)
+        scored.index += offset
+        offset += len(scored)
+        # Only a chunk's own top N can enter the overall top N
+        for row_number, row in scored.nlargest(top_n, "score", keep="first").iterrows():
+            item = (row["score"], -row_number, row.to_dict())
+            if len(heap) < top_n:
+                heapq.heappush(heap, item)
+            elif item[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, item)
+    best = sorted(heap, key=lambda item: (-item[0], -item[1]))
+    return pd.DataFrame([row for _score, _neg_row, row in best])
+
+
+def curate_contacts(
+    input_csv: str | Path = "data/contacts_raw.csv",
+    out_csv: str | Path = "data/top10_landlords.csv",
+    top_n: Optional[int] = None,
+    profile: str | Path | CurationProfile | None = None,
+    chunksize: Optional[int] = None,
+    cache: Optional[ScoreCache] = None,
+) -> pd.DataFrame:
+    """
+    Produce a scored shortlist CSV for human approval.
+
+    With ``chunksize`` the input is streamed and only the running top N is
+    kept in memory; the shortlist is identical to the whole-file path. With
+    a ``cache`` only rows that are new or changed since the last run (or
+    scored under a different profile) are scored, and cache entries for
+    rows no longer in the input or for older versions of the profile are
+    dropped. Every row is still read and hashed, so a cached run is O(rows).
+    """
+    input_path = Path(input_csv)
+    if not input_path.exists():
+        raise FileNotFoundError(f"{input_path} not found; run scraper first.")
+    if not isinstance(profile, CurationProfile):
+        profile = load_profile(profile)
+    if top_n is None:
+        top_n = profile.top_n
+
+    hits_before, misses_before = (cache.stats["hits"], cache.stats["misses"]) if cache else (0, 0)
+    if cache is not None:
+        cache.use_profile(profile.name, profile.fingerprint)
+    if chunksize:
+        shortlisted = _streamed_top_rows(input_path, profile, top_n, chunksize, cache)
+    else:
+        df = score_frame(pd.read_csv(input_path, dtype=_TEXT_DTYPES), profile, cache)
+        shortlisted = _top_rows(df, top_n).copy()
+    if cache is not None:
+        # Every input row was looked up; the rest belong to rows since removed
+        cache.prune(profile.fingerprint)
+        hits = cache.stats["hits"] - hits_before
+        total = hits + cache.stats["misses"] - misses_before
+        print(f"[curator] score cache: reused {hits} of {total} rows "
+              f"({hits / total if total else 0.0:.0%} hit ratio)")
+    if shortlisted.empty:
+        shortlisted = pd.DataFrame(columns=SHORTLIST_COLUMNS)
+    shortlisted["hits"] = _combined(shortlisted).map(profile.matcher.find)
+    shortlisted["score_details"] = [
+        score_details(row, profile) for _, row in shortlisted.iterrows()
     ]
+    shortlisted["approved"] = False
+    shortlisted = shortlisted[SHORTLIST_COLUMNS]
 
     out_path = Path(out_csv)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     shortlisted.to_csv(out_path, index=False)
-    print(f"[curator] wrote top {len(shortlisted)} rows to {out_path}")
+    print(f"[curator] wrote top {len(shortlisted)} rows to {out_path} (profile {profile.name})")
     return shortlisted
@@ -0,0 +1,140 @@
+"""
+Bounded pool of reusable WebDrivers for parallel browser enrichment.
+
+Drivers are started lazily (a run that never needs a browser never launches
+one), health-checked on checkout, recycled after ``max_pages`` pages to cap
+memory growth, and replaced when they crash.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional
+
+
+def _is_alive(driver: Any) -> bool:
+    """Cheap round trip to the browser; False if the session or process is gone."""
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:  # noqa: BLE001 - any failure means the driver is unusable
+        return False
+
+
+def _quit(driver: Any) -> None:
+    try:
+        driver.quit()
+    except Exception:  # noqa: BLE001 - already dead
+        pass
+
+
+class _Slot:
+    __slots__ = ("driver", "pages")
+
+    def __init__(self, driver: Any):
+        self.driver = driver
+        self.pages = 0
+
+
+class DriverPool:
+    """
+    Thread-safe pool of at most ``size`` drivers built by ``factory``.
+
+    ``stats`` counts ``created``, ``recycled`` (hit ``max_pages``),
+    ``replaced`` (failed a health check or crashed mid-page) and ``pages``.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = 2,
+        max_pages: int = 50,
+        health_check: Callable[[Any], bool] = _is_alive,
+    ):
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_pages = max(1, max_pages)
+        self.health_check = health_check
+        self.stats: Counter = Counter(created=0, recycled=0, replaced=0, pages=0)
+        self._idle: "queue.LifoQueue[_Slot]" = queue.LifoQueue()
+        self._capacity = threading.BoundedSemaphore(self.size)
+        self._all: List[_Slot] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _new_slot(self) -> _Slot:
+        slot = _Slot(self.factory())
+        with self._lock:
+            self._all.append(slot)
+            self.stats["created"] += 1
+        return slot
+
+    def _discard(self, slot: _Slot) -> None:
+        with self._lock:
+            if slot in self._all:
+                self._all.remove(slot)
+        _quit(slot.driver)
+
+    def _checkout(self) -> _Slot:
+        try:
+            slot = self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_slot()
+        if self.health_check(slot.driver):
+            return slot
+        self._count("replaced")
+        self._discard(slot)
+        return self._new_slot()
+
+    @contextmanager
+    def driver(self) -> Iterator[Any]:
+        """Borrow a driver; blocks while all ``size`` drivers are in use."""
+        if self._closed:
+            raise RuntimeError("driver pool is closed")
+        self._capacity.acquire()
+        slot: Optional[_Slot] = None
+        try:
+            slot = self._checkout()
+            try:
+                yield slot.driver
+            except Exception:
+                if not self.health_check(slot.driver):
+                    self._count("replaced")
+                    self._discard(slot)
+                    slot = None
+                raise
+            finally:
+                if slot is not None:
+                    slot.pages += 1
+                    self._count("pages")
+            if slot.pages >= self.max_pages:
+                self._count("recycled")
+                self._discard(slot)
+                slot = None
+        finally:
+            if slot is not None:
+                self._idle.put(slot)
+            self._capacity.release()
+
+    def close(self) -> None:
+        """Quit every driver the pool has started."""
+        self._closed = True
+        with self._lock:
+            slots, self._all = self._all, []
+        for slot in slots:
+            _quit(slot.driver)
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+    def __enter__(self) -> "DriverPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,190 @@
+"""
+Decoders that recover obfuscated email addresses from raw HTML.
+
+Each decoder is registered with literal marker substrings; it only runs on
+pages containing one of them, and the costlier decoders only scan windows
+around the markers, so ordinary pages pay for a few substring checks.
+Built-in decoders handle:
+
+``cfemail``   Cloudflare email protection (``data-cfemail`` / ``#<hex>`` links)
+``entities``  HTML entity encoding (``john&#64;example&#46;com``)
+``at_dot``    spelled-out forms (``john [at] example [dot] com``)
+``js``        script tricks: concatenated literals, ``String.fromCharCode``,
+              reversed strings and ``\\x40`` escapes
+
+Further decoders can be added with the ``email_decoder`` decorator. Register
+them at import time of a module the scraper imports, so process-pool workers
+see them too.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Pattern, Set, Tuple
+
+# Loose candidate pattern; decode_obfuscated validates against the caller's regex.
+_CANDIDATE_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+
+
+class EmailDecoder(NamedTuple):
+    name: str
+    markers: Tuple[str, ...]
+    decode: Callable[[str], Iterable[str]]
+
+
+EMAIL_DECODERS: List[EmailDecoder] = []
+
+
+def email_decoder(name: str, *markers: str):
+    """
+    Register ``func(text) -> addresses`` to run on pages containing any of
+    the markers (matched case-insensitively; give them in lower case).
+    """
+
+    def register(func: Callable[[str], Iterable[str]]):
+        EMAIL_DECODERS.append(EmailDecoder(name, markers, func))
+        return func
+
+    return register
+
+
+def marker_windows(
+    text: str, markers: Iterable[str], before: int = 120, after: int = 120
+) -> Iterator[str]:
+    """Yield the (merged) slices of text around each occurrence of a marker."""
+    lowered = text.lower()
+    spans = []
+    for marker in markers:
+        start = lowered.find(marker)
+        while start != -1:
+            spans.append((max(0, start - before), start + len(marker) + after))
+            start = lowered.find(marker, start + 1)
+    spans.sort()
+    merged: List[List[int]] = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    for start, end in merged:
+        yield text[start:end]
+
+
+def decode_obfuscated(
+    text: str, email_re: Pattern[str] = _CANDIDATE_RE
+) -> List[Tuple[str, str]]:
+    """Run the decoder chain; returns (decoder name, address) pairs matching email_re."""
+    found = []
+    lowered = text.lower()
+    for decoder in EMAIL_DECODERS:
+        if not any(marker in lowered for marker in decoder.markers):
+            continue
+        for address in decoder.decode(text):
+            address = address.strip().strip(".")
+            if email_re.fullmatch(address):
+                found.append((decoder.name, address))
+    return found
+
+
+_CFEMAIL_RE = re.compile(
+    r"data-cfemail=[\"']([0-9a-fA-F]+)[\"']|/cdn-cgi/l/email-protection#([0-9a-fA-F]+)"
+)
+
+
+def cf_decode(encoded: str) -> str:
+    """Decode a Cloudflare hex string: first byte is the XOR key."""
+    key = int(encoded[:2], 16)
+    return "".join(
+        chr(int(encoded[i : i + 2], 16) ^ key) for i in range(2, len(encoded) - 1, 2)
+    )
+
+
+@email_decoder("cfemail", "cfemail", "email-protection")
+def _decode_cfemail(text: str) -> Iterable[str]:
+    for attr, href in _CFEMAIL_RE.findall(text):
+        try:
+            yield cf_decode(attr or href)
+        except ValueError:
+            continue
+
+
+_ENTITY_AT = ("&#64;", "&#064;", "&#x40;", "&commat;")
+
+
+@email_decoder("entities", *_ENTITY_AT)
+def _decode_entities(text: str) -> Iterable[str]:
+    for window in marker_windows(text, _ENTITY_AT, before=200, after=200):
+        yield from _CANDIDATE_RE.findall(html.unescape(window))
+
+
+_AT = r"\s*(?:[\[\(\{]\s*(?:at|@)\s*[\]\)\}])\s*|\s+at\s+"
+_DOT = r"\s*(?:[\[\(\{]\s*dot\s*[\]\)\}])\s*|\s+dot\s+"
+_AT_DOT_RE = re.compile(
+    rf"([A-Za-z0-9._%+-]+)(?:{_AT})((?:[A-Za-z0-9-]+(?:{_DOT}|\.))+[A-Za-z]{{2,}})\b",
+    re.IGNORECASE,
+)
+_DOT_TOKEN_RE = re.compile(_DOT, re.IGNORECASE)
+_BRACKET_AT_RE = re.compile(r"[\[\(\{]\s*(?:at|@)\s*[\]\)\}]", re.IGNORECASE)
+_AT_DOT_MARKERS = ("[at]", "(at)", "[dot]", "(dot)", " dot ")
+
+
+@email_decoder("at_dot", *_AT_DOT_MARKERS)
+def _decode_at_dot(text: str) -> Iterable[str]:
+    matches = (
+        match
+        for window in marker_windows(text, _AT_DOT_MARKERS)
+        for match in _AT_DOT_RE.finditer(window)
+    )
+    for match in matches:
+        local, domain = match.groups()
+        spelled_dot = _DOT_TOKEN_RE.search(domain)
+        # A bare " at " followed by a literal dot is ordinary prose
+        # ("meet me at noon.Then"); require a bracketed at or a spelled dot.
+        if not spelled_dot and not _BRACKET_AT_RE.search(match.group(0)):
+            continue
+        yield f"{local}@{_DOT_TOKEN_RE.sub('.', domain)}"
+
+
+_JS_CONCAT_RE = re.compile(
+    r"""(?:(["'])(?:(?!\1)[^\\\n]|\\.)*\1\s*\+\s*)+(["'])(?:(?!\2)[^\\\n]|\\.)*\2"""
+)
+_JS_LITERAL_RE = re.compile(r"""(["'])((?:(?!\1)[^\\\n]|\\.)*)\1""")
+_JS_CHARCODES_RE = re.compile(r"fromCharCode\(\s*([\d\s,]+)\)")
+_JS_REVERSED_RE = re.compile(
+    r"""(["'])([^"'\n]*)\1\s*\.split\(\s*(["'])\3\s*\)\s*\.reverse\(\)\s*\.join\("""
+)
+_JS_ESCAPE_RE = re.compile(r"\\x([0-9a-fA-F]{2})|\\u([0-9a-fA-F]{4})")
+
+
+def _unescape_js(literal: str) -> str:
+    return _JS_ESCAPE_RE.sub(lambda m: chr(int(m.group(1) or m.group(2), 16)), literal)
+
+
+_JS_CONCAT_MARKERS = ("'@'", '"@"')
+_JS_ESCAPE_MARKERS = ("\\x40", "\\u0040")
+
+
+@email_decoder(
+    "js", "fromcharcode", ".reverse()", *_JS_CONCAT_MARKERS, *_JS_ESCAPE_MARKERS
+)
+def _decode_js(text: str) -> Iterable[str]:
+    decoded: Set[str] = set()
+    for window in marker_windows(text, _JS_CONCAT_MARKERS, before=200, after=200):
+        for match in _JS_CONCAT_RE.finditer(window):
+            joined = "".join(lit for _q, lit in _JS_LITERAL_RE.findall(match.group(0)))
+            decoded.update(_CANDIDATE_RE.findall(_unescape_js(joined)))
+    for window in marker_windows(text, ("fromcharcode",), before=0, after=600):
+        for codes in _JS_CHARCODES_RE.findall(window):
+            try:
+                chars = "".join(chr(int(code)) for code in codes.split(",") if code.strip())
+            except ValueError:
+                continue
+            decoded.update(_CANDIDATE_RE.findall(chars))
+    for window in marker_windows(text, (".reverse()",), before=300, after=20):
+        for _q, literal, _q2 in _JS_REVERSED_RE.findall(window):
+            decoded.update(_CANDIDATE_RE.findall(literal[::-1]))
+    for window in marker_windows(text, _JS_ESCAPE_MARKERS, before=200, after=200):
+        for _q, literal in _JS_LITERAL_RE.findall(window):
+            decoded.update(_CANDIDATE_RE.findall(_unescape_js(literal)))
+    return decoded
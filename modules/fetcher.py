@@ -0,0 +1,213 @@
+"""
+Concurrent HTTP fetch engine for the scrape stage.
+
+A single keep-alive ``requests.Session`` is shared by a bounded thread pool,
+so repeated hosts reuse pooled TCP/TLS connections. A per-host semaphore
+keeps any one site from receiving more than ``per_host`` parallel requests,
+and an optional HostScheduler spaces out consecutive requests to one host.
+"""
+
+from __future__ import annotations
+
+import codecs
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .ratelimit import HostScheduler
+from .urls import host_of
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/121.0 Safari/537.36"
+)
+
+# Bodies we can scan for contacts; anything else is skipped before download.
+TEXT_CONTENT_TYPES = {
+    "text/html",
+    "application/xhtml+xml",
+    "text/plain",
+    "text/xml",
+    "application/xml",
+    "application/json",
+    "application/ld+json",
+}
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class PageSkipped(Exception):
+    """Raised when a response is deliberately not downloaded or parsed."""
+
+    def __init__(self, reason: str, detail: str = ""):
+        super().__init__(f"{reason}: {detail}" if detail else reason)
+        self.reason = reason
+
+
+@dataclass
+class Page:
+    """A fetched response body, capped at the fetcher's byte limit."""
+
+    url: str
+    status_code: int
+    headers: Mapping[str, str]
+    content_type: str
+    content: bytes = b""
+    text: str = ""
+    truncated: bool = False
+
+
+def _decoder(encoding: Optional[str]) -> codecs.IncrementalDecoder:
+    """Incremental decoder for a response charset; unknown charsets fall back to UTF-8."""
+    try:
+        factory = codecs.getincrementaldecoder(encoding or "utf-8")
+    except LookupError:
+        factory = codecs.getincrementaldecoder("utf-8")
+    return factory(errors="replace")
+
+
+def _build_session(pool_size: int, user_agent: str) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = user_agent
+    return session
+
+
+class Fetcher:
+    """Pooled HTTP client with global and per-host concurrency limits."""
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        per_host: int = 2,
+        timeout: float = 12,
+        user_agent: str = USER_AGENT,
+        session: Optional[requests.Session] = None,
+        scheduler: Optional[HostScheduler] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_bytes = max_bytes
+        self.per_host = max(1, per_host)
+        self.timeout = timeout
+        self.session = session or _build_session(self.max_workers, user_agent)
+        self.scheduler = scheduler
+        self.stats: Counter = Counter()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _host_slot(self, host: str) -> Iterator[None]:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host)
+                self._host_slots[host] = slot
+        with slot:
+            yield
+
+    @contextmanager
+    def _request(self, url: str, **kwargs) -> Iterator[requests.Response]:
+        """Open a GET inside url's host slot; the slot is held until the block exits."""
+        kwargs.setdefault("timeout", self.timeout)
+        host = host_of(url)
+        if self.scheduler is not None:
+            self.scheduler.wait(host)
+        with self._host_slot(host):
+            try:
+                resp = self.session.get(url, **kwargs)
+                resp.raise_for_status()
+            except Exception:
+                self._count("errors")
+                raise
+            self._count("fetched")
+            yield resp
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET url within its host's connection budget; raises on HTTP errors."""
+        with self._request(url, **kwargs) as resp:
+            return resp
+
+    def fetch_page(self, url: str, **kwargs) -> Page:
+        """
+        Stream url into a Page, checking Content-Type before reading the body
+        and decoding incrementally up to ``max_bytes``.
+
+        The host slot stays taken until the body is read, so ``per_host``
+        bounds concurrent transfers, not just concurrent requests. Raises
+        PageSkipped for non-text content types; the reason is counted in
+        ``stats`` as ``skipped_<reason>``.
+        """
+        kwargs["stream"] = True
+        with self._request(url, **kwargs) as resp:
+            return self._read_page(url, resp)
+
+    def _read_page(self, url: str, resp: requests.Response) -> Page:
+        try:
+            content_type = (
+                resp.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            )
+            page = Page(url, resp.status_code, resp.headers, content_type)
+            if resp.status_code == 304:
+                return page
+            if content_type and content_type not in TEXT_CONTENT_TYPES:
+                self._skip("content_type", content_type)
+
+            decoder = _decoder(resp.encoding)
+            raw: List[bytes] = []
+            text: List[str] = []
+            size = 0
+            for chunk in resp.iter_content(CHUNK_SIZE):
+                if size + len(chunk) > self.max_bytes:
+                    chunk = chunk[: self.max_bytes - size]
+                    page.truncated = True
+                size += len(chunk)
+                raw.append(chunk)
+                text.append(decoder.decode(chunk))
+                if page.truncated:
+                    break
+            text.append(decoder.decode(b"", final=True))
+        finally:
+            resp.close()
+
+        if page.truncated:
+            self._count("truncated")
+        page.content = b"".join(raw)
+        page.text = "".join(text)
+        return page
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _skip(self, reason: str, detail: str = "") -> None:
+        self._count(f"skipped_{reason}")
+        raise PageSkipped(reason, detail)
+
+    def map(self, func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """Run func over items on the worker pool; results keep input order."""
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="fetch"
+        ) as pool:
+            return list(pool.map(func, items))
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "Fetcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,137 @@
+"""
+Append-only JSONL progress journal for resumable pipeline stages.
+
+Every completed unit of work is written as one JSON line tagged with a
+``run_id`` and flushed to disk immediately, so an interrupted run loses at
+most the row that was in flight. A torn final line from a crash is ignored
+on read. ``compact`` drops all but the most recent runs so the file (and
+every scan of it) stays bounded.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+
+_TAIL_BYTES = 64 * 1024
+
+
+def new_run_id() -> str:
+    # Microseconds keep runs started in the same second apart
+    return datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+
+
+class Journal:
+    """Durable JSONL journal; safe to append from multiple threads."""
+
+    def __init__(self, path: str | Path, fsync: bool = True):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self._lock = threading.Lock()
+
+    def append(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+                handle.flush()
+                if self.fsync:
+                    os.fsync(handle.fileno())
+
+    def entries(self, run_id: Optional[str] = None) -> Iterator[Tuple[int, dict]]:
+        """Yield (byte offset, record) pairs, optionally for one run only."""
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as handle:
+            while True:
+                offset = handle.tell()
+                line = handle.readline()
+                if not line:
+                    return
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # torn write from an interrupted run
+                if run_id is None or record.get("run_id") == run_id:
+                    yield offset, record
+
+    def read_at(self, offset: int) -> dict:
+        with self.path.open("rb") as handle:
+            handle.seek(offset)
+            return json.loads(handle.readline())
+
+    def latest_run_id(self) -> Optional[str]:
+        """Run ID of the last complete record, read from the end of the file."""
+        if not self.path.exists():
+            return None
+        with self.path.open("rb") as handle:
+            handle.seek(0, os.SEEK_END)
+            size = handle.tell()
+            handle.seek(max(0, size - _TAIL_BYTES))
+            tail = handle.read().splitlines()
+        # The first tail line may be cut mid-record; it is only trusted from offset 0
+        candidates = tail if size <= _TAIL_BYTES else tail[1:]
+        for line in reversed(candidates):
+            try:
+                run_id = json.loads(line).get("run_id")
+            except ValueError:
+                continue
+            if run_id is not None:
+                return run_id
+        latest = None
+        for _offset, record in self.entries():
+            latest = record.get("run_id", latest)
+        return latest
+
+    def clear(self) -> None:
+        """Truncate the journal once everything in it is durable elsewhere."""
+        with self._lock:
+            if self.path.exists():
+                with self.path.open("w", encoding="utf-8"):
+                    pass
+
+    def compact(self, keep_runs: int = 3) -> int:
+        """
+        Keep only records of the ``keep_runs`` most recently started runs.
+
+        Returns the number of records dropped. Offsets from earlier
+        ``entries``/``offsets_by`` calls are invalid afterwards.
+        """
+        with self._lock:
+            order: Dict[str, None] = {}
+            for _offset, record in self.entries():
+                order.setdefault(record.get("run_id"), None)
+            keep = set(list(order)[-max(1, keep_runs):])
+            if len(keep) == len(order):
+                return 0
+            dropped = 0
+            temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with self.path.open("rb") as source, temp_path.open("wb") as target:
+                for line in source:
+                    try:
+                        run_id = json.loads(line).get("run_id")
+                    except ValueError:
+                        continue
+                    if run_id in keep:
+                        target.write(line if line.endswith(b"\n") else line + b"\n")
+                    else:
+                        dropped += 1
+                target.flush()
+                if self.fsync:
+                    os.fsync(target.fileno())
+            temp_path.replace(self.path)
+            return dropped
+
+    def offsets_by(self, field: str, run_id: Optional[str]) -> Dict[object, int]:
+        """Map each value of ``field`` to the offset of its latest record (in one run, or any)."""
+        offsets: Dict[object, int] = {}
+        for offset, record in self.entries(run_id):
+            if field in record:
+                offsets[record[field]] = offset
+        return offsets
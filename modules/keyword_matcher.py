@@ -0,0 +1,87 @@
+"""
+Multi-keyword matching for the curator.
+
+``KeywordMatcher`` is compiled once per keyword set and reports which
+keywords occur (as case-insensitive substrings) in a text. Large sets use
+an Aho-Corasick automaton, flattened into a DFA so a document is scanned in
+a single pass regardless of how many keywords there are. Small sets keep
+the per-keyword ``in`` test: in pure Python, one C-level substring search
+per keyword beats a per-character automaton step until there are roughly
+``AUTOMATON_MIN_KEYWORDS`` keywords (``scripts/bench_curator.py`` measures
+the crossover).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+AUTOMATON_MIN_KEYWORDS = 80
+
+_NO_HITS: FrozenSet[str] = frozenset()
+
+
+def _compile(keywords: Iterable[str]) -> Tuple[List[Dict[str, int]], List[FrozenSet[str]]]:
+    """Build the Aho-Corasick trie and fold failure links into a full DFA."""
+    goto: List[Dict[str, int]] = [{}]
+    outputs: List[set] = [set()]
+    for keyword in keywords:
+        state = 0
+        for char in keyword:
+            nxt = goto[state].get(char)
+            if nxt is None:
+                goto.append({})
+                outputs.append(set())
+                nxt = goto[state][char] = len(goto) - 1
+            state = nxt
+        outputs[state].add(keyword)
+
+    fail = [0] * len(goto)
+    delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        # Failure state is shallower, so its transitions are already complete
+        delta[state] = {**delta[fail[state]], **goto[state]}
+        outputs[state] |= outputs[fail[state]]
+        for char, child in goto[state].items():
+            fail[child] = delta[fail[state]].get(char, 0)
+            queue.append(child)
+    return delta, [frozenset(found) if found else _NO_HITS for found in outputs]
+
+
+class KeywordMatcher:
+    """
+    Find every keyword contained in a text, in one pass for large sets.
+
+    Keywords are lowercased and deduplicated; ``find`` lowercases the text.
+    ``use_automaton`` forces (True) or disables (False) the automaton instead
+    of choosing by keyword count.
+    """
+
+    def __init__(self, keywords: Iterable[str], use_automaton: Optional[bool] = None):
+        self.keywords: Tuple[str, ...] = tuple(
+            dict.fromkeys(k.lower() for k in keywords if k)
+        )
+        if use_automaton is None:
+            use_automaton = len(self.keywords) >= AUTOMATON_MIN_KEYWORDS
+        self.use_automaton = use_automaton
+        if use_automaton:
+            self._delta, self._outputs = _compile(self.keywords)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """Keywords occurring anywhere in text."""
+        text = (text or "").lower()
+        if not self.use_automaton:
+            return frozenset(k for k in self.keywords if k in text)
+        delta, outputs = self._delta, self._outputs
+        state = 0
+        found = set()
+        for char in text:
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return frozenset(found)
@@ -5,9 +5,14 @@ JSON-based logging for observability and traceability
 
 import json
 import sys
+import threading
+from bisect import bisect_left
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+# Upper bounds (seconds) of the timing histogram buckets
+TIMING_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0)
 
 
 class StructuredLogger:
@@ -27,6 +32,7 @@ class StructuredLogger:
         
         self.run_id = run_id
         self.env = env
+        self._lock = threading.Lock()  # workers may log concurrently
         
         # Log file paths
         today = datetime.now().strftime("%Y%m%d")
@@ -44,6 +50,7 @@ class StructuredLogger:
             "skipped": 0,
             "errors": []
         }
+        self._timings: Dict[str, List[float]] = {}
     
     def _log(self, level: str, event: str, **kwargs):
         """Write structured log entry."""
@@ -57,8 +64,9 @@ class StructuredLogger:
         }
         
         # Write to file (JSON lines)
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+        with self._lock:
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
         
         # Also print to console (for interactive runs)
         if level in ["ERROR", "WARN"]:
@@ -66,6 +74,10 @@ class StructuredLogger:
         elif level == "INFO":
             print(f"[INFO] {event}")
     
+    def debug(self, event: str, **kwargs):
+        """Log DEBUG level event (log file only, never the console)."""
+        self._log("DEBUG", event, **kwargs)
+    
     def info(self, event: str, **kwargs):
         """Log INFO level event."""
         self._log("INFO", event, **kwargs)
@@ -77,11 +89,12 @@ class StructuredLogger:
     def error(self, event: str, **kwargs):
         """Log ERROR level event."""
         self._log("ERROR", event, **kwargs)
-        self.stats["errors"].append({
-            "ts": datetime.now().isoformat(),
-            "event": event,
-            **kwargs
-        })
+        with self._lock:
+            self.stats["errors"].append({
+                "ts": datetime.now().isoformat(),
+                "event": event,
+                **kwargs
+            })
     
     def record_processed(self):
         """Increment processed counter."""
@@ -103,6 +116,32 @@ class StructuredLogger:
         """Increment skipped counter."""
         self.stats["skipped"] += 1
     
+    def record_timing(self, name: str, seconds: float):
+        """Record one duration sample (e.g. per-page wait time)."""
+        with self._lock:
+            self._timings.setdefault(name, []).append(seconds)
+    
+    def timing_summary(self) -> Dict[str, Any]:
+        """Histogram and percentiles for each recorded timing."""
+        with self._lock:
+            timings = {name: sorted(values) for name, values in self._timings.items()}
+        
+        summary = {}
+        labels = [f"<={bound}s" for bound in TIMING_BUCKETS] + [f">{TIMING_BUCKETS[-1]}s"]
+        for name, values in timings.items():
+            counts = [0] * len(labels)
+            for value in values:
+                counts[bisect_left(TIMING_BUCKETS, value)] += 1
+            histogram = dict(zip(labels, counts))
+            summary[name] = {
+                "count": len(values),
+                "p50": round(values[len(values) // 2], 3),
+                "p95": round(values[min(len(values) - 1, int(len(values) * 0.95))], 3),
+                "max": round(values[-1], 3),
+                "histogram": histogram,
+            }
+        return summary
+    
     def finalize(self) -> Dict[str, Any]:
         """
         Finalize run and write report.
@@ -111,6 +150,8 @@ class StructuredLogger:
             Run statistics dict
         """
         self.stats["completed_at"] = datetime.now().isoformat()
+        if self._timings:
+            self.stats["timings"] = self.timing_summary()
         
         # Write run report
         with open(self.run_report_file, "w", encoding="utf-8") as f:
@@ -0,0 +1,186 @@
+"""
+Near-duplicate listing detection between the scrape and curate stages.
+
+The same room is often cross-posted on several sites with slightly
+different titles and snippets. Each row's organization + snippet is
+reduced to a MinHash signature over character shingles; locality-sensitive
+hashing (banding) proposes candidate pairs without comparing every pair,
+and candidates whose estimated Jaccard similarity reaches the threshold are
+merged into clusters. One representative per cluster goes on to curation,
+and the other members are recorded in the seen-set so they are not scraped
+again while the mark lasts. Each run clears the mark on every
+representative, so a member that becomes its cluster's best row (say,
+because the old representative lost its contacts) is fetched again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .seen_store import SeenStore
+from .urls import canonicalize_url
+
+_PRIME = np.uint64(4294967311)  # > 2**32, so (a * x + b) stays below 2**64
+_NON_WORD_RE = re.compile(r"[^a-z0-9$]+")
+
+
+def _normalize(text: str) -> str:
+    return _NON_WORD_RE.sub(" ", (text or "").lower()).strip()
+
+
+def lsh_params(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    (bands, rows) dividing num_perm with the highest S-curve midpoint
+    (1/bands)**(1/rows) not above threshold: pairs at the threshold almost
+    always become candidates, and verification filters the rest.
+    """
+    options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+    below = [br for br in options if (1 / br[0]) ** (1 / br[1]) <= threshold]
+    return max(below, key=lambda br: (1 / br[0]) ** (1 / br[1])) if below else options[-1]
+
+
+class MinHasher:
+    """MinHash signatures over character shingles, stable across runs."""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 5, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._a = rng.randint(1, 2**32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 2**32, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> set:
+        text = _normalize(text)
+        k = self.shingle_size
+        if len(text) <= k:
+            return {text} if text else set()
+        return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+    def signature(self, text: str) -> np.ndarray:
+        shingles = self.shingles(text)
+        if not shingles:
+            # Empty texts never collide with anything
+            return np.full(self.num_perm, _PRIME, dtype=np.uint64)
+        hashed = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        return ((np.outer(hashed, self._a) + self._b) % _PRIME).min(axis=0)
+
+
+def cluster_near_duplicates(
+    texts: Sequence[str],
+    threshold: float = 0.7,
+    num_perm: int = 64,
+    shingle_size: int = 5,
+) -> List[int]:
+    """
+    Cluster label per text: the index of the first text in its cluster.
+
+    Texts sharing any LSH band bucket are candidate pairs; a candidate pair is
+    merged when the fraction of equal signature slots (the MinHash estimate
+    of Jaccard similarity) is at least ``threshold``.
+    """
+    hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+    signatures = np.array([hasher.signature(t) for t in texts], dtype=np.uint64)
+    bands, rows = lsh_params(num_perm, threshold)
+    parent = list(range(len(texts)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    empty = np.all(signatures == _PRIME, axis=1) if len(texts) else np.array([], dtype=bool)
+    for band in range(bands):
+        buckets: Dict[bytes, List[int]] = defaultdict(list)
+        block = signatures[:, band * rows:(band + 1) * rows]
+        for index in np.flatnonzero(~empty):
+            buckets[block[index].tobytes()].append(int(index))
+        for members in buckets.values():
+            # Every pair in the bucket: a chance collision at members[0]
+            # must not hide a true duplicate pair behind it
+            for position, other in enumerate(members[1:], start=1):
+                for earlier in members[:position]:
+                    root_a, root_b = find(earlier), find(other)
+                    if root_a == root_b:
+                        continue
+                    similarity = np.mean(signatures[earlier] == signatures[other])
+                    if similarity >= threshold:
+                        # Lower index becomes the root, so labels follow input order
+                        parent[max(root_a, root_b)] = min(root_a, root_b)
+    return [find(i) for i in range(len(texts))]
+
+
+def _cluster_id(representative_url: str) -> str:
+    return hashlib.md5(representative_url.encode()).hexdigest()[:12]
+
+
+def dedupe_contacts(
+    input_csv: str | Path = "data/contacts_raw.csv",
+    out_csv: str | Path = "data/contacts_deduped.csv",
+    threshold: float = 0.7,
+    num_perm: int = 64,
+    seen_store: Optional[SeenStore] = None,
+) -> pd.DataFrame:
+    """
+    Write one representative per near-duplicate cluster.
+
+    The representative is the member with the most contact fields filled
+    (earliest row on ties). Output rows carry ``cluster_id`` and
+    ``cluster_size``; with a ``seen_store``, the other members' URLs are
+    marked as duplicates so later scrapes skip them, and the representatives'
+    URLs are unmarked.
+    """
+    input_path = Path(input_csv)
+    if not input_path.exists():
+        raise FileNotFoundError(f"{input_path} not found; run scraper first.")
+    df = pd.read_csv(input_path, dtype=str)
+    for column in ("organization", "snippet", "url", "emails", "phones"):
+        if column not in df.columns:
+            df[column] = ""
+    df = df.reset_index(drop=True)
+
+    text = df["organization"].fillna("") + " " + df["snippet"].fillna("")
+    df["cluster"] = cluster_near_duplicates(text.tolist(), threshold=threshold, num_perm=num_perm)
+    df["contact_fields"] = (
+        df["emails"].fillna("").str.strip().ne("").astype(int)
+        + df["phones"].fillna("").str.strip().ne("").astype(int)
+    )
+    ranked = df.sort_values(["cluster", "contact_fields"], ascending=[True, False], kind="mergesort")
+    representatives = ranked.groupby("cluster", sort=False).head(1)
+    rep_url = representatives.set_index("cluster")["url"].fillna("")
+    df["cluster_id"] = df["cluster"].map(rep_url).map(_cluster_id)
+    df["cluster_size"] = df.groupby("cluster")["cluster"].transform("size")
+
+    is_representative = df.index.isin(representatives.index)
+    if seen_store is not None:
+        kept = set()
+        for url in df.loc[is_representative, "url"]:
+            if isinstance(url, str) and url:
+                seen_store.clear_duplicate(url)
+                kept.add(canonicalize_url(url))
+        for url, cluster_id in df.loc[~is_representative, ["url", "cluster_id"]].itertuples(index=False):
+            if isinstance(url, str) and url and canonicalize_url(url) not in kept:
+                seen_store.mark_duplicate(url, cluster_id)
+
+    deduped = df[is_representative].drop(columns=["cluster", "contact_fields"])
+    out_path = Path(out_csv)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    deduped.to_csv(out_path, index=False)
+    clusters = int((deduped["cluster_size"] > 1).sum())
+    print(
+        f"[dedupe] {len(df)} rows -> {len(deduped)} listings "
+        f"({len(df) - len(deduped)} near-duplicates in {clusters} clusters); wrote {out_path}"
+    )
+    return deduped
@@ -0,0 +1,203 @@
+"""
+Compressed append-only archive of raw scraped responses.
+
+Every fetched body is appended to ``pages.jsonl.gz`` as its own gzip member
+holding one JSON record (URL, status, headers, decoded text). Concatenated
+members form a valid gzip stream, so ``zcat`` reads the whole archive, while
+a SQLite index maps each record to its byte offset and length for random
+access. A newer fetch of the same URL is simply appended and becomes the
+latest entry. ``prune`` enforces the optional age and size limits by
+rewriting the data file without the expired records.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from .fetcher import Page
+from .urls import canonicalize_url
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT,
+    canonical TEXT,
+    run_id TEXT,
+    fetched_at REAL,
+    status INTEGER,
+    content_type TEXT,
+    offset INTEGER,
+    length INTEGER
+)
+"""
+_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS records_canonical ON records (canonical)",
+    "CREATE INDEX IF NOT EXISTS records_run ON records (run_id)",
+)
+_COLUMNS = "url, canonical, run_id, fetched_at, status, content_type, offset, length"
+
+
+class PageArchive:
+    """gzip-framed JSONL page archive with a SQLite lookup index."""
+
+    def __init__(
+        self,
+        root: str | Path = "data/archive",
+        compresslevel: int = 6,
+        clock: Callable[[], float] = time.time,
+        max_age_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self.root = Path(root)
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.data_path = self.root / "pages.jsonl.gz"
+        self.compresslevel = compresslevel
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.root / "index.sqlite", check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        for statement in _INDEXES:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def append(self, page: Page, run_id: Optional[str] = None) -> int:
+        """Archive one fetched page; returns the byte offset of its record."""
+        fetched_at = self._clock()
+        record = {
+            "url": page.url,
+            "run_id": run_id,
+            "fetched_at": fetched_at,
+            "status": page.status_code,
+            "content_type": page.content_type,
+            "headers": dict(page.headers),
+            "truncated": page.truncated,
+            "text": page.text,
+        }
+        # Compress outside the lock; only the write and index insert serialize.
+        member = gzip.compress(
+            json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n",
+            compresslevel=self.compresslevel,
+        )
+        with self._lock:
+            with self.data_path.open("ab") as handle:
+                offset = handle.seek(0, 2)
+                handle.write(member)
+            self._conn.execute(
+                f"INSERT INTO records ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    page.url,
+                    canonicalize_url(page.url),
+                    run_id,
+                    fetched_at,
+                    page.status_code,
+                    page.content_type,
+                    offset,
+                    len(member),
+                ),
+            )
+            self._conn.commit()
+        return offset
+
+    def read_at(self, offset: int, length: int) -> dict:
+        with self.data_path.open("rb") as handle:
+            handle.seek(offset)
+            return json.loads(gzip.decompress(handle.read(length)))
+
+    def lookup(self, url: str) -> Optional[dict]:
+        """Latest archived record for url (any variant of its canonical form)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT offset, length FROM records WHERE canonical=? "
+                "ORDER BY id DESC LIMIT 1",
+                (canonicalize_url(url),),
+            ).fetchone()
+        return self.read_at(*row) if row else None
+
+    def records(self, run_id: Optional[str] = None) -> Iterator[dict]:
+        """
+        Yield the latest record per canonical URL in archive order,
+        restricted to one run when ``run_id`` is given.
+        """
+        where, params = ("WHERE run_id=?", (run_id,)) if run_id else ("", ())
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT offset, length FROM records WHERE id IN "
+                f"(SELECT MAX(id) FROM records {where} GROUP BY canonical) "
+                f"ORDER BY id",
+                params,
+            ).fetchall()
+        if not rows:
+            return
+        with self.data_path.open("rb") as handle:
+            for offset, length in rows:
+                handle.seek(offset)
+                yield json.loads(gzip.decompress(handle.read(length)))
+
+    def count(self, run_id: Optional[str] = None) -> int:
+        where, params = ("WHERE run_id=?", (run_id,)) if run_id else ("", ())
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM records {where}", params
+            ).fetchone()[0]
+
+    def size(self) -> int:
+        """Compressed bytes held by indexed records."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(length), 0) FROM records").fetchone()[0]
+
+    def prune(self) -> int:
+        """
+        Drop records older than ``max_age_seconds``, then the oldest records
+        until the archive fits in ``max_bytes``. Returns the number dropped;
+        the data file is only rewritten when something is dropped.
+        """
+        with self._lock:
+            expired = set()
+            if self.max_age_seconds is not None:
+                cutoff = self._clock() - self.max_age_seconds
+                expired.update(
+                    row[0]
+                    for row in self._conn.execute(
+                        "SELECT id FROM records WHERE fetched_at < ?", (cutoff,)
+                    )
+                )
+            rows = self._conn.execute("SELECT id, offset, length FROM records ORDER BY id").fetchall()
+            if self.max_bytes is not None:
+                total = sum(length for record_id, _offset, length in rows if record_id not in expired)
+                for record_id, _offset, length in rows:
+                    if total <= self.max_bytes:
+                        break
+                    if record_id not in expired:
+                        expired.add(record_id)
+                        total -= length
+            if not expired:
+                return 0
+
+            temp_path = self.data_path.with_suffix(".gz.tmp")
+            moved = []
+            with self.data_path.open("rb") as source, temp_path.open("wb") as target:
+                for record_id, offset, length in rows:
+                    if record_id in expired:
+                        continue
+                    source.seek(offset)
+                    moved.append((target.tell(), record_id))
+                    target.write(source.read(length))
+            self._conn.executemany(
+                "DELETE FROM records WHERE id=?", [(record_id,) for record_id in expired]
+            )
+            self._conn.executemany("UPDATE records SET offset=? WHERE id=?", moved)
+            temp_path.replace(self.data_path)
+            self._conn.commit()
+            return len(expired)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,142 @@
+"""
+Conditional-request content store for scraped pages.
+
+Each canonical URL keeps its ETag/Last-Modified validators, a hash of the
+last body seen and the contacts extracted from it. Re-fetches send
+If-None-Match/If-Modified-Since; a 304 (or an identical body) reuses the
+stored extraction instead of parsing the page again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .urls import canonicalize_url
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body_hash TEXT,
+    emails TEXT,
+    phones TEXT,
+    fetched_at REAL
+)
+"""
+
+
+def body_hash(content: bytes) -> str:
+    return hashlib.sha256(content or b"").hexdigest()
+
+
+class PageCache:
+    """
+    SQLite-backed page store with hit/revalidated/miss counters.
+
+    ``hit``         - entry younger than ``max_age_seconds``; no request sent
+    ``revalidated`` - server answered 304, or the body hash was unchanged
+    ``miss``        - new or changed page that had to be parsed
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = "data/cache/pages.sqlite",
+        max_age_seconds: float = 0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age_seconds = max_age_seconds
+        self.stats: Counter = Counter(hit=0, revalidated=0, miss=0)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def lookup(self, url: str) -> Optional[Dict[str, object]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body_hash, emails, phones, fetched_at "
+                "FROM pages WHERE url=?",
+                (canonicalize_url(url),),
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, digest, emails, phones, fetched_at = row
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_hash": digest,
+            "emails": [e for e in (emails or "").split(";") if e],
+            "phones": [p for p in (phones or "").split(";") if p],
+            "fetched_at": fetched_at or 0.0,
+        }
+
+    def is_fresh(self, entry: Dict[str, object]) -> bool:
+        return self._clock() - float(entry["fetched_at"]) < self.max_age_seconds
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, object]]) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = str(entry["etag"])
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = str(entry["last_modified"])
+        return headers
+
+    def store(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        digest: str,
+        contacts: Tuple[List[str], List[str]],
+    ) -> None:
+        emails, phones = contacts
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(url, etag, last_modified, body_hash, emails, phones, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    canonicalize_url(url),
+                    etag,
+                    last_modified,
+                    digest,
+                    ";".join(emails),
+                    ";".join(phones),
+                    self._clock(),
+                ),
+            )
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark a revalidated entry as fetched now."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pages SET fetched_at=? WHERE url=?",
+                (self._clock(), canonicalize_url(url)),
+            )
+            self._conn.commit()
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def summary(self) -> str:
+        return (
+            f"{self.stats['hit']} hit, {self.stats['revalidated']} revalidated, "
+            f"{self.stats['miss']} miss"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
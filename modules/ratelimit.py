@@ -0,0 +1,128 @@
+"""
+Rate limiting primitives shared by the search and scrape stages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """
+    Token bucket that refills at ``rate`` tokens per second up to ``capacity``.
+
+    Callers reserve a token and wait out any deficit, so concurrent callers
+    queue fairly instead of all waking up at once. Works from threads and
+    from asyncio tasks alike.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Await until a token is available without blocking the event loop."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class HostScheduler:
+    """
+    Per-host politeness scheduler.
+
+    Each host gets its own timeline: a request may start no sooner than
+    ``min_interval`` (plus up to ``jitter`` random seconds) after the previous
+    request to the same host was scheduled. Requests to different hosts never
+    wait on each other, so idle time on one site is spent on another.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        jitter: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        self.min_interval = max(0.0, float(min_interval))
+        self.jitter = max(0.0, float(jitter))
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, host: str) -> float:
+        """Book the next slot for host and return how long to wait for it."""
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot.get(host, now))
+            spacing = self.min_interval
+            if self.jitter:
+                spacing += self._rng.uniform(0.0, self.jitter)
+            self._next_slot[host] = slot + spacing
+            return slot - now
+
+    def wait(self, host: str) -> float:
+        """Block until host's next slot; returns the seconds waited."""
+        delay = self.reserve(host)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    @staticmethod
+    def interleave(items: Iterable[T], key: Callable[[T], str]) -> List[T]:
+        """
+        Reorder items round-robin across hosts (keeping each host's own order),
+        so consecutive work targets different sites.
+        """
+        queues: Dict[str, Deque[T]] = {}
+        for item in items:
+            queues.setdefault(key(item), deque()).append(item)
+        ordered: List[T] = []
+        while queues:
+            for host in list(queues):
+                ordered.append(queues[host].popleft())
+                if not queues[host]:
+                    del queues[host]
+        return ordered
@@ -0,0 +1,148 @@
+"""
+Persistent cache of curator scores.
+
+Entries are keyed by (row hash, profile fingerprint): a raw contact whose
+scoring inputs are unchanged is not rescored while the profile stays the
+same, and editing the profile invalidates every entry for it at once.
+
+The cache only saves the scoring itself. A cached rerun still reads and
+hashes every input row, so it stays O(rows); it is faster than rescoring,
+not constant time. To keep the store the size of the current input,
+``use_profile`` drops the entries of a profile's superseded fingerprints
+and ``prune`` drops rows that were not looked up since the last prune.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Set
+
+import pandas as pd
+
+SCORE_COLUMNS = ["keyword_score", "price", "budget_score", "contact_score"]
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS scores (
+    row_hash INTEGER,
+    profile TEXT,
+    {", ".join(f"{column} REAL" for column in SCORE_COLUMNS)},
+    PRIMARY KEY (profile, row_hash)
+)
+"""
+_PROFILES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    name TEXT PRIMARY KEY,
+    fingerprint TEXT
+)
+"""
+_BATCH = 500
+# Past this many keys one scan of the profile beats batched IN lookups
+_SCAN_ABOVE = 20 * _BATCH
+
+
+class ScoreCache:
+    """SQLite score store; ``stats`` counts ``hits`` and ``misses`` per row."""
+
+    def __init__(self, db_path: str | Path = "data/cache/curator_scores.sqlite"):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.stats: Counter = Counter(hits=0, misses=0)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(_PROFILES_SCHEMA)
+        self._conn.commit()
+        self._touched: Dict[str, Set[int]] = {}
+
+    def use_profile(self, name: str, fingerprint: str) -> int:
+        """
+        Record ``fingerprint`` as the current version of profile ``name`` and
+        delete the entries of the version it replaces; returns rows deleted.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint FROM profiles WHERE name=?", (name,)
+            ).fetchone()
+            deleted = 0
+            if row and row[0] != fingerprint:
+                deleted = self._conn.execute(
+                    "DELETE FROM scores WHERE profile=?", (row[0],)
+                ).rowcount
+            self._conn.execute(
+                "INSERT OR REPLACE INTO profiles (name, fingerprint) VALUES (?, ?)",
+                (name, fingerprint),
+            )
+            self._conn.commit()
+        return deleted
+
+    def lookup(self, profile: str, row_hashes: Sequence[int]) -> pd.DataFrame:
+        """
+        Cached score columns indexed by row hash (may include other rows of
+        the profile when many keys are requested).
+        """
+        unique = list(dict.fromkeys(int(h) for h in row_hashes))
+        select = f"SELECT row_hash, {', '.join(SCORE_COLUMNS)} FROM scores WHERE profile=?"
+        found: List[tuple] = []
+        with self._lock:
+            self._touched.setdefault(profile, set()).update(unique)
+            if len(unique) > _SCAN_ABOVE:
+                found = self._conn.execute(select, (profile,)).fetchall()
+            else:
+                for start in range(0, len(unique), _BATCH):
+                    batch = unique[start:start + _BATCH]
+                    found += self._conn.execute(
+                        f"{select} AND row_hash IN ({','.join('?' * len(batch))})",
+                        [profile, *batch],
+                    ).fetchall()
+        # An explicit index: set_index can infer a RangeIndex from two keys,
+        # and their int64 difference overflows when the hashes are far apart
+        index = pd.Index([row[0] for row in found], dtype="int64", name="row_hash")
+        return pd.DataFrame(
+            [row[1:] for row in found], columns=SCORE_COLUMNS, index=index, dtype=float
+        )
+
+    def store(self, profile: str, row_hashes: Iterable[int], scores: pd.DataFrame) -> None:
+        """Save score columns for freshly scored rows (aligned with row_hashes)."""
+        values = scores[SCORE_COLUMNS].astype(float)
+        rows = [
+            (int(row_hash), profile, *(None if pd.isna(v) else v for v in scored))
+            for row_hash, scored in zip(row_hashes, values.itertuples(index=False))
+        ]
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO scores (row_hash, profile, {', '.join(SCORE_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(SCORE_COLUMNS) + 2))})",
+                rows,
+            )
+            self._conn.commit()
+
+    def prune(self, profile: str) -> int:
+        """
+        Delete the profile's rows that were not looked up since the last
+        prune (rows gone from the input); returns rows deleted.
+        """
+        with self._lock:
+            touched = self._touched.pop(profile, set())
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS touched (row_hash INTEGER PRIMARY KEY)")
+            self._conn.execute("DELETE FROM touched")
+            self._conn.executemany("INSERT INTO touched VALUES (?)", ((h,) for h in touched))
+            deleted = self._conn.execute(
+                "DELETE FROM scores WHERE profile=? "
+                "AND row_hash NOT IN (SELECT row_hash FROM touched)",
+                (profile,),
+            ).rowcount
+            self._conn.execute("DELETE FROM touched")
+            self._conn.commit()
+        return deleted
+
+    def count(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self.stats["hits"] += hits
+            self.stats["misses"] += misses
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -5,47 +5,313 @@ Scraper utilities to fetch result links and extract basic contact info.
 from __future__ import annotations
 
 import csv
+import itertools
 import json
+import queue
 import re
+import threading
+from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
 
-import requests
 from bs4 import BeautifulSoup
 
+from .fetcher import (  # noqa: F401 - USER_AGENT kept importable here
+    DEFAULT_MAX_BYTES,
+    USER_AGENT,
+    Fetcher,
+    PageSkipped,
+)
+from .email_decoders import (  # noqa: F401 - decoder registry re-exported
+    EMAIL_DECODERS,
+    decode_obfuscated,
+    email_decoder,
+)
+from .journal import Journal, new_run_id
+from .page_archive import PageArchive
+from .page_cache import PageCache, body_hash
+from .ratelimit import HostScheduler
+from .seen_store import SeenStore
+from .urls import canonicalize_url, host_of
+
 EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 PHONE_RE = re.compile(r"\(?\d{3}\)?[-.\s]\d{3}[-.\s]\d{4}")
-USER_AGENT = (
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-    "AppleWebKit/537.36 (KHTML, like Gecko) "
-    "Chrome/121.0 Safari/537.36"
-)
+FIELDNAMES = ["organization", "url", "emails", "phones", "snippet"]
+NO_REPLY_PREFIXES = ("no-reply", "noreply", "donotreply")
+# Markers that mean a DOM parse can find addresses the plain regex cannot.
+# Obfuscated forms (Cloudflare, entities, [at]/[dot], JS) are recovered from
+# the raw text by the decoder chain in modules.email_decoders instead.
+PARSE_MARKERS_RE = re.compile(r"mailto:", re.IGNORECASE)
+
+Contacts = Tuple[List[str], List[str]]
+T = TypeVar("T")
+
+# Which extraction tier handled each page: "regex" (scan only) or "parse";
+# plus "decoded_<name>" per decoder and "escalations_avoided" (pages whose
+# only contacts came from the decoders, which would otherwise go to Selenium).
+EXTRACT_STATS: Counter = Counter(regex=0, parse=0)
+_extract_stats_lock = threading.Lock()
+
+_default_fetcher: Optional[Fetcher] = None
+_default_fetcher_lock = threading.Lock()
+
+
+def _shared_fetcher() -> Fetcher:
+    """Process-wide Fetcher so ad-hoc calls still reuse pooled connections."""
+    global _default_fetcher
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            _default_fetcher = Fetcher()
+        return _default_fetcher
+
+
+@dataclass
+class _Fetched:
+    """
+    Network-stage result: contacts when known, otherwise a body to parse.
+    ``ok`` is False when the page could not be fetched (error or skip).
+    """
+
+    url: str
+    contacts: Optional[Contacts] = None
+    text: str = ""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    digest: Optional[str] = None
+    ok: bool = True
 
 
-def page_emails_phones(url: str, timeout: int = 12) -> Tuple[List[str], List[str]]:
-    """Fetch a single page and return discovered email + phone lists."""
+def _fetch_stage(
+    url: str,
+    fetcher: Fetcher,
+    page_cache: Optional[PageCache],
+    timeout: int = 12,
+    archive: Optional[PageArchive] = None,
+    run_id: Optional[str] = None,
+) -> _Fetched:
+    """Fetch url (conditionally, with a cache) without parsing the body."""
+    cached = page_cache.lookup(url) if page_cache else None
+    if cached and page_cache.is_fresh(cached):
+        page_cache.record("hit")
+        return _Fetched(url, contacts=(cached["emails"], cached["phones"]))
+
     try:
-        resp = requests.get(url, timeout=timeout, headers={"User-Agent": USER_AGENT})
-        resp.raise_for_status()
+        page = fetcher.fetch_page(
+            url, timeout=timeout, headers=PageCache.conditional_headers(cached)
+        )
+    except PageSkipped as exc:
+        print(f"[scraper] skipped {url}: {exc}")
+        return _Fetched(url, contacts=([], []), ok=False)
     except Exception as exc:  # noqa: BLE001 - stage should continue
         print(f"[scraper] fetch failed for {url}: {exc}")
-        return [], []
+        return _Fetched(url, contacts=([], []), ok=False)
+
+    if archive is not None and page.status_code != 304:
+        try:
+            archive.append(page, run_id)
+        except OSError as exc:
+            print(f"[scraper] archive write failed for {url}: {exc}")
+    if page_cache is None:
+        return _Fetched(url, text=page.text)
+
+    etag = page.headers.get("ETag")
+    last_modified = page.headers.get("Last-Modified")
+    if cached and page.status_code == 304:
+        page_cache.touch(url)
+        page_cache.record("revalidated")
+        return _Fetched(url, contacts=(cached["emails"], cached["phones"]))
+
+    digest = body_hash(page.content)
+    if cached and cached["body_hash"] == digest:
+        contacts = (cached["emails"], cached["phones"])
+        page_cache.record("revalidated")
+        page_cache.store(url, etag, last_modified, digest, contacts)
+        return _Fetched(url, contacts=contacts)
+    return _Fetched(url, text=page.text, etag=etag, last_modified=last_modified, digest=digest)
+
+
+def _finish(fetched: _Fetched, contacts: Contacts, page_cache: Optional[PageCache]) -> Contacts:
+    """Record freshly parsed contacts in the page cache."""
+    if page_cache is not None:
+        page_cache.record("miss")
+        page_cache.store(
+            fetched.url, fetched.etag, fetched.last_modified, fetched.digest, contacts
+        )
+    fetched.contacts = contacts
+    fetched.text = ""
+    return contacts
+
+
+def page_emails_phones(
+    url: str,
+    timeout: int = 12,
+    fetcher: Optional[Fetcher] = None,
+    page_cache: Optional[PageCache] = None,
+    archive: Optional[PageArchive] = None,
+) -> Tuple[List[str], List[str]]:
+    """
+    Fetch a single page and return discovered email + phone lists.
+
+    With a ``page_cache`` the request is conditional, and unchanged pages
+    reuse the stored extraction instead of being parsed again. Downloaded
+    bodies are appended to ``archive`` when one is given.
+    """
+    fetched = _fetch_stage(
+        url, fetcher or _shared_fetcher(), page_cache, timeout, archive=archive
+    )
+    if fetched.contacts is not None:
+        return fetched.contacts
+    return _finish(fetched, extract_contacts(fetched.text), page_cache)
+
 
-    text = resp.text
+class _Extraction(NamedTuple):
+    emails: List[str]
+    phones: List[str]
+    tier: str
+    decoded_by: Tuple[str, ...] = ()
+    escalation_avoided: bool = False
+
+
+def _extract(text: str, always_parse: bool = False) -> _Extraction:
+    """Extraction worker for one body. Safe to run in a subprocess."""
     emails = {
         email
         for email in EMAIL_RE.findall(text)
-        if not email.lower().startswith(("no-reply", "noreply", "donotreply"))
+        if not email.lower().startswith(NO_REPLY_PREFIXES)
     }
     phones = set(PHONE_RE.findall(text))
 
-    # Attempt to grab contact info from anchor tags for extra context.
-    soup = BeautifulSoup(text, "lxml")
-    for anchor in soup.select("a[href^='mailto:']"):
-        mail = anchor.get("href", "").replace("mailto:", "").strip()
-        if mail and not mail.lower().startswith(("no-reply", "noreply", "donotreply")):
-            emails.add(mail)
-    return sorted(emails), sorted(phones)
+    tier = "parse" if always_parse or PARSE_MARKERS_RE.search(text) else "regex"
+    if tier == "parse":
+        # Attempt to grab contact info from anchor tags for extra context.
+        soup = BeautifulSoup(text, "lxml")
+        for anchor in soup.select("a[href^='mailto:']"):
+            mail = anchor.get("href", "").replace("mailto:", "").strip()
+            if mail and not mail.lower().startswith(NO_REPLY_PREFIXES):
+                emails.add(mail)
+
+    decoded: Dict[str, str] = {}
+    for name, address in decode_obfuscated(text, EMAIL_RE):
+        if address not in emails and not address.lower().startswith(NO_REPLY_PREFIXES):
+            decoded.setdefault(address, name)
+    avoided = bool(decoded) and not emails and not phones
+    emails.update(decoded)
+    return _Extraction(
+        sorted(emails), sorted(phones), tier, tuple(sorted(set(decoded.values()))), avoided
+    )
+
+
+def _extract_many(texts: Sequence[str]) -> List[_Extraction]:
+    """One process-pool task: extract a chunk of bodies."""
+    return [_extract(text) for text in texts]
+
+
+def _record(extraction: _Extraction) -> None:
+    with _extract_stats_lock:
+        EXTRACT_STATS[extraction.tier] += 1
+        for name in extraction.decoded_by:
+            EXTRACT_STATS[f"decoded_{name}"] += 1
+        if extraction.escalation_avoided:
+            EXTRACT_STATS["escalations_avoided"] += 1
+
+
+def extract_contacts(text: str, always_parse: bool = False) -> Contacts:
+    """
+    Return sorted email + phone lists discovered in an HTML/text body.
+
+    The regexes run over the raw text first; the lxml tree is only built when
+    the page contains mailto links (or ``always_parse``). Obfuscated addresses
+    are recovered by the decoder chain (see ``email_decoder``).
+    """
+    extraction = _extract(text, always_parse)
+    _record(extraction)
+    return extraction.emails, extraction.phones
+
+
+def parse_bodies(
+    texts: Sequence[str],
+    pool: Optional[Executor] = None,
+    chunksize: int = 4,
+) -> List[Contacts]:
+    """
+    Extract contacts from many bodies, in order.
+
+    With a ``ProcessPoolExecutor`` the CPU-bound parsing is spread over the
+    pool's processes, shipping ``chunksize`` bodies per task; without one it
+    runs inline. Returns once every body is parsed, so callers that are
+    still downloading should feed the pool incrementally (as
+    ``scrape_results`` does) rather than alternate batches with this.
+    """
+    if pool is None:
+        return [extract_contacts(text) for text in texts]
+    results: List[Contacts] = []
+    for extraction in pool.map(_extract, texts, chunksize=max(1, chunksize)):
+        _record(extraction)
+        results.append((extraction.emails, extraction.phones))
+    return results
+
+
+def extractor_tier_stats() -> Dict[str, float]:
+    """Counts and hit rates for each extraction tier since process start."""
+    with _extract_stats_lock:
+        counts = {tier: EXTRACT_STATS[tier] for tier in ("regex", "parse")}
+    total = sum(counts.values())
+    stats: Dict[str, float] = {"pages": total}
+    for tier, count in counts.items():
+        stats[tier] = count
+        stats[f"{tier}_rate"] = round(count / total, 3) if total else 0.0
+    return stats
+
+
+def decoder_stats() -> Dict[str, int]:
+    """Pages each obfuscation decoder added addresses to, and Selenium escalations avoided."""
+    with _extract_stats_lock:
+        stats = {
+            decoder.name: EXTRACT_STATS[f"decoded_{decoder.name}"]
+            for decoder in EMAIL_DECODERS
+        }
+        stats["escalations_avoided"] = EXTRACT_STATS["escalations_avoided"]
+    return stats
+
+
+def _report_tiers() -> None:
+    stats = extractor_tier_stats()
+    if stats["pages"]:
+        print(
+            f"[scraper] extractor tiers: regex-only {stats['regex']} "
+            f"({stats['regex_rate']:.0%}), full parse {stats['parse']} "
+            f"({stats['parse_rate']:.0%})"
+        )
+    decoders = decoder_stats()
+    avoided = decoders.pop("escalations_avoided")
+    if any(decoders.values()):
+        hits = ", ".join(f"{name} {count}" for name, count in decoders.items() if count)
+        print(
+            f"[scraper] obfuscated emails decoded: {hits}; "
+            f"Selenium escalations avoided: {avoided}"
+        )
+
+
+def _write_run_report(path: Path, report: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    skipped = {k: v for k, v in report["fetch"].items() if k.startswith("skipped_")}
+    if skipped or report["fetch"].get("truncated"):
+        print(
+            f"[scraper] skipped: {skipped or 'none'}; "
+            f"truncated at byte cap: {report['fetch'].get('truncated', 0)}"
+        )
+    print(f"[scraper] run report: {path}")
 
 
 def _load_search_results(source: Iterable | str | Path) -> Iterable[dict]:
@@ -56,38 +322,425 @@ def _load_search_results(source: Iterable | str | Path) -> Iterable[dict]:
         return json.load(handle)
 
 
+def _row_for(
+    entry: dict,
+    fetcher: Optional[Fetcher] = None,
+    page_cache: Optional[PageCache] = None,
+    archive: Optional[PageArchive] = None,
+) -> Optional[dict]:
+    url = entry.get("link") or entry.get("url")
+    if not url:
+        return None
+    contacts = page_emails_phones(
+        url, fetcher=fetcher, page_cache=page_cache, archive=archive
+    )
+    return _make_row(entry, url, contacts)
+
+
+def _make_row(entry: dict, url: str, contacts: Contacts) -> dict:
+    emails, phones = contacts
+    return {
+        "organization": entry.get("title", ""),
+        "url": url,
+        "emails": ";".join(emails),
+        "phones": ";".join(phones),
+        "snippet": entry.get("snippet", ""),
+    }
+
+
+def _pipeline(
+    items: Sequence[T],
+    network: Callable[[T], Optional[Tuple[dict, dict, _Fetched]]],
+    parsed: Callable[[Tuple[dict, dict, _Fetched], _Extraction], None],
+    io_workers: int,
+    pool: Executor,
+    window: int,
+    chunksize: int = 4,
+) -> None:
+    """
+    Producer/consumer fetch and parse: network(item) runs on ``io_workers``
+    threads, and the bodies it returns go to ``pool`` as soon as
+    ``chunksize`` have arrived (or no fetch is left to wait for), while
+    other downloads continue. Results are handled on the calling thread as
+    they complete; ``window`` bounds pages fetched or awaiting parse at once.
+    """
+    remaining = iter(items)
+    window = max(window, io_workers, 1)
+    # Fetch futures map to None, parse futures to the pages they parse
+    inflight: Dict[Future, Optional[List[Tuple[dict, dict, _Fetched]]]] = {}
+    bodies: List[Tuple[dict, dict, _Fetched]] = []
+    with ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="fetch") as io:
+
+        def _refill() -> None:
+            room = window - len(bodies) - sum(len(v or [None]) for v in inflight.values())
+            for item in itertools.islice(remaining, max(0, room)):
+                inflight[io.submit(network, item)] = None
+
+        def _submit_parse() -> None:
+            texts = [fetched.text for _record, _entry, fetched in bodies]
+            inflight[pool.submit(_extract_many, texts)] = list(bodies)
+            bodies.clear()
+
+        _refill()
+        while inflight:
+            done, _pending = wait(inflight, return_when=FIRST_COMPLETED)
+            for future in done:
+                staged = inflight.pop(future)
+                result = future.result()
+                if staged is not None:
+                    for page, extraction in zip(staged, result):
+                        parsed(page, extraction)
+                elif result is not None:
+                    bodies.append(result)
+            fetching = any(v is None for v in inflight.values())
+            if len(bodies) >= max(1, chunksize) or (bodies and not fetching):
+                _submit_parse()
+            _refill()
+
+
+def journal_path_for(out_csv: str | Path) -> Path:
+    """Default progress journal location for a contacts CSV."""
+    out_path = Path(out_csv)
+    return out_path.with_name(f"{out_path.stem}.journal.jsonl")
+
+
+def _write_csv_from_journal(journal: Journal, run_id: str, out_path: Path) -> int:
+    """Rebuild the CSV for one run in input order, reading rows back one at a time."""
+    offsets = journal.offsets_by("index", run_id)
+    temp_path = out_path.with_suffix(".csv.tmp")
+    written = 0
+    with temp_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        for index in sorted(offsets):
+            row = journal.read_at(offsets[index]).get("row")
+            if row:
+                writer.writerow(row)
+                written += 1
+    temp_path.replace(out_path)
+    return written
+
+
 def scrape_results(
     search_results_path_or_list,
     out_csv: str | Path = "data/contacts_raw.csv",
+    workers: int = 8,
+    per_host: int = 2,
+    page_cache: Optional[PageCache] = None,
+    run_id: Optional[str] = None,
+    resume: bool = False,
+    journal_path: Optional[str | Path] = None,
+    return_rows: bool = True,
+    seen_store: Optional[SeenStore] = None,
+    scheduler: Optional[HostScheduler] = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    report_dir: Optional[str | Path] = None,
+    parse_workers: int = 0,
+    parse_batch: int = 64,
+    parse_chunksize: int = 4,
+    archive: Optional[PageArchive] = None,
+    journal_keep_runs: int = 3,
 ) -> List[dict]:
-    """Read search results, fetch each page, and write a CSV for curation."""
+    """
+    Read search results, fetch each page, and write a CSV for curation.
+
+    Pages are fetched concurrently (``workers`` overall, ``per_host`` per
+    site) over one keep-alive session; rows keep the input order. Pass a
+    ``page_cache`` to revalidate previously scraped pages instead of
+    re-downloading and re-parsing them.
+
+    Each finished row is appended to a JSONL journal (next to ``out_csv`` by
+    default) and the CSV is rebuilt from it at the end. With ``resume=True``
+    URLs already journaled for ``run_id`` (default: the latest run) are
+    skipped. Set ``return_rows=False`` to avoid loading the rows into memory.
+    After the CSV is written the journal is compacted to the last
+    ``journal_keep_runs`` runs (0 keeps everything).
+
+    URL variants that canonicalize to the same page are fetched once. With a
+    ``seen_store``, pages fetched within its revisit age are not fetched
+    again; their most recent journaled row is carried into this run instead
+    (pages with no journaled row are fetched). Only successful fetches are
+    recorded in the store.
+    A ``scheduler`` spaces requests per host; work is interleaved across
+    hosts so that spacing rarely leaves the pool idle.
+
+    Non-text responses are skipped before download and bodies are capped at
+    ``max_bytes``. With a ``report_dir``, skip reasons and the other stage
+    counters are written to ``<report_dir>/scrape_report_<run_id>.json``.
+
+    With ``parse_workers > 0`` the stage is split in two: each body a fetch
+    thread downloads is handed straight to a process pool for parsing, so
+    extraction is not serialized by the GIL and overlaps the downloads still
+    in flight (``parse_chunksize`` bodies per task). At most ``parse_batch``
+    pages are being fetched or waiting to be parsed at once.
+
+    Every downloaded body is appended to ``archive`` (tagged with the run
+    ID) so extraction can later be re-run offline with ``rescrape_archive``.
+    """
     results = list(_load_search_results(search_results_path_or_list))
     out_path = Path(out_csv)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    rows: List[dict] = []
+    journal = Journal(journal_path or journal_path_for(out_path))
+
+    if resume and run_id is None:
+        run_id = journal.latest_run_id()
+    run_id = run_id or new_run_id()
+    done = set(journal.offsets_by("url", run_id)) if resume else set()
+    if done:
+        print(f"[scraper] resuming run {run_id}: {len(done)} URLs already done")
 
-    for entry in results:
+    pending: List[Tuple[int, dict, str]] = []
+    canonical_keys = set()
+    duplicates = 0
+    for index, entry in enumerate(results):
         url = entry.get("link") or entry.get("url")
-        title = entry.get("title", "")
-        snippet = entry.get("snippet", "")
         if not url:
             continue
-        emails, phones = page_emails_phones(url)
-        rows.append(
+        key = canonicalize_url(url)
+        if key in canonical_keys:
+            duplicates += 1
+            continue
+        canonical_keys.add(key)
+        if url not in done:
+            pending.append((index, entry, key))
+    previous = journal.offsets_by("canonical", None) if seen_store else {}
+    if scheduler is not None:
+        pending = HostScheduler.interleave(pending, key=lambda item: host_of(item[2]))
+
+    pool = ProcessPoolExecutor(max_workers=parse_workers) if parse_workers > 0 else None
+
+    with Fetcher(
+        max_workers=workers, per_host=per_host, scheduler=scheduler, max_bytes=max_bytes
+    ) as fetcher:
+
+        def _network(item: Tuple[int, dict, str]) -> Optional[Tuple[dict, dict, _Fetched]]:
+            """Fetch one page; journal it unless its body still needs parsing."""
+            index, entry, key = item
+            url = entry.get("link") or entry.get("url")
+            record = {"run_id": run_id, "index": index, "url": url, "canonical": key}
+            # A seen page is only skipped when its earlier row can be carried over
+            offset = previous.get(key)
+            carried = journal.read_at(offset).get("row") if offset is not None else None
+            if carried and not seen_store.should_fetch(url):
+                record["row"] = carried
+                record["carried"] = True
+                journal.append(record)
+                return None
+
+            fetched = _fetch_stage(url, fetcher, page_cache, archive=archive, run_id=run_id)
+            if seen_store is not None and fetched.ok:
+                # Failures stay unmarked so the next run retries them
+                seen_store.mark(url)
+            if fetched.contacts is None and pool is None:
+                _finish(fetched, extract_contacts(fetched.text), page_cache)
+            if fetched.contacts is None:
+                return record, entry, fetched
+            record["row"] = _make_row(entry, url, fetched.contacts)
+            journal.append(record)
+            return None
+
+        def _parsed(staged: Tuple[dict, dict, _Fetched], extraction: _Extraction) -> None:
+            record, entry, fetched = staged
+            _record(extraction)
+            contacts = _finish(fetched, (extraction.emails, extraction.phones), page_cache)
+            record["row"] = _make_row(entry, fetched.url, contacts)
+            journal.append(record)
+
+        try:
+            if pool is None:
+                fetcher.map(_network, pending)
+            else:
+                _pipeline(
+                    pending, _network, _parsed, fetcher.max_workers, pool, parse_batch,
+                    chunksize=parse_chunksize,
+                )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    written = _write_csv_from_journal(journal, run_id, out_path)
+    print(f"[scraper] wrote {written} rows to {out_path} (run {run_id})")
+    if journal_keep_runs > 0:
+        dropped = journal.compact(journal_keep_runs)
+        if dropped:
+            print(f"[scraper] compacted journal: dropped {dropped} records from older runs")
+    saved = duplicates + (seen_store.stats["saved"] if seen_store else 0)
+    near = seen_store.stats["near_duplicates"] if seen_store else 0
+    if saved:
+        print(
+            f"[scraper] saved {saved} fetches: {duplicates} duplicate URL variants, "
+            f"{near} known near-duplicate listings, {saved - duplicates - near} scraped recently"
+        )
+    _report_tiers()
+    if page_cache is not None:
+        print(f"[scraper] page cache: {page_cache.summary()}")
+    if report_dir is not None:
+        _write_run_report(
+            Path(report_dir) / f"scrape_report_{run_id}.json",
             {
-                "organization": title,
-                "url": url,
-                "emails": ";".join(emails),
-                "phones": ";".join(phones),
-                "snippet": snippet,
-            }
+                "run_id": run_id,
+                "rows_written": written,
+                "duplicates_skipped": duplicates,
+                "seen_set": dict(seen_store.stats) if seen_store else None,
+                "fetch": dict(fetcher.stats),
+                "extractor_tiers": extractor_tier_stats(),
+                "decoders": decoder_stats(),
+                "page_cache": dict(page_cache.stats) if page_cache else None,
+                "archived": archive.count(run_id) if archive else None,
+            },
         )
+    if not return_rows:
+        return []
+    with out_path.open("r", newline="", encoding="utf-8") as handle:
+        return list(csv.DictReader(handle))
+
+
+def rescrape_archive(
+    archive: PageArchive,
+    out_csv: str | Path = "data/contacts_rescraped.csv",
+    search_results: Optional[Iterable | str | Path] = None,
+    run_id: Optional[str] = None,
+    parse_workers: int = 0,
+    parse_batch: int = 64,
+    parse_chunksize: int = 4,
+) -> int:
+    """
+    Re-run contact extraction over archived pages without touching the network.
+
+    Uses the latest archived body per canonical URL (from one run if
+    ``run_id`` is given). Titles and snippets are taken from
+    ``search_results`` when provided. Returns the number of rows written.
+    """
+    entries: Dict[str, dict] = {}
+    if search_results is not None:
+        for entry in _load_search_results(search_results):
+            url = entry.get("link") or entry.get("url")
+            if url:
+                entries.setdefault(canonicalize_url(url), entry)
+
+    out_path = Path(out_csv)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = out_path.with_suffix(".csv.tmp")
+    pool = ProcessPoolExecutor(max_workers=parse_workers) if parse_workers > 0 else None
+    written = 0
+    try:
+        with temp_path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=FIELDNAMES)
+            writer.writeheader()
 
-    with out_path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(
-            handle, fieldnames=["organization", "url", "emails", "phones", "snippet"]
+            def _flush(batch: List[dict]) -> int:
+                parsed = parse_bodies(
+                    [record["text"] for record in batch], pool, chunksize=parse_chunksize
+                )
+                for record, contacts in zip(batch, parsed):
+                    entry = entries.get(canonicalize_url(record["url"]), {})
+                    writer.writerow(_make_row(entry, record["url"], contacts))
+                return len(batch)
+
+            batch: List[dict] = []
+            for record in archive.records(run_id):
+                batch.append(record)
+                if len(batch) >= max(1, parse_batch):
+                    written += _flush(batch)
+                    batch = []
+            if batch:
+                written += _flush(batch)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    temp_path.replace(out_path)
+    print(f"[scraper] re-extracted {written} archived pages to {out_path}")
+    _report_tiers()
+    return written
+
+
+class StreamingScraper:
+    """
+    Scrape search results while the search stage is still running.
+
+    Producers call ``submit`` with each result dict; a bounded queue feeds
+    ``workers`` scraping threads, and every finished row is appended and
+    flushed to ``out_csv`` straight away. Use as a context manager::
+
+        with StreamingScraper("data/contacts_raw.csv") as stream:
+            run_searches(on_item=stream.submit)
+        rows = stream.rows
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        out_csv: str | Path = "data/contacts_raw.csv",
+        workers: int = 8,
+        per_host: int = 2,
+        queue_size: int = 32,
+        page_cache: Optional[PageCache] = None,
+        scheduler: Optional[HostScheduler] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        archive: Optional[PageArchive] = None,
+    ):
+        self.out_path = Path(out_csv)
+        self.workers = max(1, workers)
+        self.fetcher = Fetcher(
+            max_workers=self.workers,
+            per_host=per_host,
+            scheduler=scheduler,
+            max_bytes=max_bytes,
         )
-        writer.writeheader()
-        writer.writerows(rows)
-    print(f"[scraper] wrote {len(rows)} rows to {out_path}")
-    return rows
+        self.page_cache = page_cache
+        self.archive = archive
+        self.rows: List[dict] = []
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._handle = None
+        self._writer = None
+
+    def __enter__(self) -> "StreamingScraper":
+        self.out_path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.out_path.open("w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._handle, fieldnames=FIELDNAMES)
+        self._writer.writeheader()
+        self._handle.flush()
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"scraper-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def submit(self, entry: dict) -> None:
+        """Queue one search result; blocks while the queue is full."""
+        self._queue.put(entry)
+
+    def _work(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is self._STOP:
+                return
+            try:
+                row = _row_for(entry, self.fetcher, self.page_cache, self.archive)
+            except Exception as exc:  # noqa: BLE001 - stage should continue
+                print(f"[scraper] row failed for {entry.get('link')}: {exc}")
+                continue
+            if row is None:
+                continue
+            with self._lock:
+                self._writer.writerow(row)
+                self._handle.flush()
+                self.rows.append(row)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        for _ in self._threads:
+            self._queue.put(self._STOP)
+        for thread in self._threads:
+            thread.join()
+        self._handle.close()
+        self.fetcher.close()
+        print(f"[scraper] streamed {len(self.rows)} rows to {self.out_path}")
+        print(f"[scraper] fetch stats: {dict(self.fetcher.stats)}")
+        _report_tiers()
+        if self.page_cache is not None:
+            print(f"[scraper] page cache: {self.page_cache.summary()}")
@@ -0,0 +1,135 @@
+"""
+Persistent on-disk cache for SerpApi responses.
+
+Entries are gzip-compressed JSON files named by a fingerprint of the
+normalized (engine, q, location, num) tuple. Each entry carries its own
+expiry, and the directory is trimmed least-recently-used first once it
+grows past ``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+CACHE_MODES = ("off", "read", "refresh")
+
+
+def _normalize(value) -> str:
+    return " ".join(str(value or "").split()).casefold()
+
+
+def fingerprint(params: dict) -> str:
+    """Stable hash of the query fields that determine a SerpApi response."""
+    key = {
+        "engine": _normalize(params.get("engine", "google")),
+        "q": _normalize(params.get("q")),
+        "location": _normalize(params.get("location")),
+        "num": int(params.get("num") or 0),
+    }
+    blob = json.dumps(key, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """
+    Compressed, TTL-bounded SerpApi response cache.
+
+    Modes:
+        off     - never read or write
+        read    - serve fresh entries, fetch and store misses
+        refresh - always fetch, overwrite stored entries
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = "data/cache/serpapi",
+        mode: str = "read",
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_bytes: int = 50 * 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"mode must be one of {CACHE_MODES}, got {mode!r}")
+        self.cache_dir = Path(cache_dir)
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json.gz"
+
+    def lookup(self, params: dict) -> Optional[dict]:
+        """Return the cached response for params, or None on miss/expiry."""
+        if self.mode != "read":
+            return None
+        path = self._path(fingerprint(params))
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except (OSError, ValueError):
+            self.stats["misses"] += 1
+            return None
+
+        if entry.get("expires_at", 0) <= self._clock():
+            self.stats["misses"] += 1
+            path.unlink(missing_ok=True)
+            return None
+
+        # Bump mtime so eviction treats this entry as recently used.
+        now = self._clock()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        self.stats["hits"] += 1
+        return entry.get("data")
+
+    def store(self, params: dict, data: dict, ttl_seconds: Optional[float] = None) -> None:
+        """Persist a response; no-op when the cache is off."""
+        if self.mode == "off":
+            return
+        key = fingerprint(params)
+        now = self._clock()
+        entry = {
+            "fingerprint": key,
+            "q": params.get("q"),
+            "stored_at": now,
+            "expires_at": now + (ttl_seconds if ttl_seconds is not None else self.ttl_seconds),
+            "data": data,
+        }
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        temp_path = path.with_suffix(".tmp")
+        with gzip.open(temp_path, "wt", encoding="utf-8") as handle:
+            json.dump(entry, handle, ensure_ascii=False)
+        temp_path.replace(path)
+        os.utime(path, (now, now))
+        self.stats["writes"] += 1
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.json.gz"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.stats["evictions"] += 1
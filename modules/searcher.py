@@ -2,9 +2,15 @@
 Search stage helper that wraps SerpApi queries for outreach discovery.
 """
 
+import asyncio
 import os
+import threading
 import time
-from typing import Iterable, List, Optional
+from typing import Callable, Iterable, List, Optional
+
+from .ratelimit import TokenBucket
+from .search_cache import SearchCache
+from .urls import canonicalize_url
 
 # serpapi==0.1.5 exposes GoogleSearch under serpapi.google_search,
 # while some builds expose it at the top level. Try both.
@@ -25,6 +31,96 @@ DEFAULT_QUERIES = [
     'Winter Haven "for rent by owner" "Winter Haven"',
     'Winter Haven "room for rent" owner email',
 ]
+DEFAULT_LOCATION = "Winter Haven, Florida, United States"
+
+SearchFetch = Callable[[dict], dict]
+ItemCallback = Callable[[dict], None]
+
+
+def _google_search(params: dict) -> dict:
+    return GoogleSearch(params).get_dict()
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    if api_key is None:
+        api_key = os.getenv("SERPAPI_KEY")
+    if not api_key:
+        raise RuntimeError("SERPAPI_KEY not set in environment or .env")
+    return api_key
+
+
+def _lazy_api_key(api_key: Optional[str]) -> Callable[[], str]:
+    """Resolve the key on first use, so fully cached runs need none."""
+    resolved: List[str] = []
+
+    def _get() -> str:
+        if not resolved:
+            resolved.append(_resolve_api_key(api_key))
+        return resolved[0]
+
+    return _get
+
+
+def _build_params(query: str, location: str, num: int) -> dict:
+    # The API key is added only for real calls; cache keys never include it
+    return {
+        "engine": "google",
+        "q": query,
+        "location": location,
+        "num": num,
+    }
+
+
+def _organic_items(data: dict) -> List[dict]:
+    return [
+        {
+            "title": item.get("title"),
+            "link": item.get("link"),
+            "snippet": item.get("snippet", ""),
+        }
+        for item in (data.get("organic_results") or [])
+    ]
+
+
+def _report_cache(cache: Optional[SearchCache]) -> None:
+    if cache is not None and cache.mode != "off":
+        print(
+            f"[searcher] cache {cache.mode}: {cache.stats['hits']} hits, "
+            f"{cache.stats['misses']} misses, {cache.stats['writes']} writes"
+        )
+
+
+def _streamer(on_item: Optional[ItemCallback]) -> Callable[[List[dict]], None]:
+    """Forward each not-yet-seen link to on_item as soon as it arrives."""
+    seen_links = set()
+    lock = threading.Lock()
+
+    def _emit(items: List[dict]) -> None:
+        if on_item is None:
+            return
+        for item in items:
+            link = item.get("link")
+            key = canonicalize_url(link) if link else None
+            with lock:
+                if not key or key in seen_links:
+                    continue
+                seen_links.add(key)
+            on_item(item)
+
+    return _emit
+
+
+def _dedupe(results: Iterable[dict]) -> List[dict]:
+    # De-duplicate by canonical URL to reduce scraping load.
+    deduped: List[dict] = []
+    seen_links = set()
+    for item in results:
+        link = item.get("link")
+        key = canonicalize_url(link) if link else None
+        if key and key not in seen_links:
+            seen_links.add(key)
+            deduped.append(item)
+    return deduped
 
 
 def run_searches(
@@ -33,49 +129,102 @@ def run_searches(
     location: Optional[str] = None,
     num: int = 10,
     pause: float = 1.2,
+    fetch: Optional[SearchFetch] = None,
+    cache: Optional[SearchCache] = None,
+    on_item: Optional[ItemCallback] = None,
 ) -> List[dict]:
     """
     Run SerpApi queries and return a de-duplicated list of organic results.
-    """
-    if api_key is None:
-        api_key = os.getenv("SERPAPI_KEY")
-    if not api_key:
-        raise RuntimeError("SERPAPI_KEY not set in environment or .env")
 
+    When ``cache`` is given, fresh cached responses are served without an API
+    call (or the pause) and new responses are written back; the API key is
+    only required once a query misses the cache. ``on_item`` is
+    called with each new de-duplicated result as soon as its query returns.
+    """
+    key = _lazy_api_key(api_key)
     queries = list(queries or DEFAULT_QUERIES)
-    location = location or "Winter Haven, Florida, United States"
+    location = location or DEFAULT_LOCATION
+    fetch = fetch or _google_search
+    emit = _streamer(on_item)
     results: List[dict] = []
 
     for query in queries:
-        params = {
-            "engine": "google",
-            "q": query,
-            "location": location,
-            "api_key": api_key,
-            "num": num,
-        }
-        try:
-            search = GoogleSearch(params)
-            data = search.get_dict()
-            org = data.get("organic_results") or []
-            for item in org:
-                results.append(
-                    {
-                        "title": item.get("title"),
-                        "link": item.get("link"),
-                        "snippet": item.get("snippet", ""),
-                    }
-                )
-        except Exception as exc:  # noqa: BLE001 - diagnostics only
-            print(f"[searcher] query failed: {query} -> {exc}")
-        time.sleep(pause)
-
-    # De-duplicate by URL to reduce scraping load.
-    deduped: List[dict] = []
-    seen_links = set()
-    for item in results:
-        link = item.get("link")
-        if link and link not in seen_links:
-            seen_links.add(link)
-            deduped.append(item)
-    return deduped
+        params = _build_params(query, location, num)
+        data = cache.lookup(params) if cache else None
+        if data is None:
+            request = {**params, "api_key": key()}
+            try:
+                data = fetch(request)
+                if cache:
+                    cache.store(params, data)
+            except Exception as exc:  # noqa: BLE001 - diagnostics only
+                print(f"[searcher] query failed: {query} -> {exc}")
+                data = {}
+            time.sleep(pause)
+        items = _organic_items(data)
+        emit(items)
+        results.extend(items)
+
+    _report_cache(cache)
+    return _dedupe(results)
+
+
+async def run_searches_async(
+    api_key: Optional[str] = None,
+    queries: Optional[Iterable[str]] = None,
+    location: Optional[str] = None,
+    num: int = 10,
+    concurrency: int = 4,
+    rate: float = 2.0,
+    burst: float = 2.0,
+    fetch: Optional[SearchFetch] = None,
+    cache: Optional[SearchCache] = None,
+    on_item: Optional[ItemCallback] = None,
+) -> List[dict]:
+    """
+    Concurrent variant of ``run_searches``.
+
+    Up to ``concurrency`` queries are in flight at once and a shared token
+    bucket (``rate`` queries/second, ``burst`` capacity) replaces the fixed
+    per-query pause. Results are merged in query order, so the de-duplicated
+    output matches the sequential path. Cache hits bypass the rate limiter.
+    ``on_item`` receives new de-duplicated results as each query returns; it
+    runs in a worker thread, so a consumer that blocks (such as a full scrape
+    queue) never stalls the event loop or the other in-flight queries.
+    """
+    key = _lazy_api_key(api_key)
+    queries = list(queries or DEFAULT_QUERIES)
+    location = location or DEFAULT_LOCATION
+    fetch = fetch or _google_search
+    bucket = TokenBucket(rate, burst)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    emit = _streamer(on_item)
+
+    async def _forward(items: List[dict]) -> None:
+        if on_item is not None and items:
+            await asyncio.to_thread(emit, items)
+
+    async def _one(query: str) -> List[dict]:
+        params = _build_params(query, location, num)
+        cached = cache.lookup(params) if cache else None
+        if cached is not None:
+            items = _organic_items(cached)
+            await _forward(items)
+            return items
+        request = {**params, "api_key": key()}
+        async with semaphore:
+            await bucket.acquire_async()
+            try:
+                data = await asyncio.to_thread(fetch, request)
+            except Exception as exc:  # noqa: BLE001 - diagnostics only
+                print(f"[searcher] query failed: {query} -> {exc}")
+                return []
+        if cache:
+            cache.store(params, data)
+        items = _organic_items(data)
+        await _forward(items)
+        return items
+
+    batches = await asyncio.gather(*(_one(query) for query in queries))
+    _report_cache(cache)
+    return _dedupe(item for batch in batches for item in batch)
@@ -0,0 +1,119 @@
+"""
+Persistent cross-run record of scraped URLs.
+
+The scraper consults this store before fetching: a canonical URL scraped
+within ``revisit_seconds`` is not fetched again, and the store counts how
+many fetches that saved. URLs marked as near-duplicates of another listing
+(see ``near_dupes``) are skipped for ``duplicate_seconds`` after the mark;
+every dedupe run re-marks current members and clears the mark of each
+cluster's representative, so suppression follows the latest clustering.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable
+
+from .urls import canonicalize_url
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    url TEXT PRIMARY KEY,
+    first_seen REAL,
+    last_fetched REAL,
+    fetches INTEGER DEFAULT 0,
+    cluster_id TEXT,
+    marked_at REAL
+)
+"""
+
+
+class SeenStore:
+    """SQLite seen-set keyed by canonical URL."""
+
+    def __init__(
+        self,
+        db_path: str | Path = "data/cache/seen.sqlite",
+        revisit_seconds: float = 7 * 24 * 3600,
+        duplicate_seconds: float = 7 * 24 * 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.revisit_seconds = revisit_seconds
+        self.duplicate_seconds = duplicate_seconds
+        self.stats: Counter = Counter(saved=0, fetched=0, near_duplicates=0)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(seen)")}
+        if "cluster_id" not in columns:  # store created before near-duplicate marking
+            self._conn.execute("ALTER TABLE seen ADD COLUMN cluster_id TEXT")
+        if "marked_at" not in columns:  # marks without a time count as expired
+            self._conn.execute("ALTER TABLE seen ADD COLUMN marked_at REAL")
+        self._conn.commit()
+
+    def should_fetch(self, url: str) -> bool:
+        """
+        True if url was never fetched or is older than the revisit age, and
+        is not a recently marked duplicate.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_fetched, cluster_id, marked_at FROM seen WHERE url=?",
+                (canonicalize_url(url),),
+            ).fetchone()
+            now = self._clock()
+            if (row is not None and row[1] is not None
+                    and now - (row[2] or 0) < self.duplicate_seconds):
+                self.stats["saved"] += 1
+                self.stats["near_duplicates"] += 1
+                return False
+            if row is not None and now - (row[0] or 0) < self.revisit_seconds:
+                self.stats["saved"] += 1
+                return False
+            return True
+
+    def mark(self, url: str) -> None:
+        """Record that url was fetched now."""
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO seen (url, first_seen, last_fetched, fetches) "
+                "VALUES (?, ?, ?, 1) "
+                "ON CONFLICT(url) DO UPDATE SET last_fetched=excluded.last_fetched, "
+                "fetches=fetches + 1",
+                (canonicalize_url(url), now, now),
+            )
+            self._conn.commit()
+            self.stats["fetched"] += 1
+
+    def mark_duplicate(self, url: str, cluster_id: str) -> None:
+        """Record url as a near-duplicate in cluster_id; it is skipped until the mark expires."""
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO seen (url, first_seen, cluster_id, marked_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET cluster_id=excluded.cluster_id, "
+                "marked_at=excluded.marked_at",
+                (canonicalize_url(url), now, cluster_id, now),
+            )
+            self._conn.commit()
+
+    def clear_duplicate(self, url: str) -> None:
+        """Drop any near-duplicate mark on url (it now represents its cluster)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE seen SET cluster_id=NULL, marked_at=NULL WHERE url=?",
+                (canonicalize_url(url),),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
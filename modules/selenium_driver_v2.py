@@ -3,11 +3,14 @@ WSP2AGENT Production Selenium Driver
 Resilient WebDriver with explicit waits and centralized selectors
 """
 
+import base64
+import json
 import platform
 import re
 import subprocess
+from collections import Counter
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
@@ -58,7 +61,9 @@ def get_chrome_version() -> Optional[str]:
 
 def build_chrome_driver(
     headless: Optional[bool] = None,
-    user_agent: Optional[str] = None
+    user_agent: Optional[str] = None,
+    lean: Optional[bool] = None,
+    capture_network: Optional[bool] = None
 ) -> webdriver.Chrome:
     """
     Build production-grade Chrome WebDriver with explicit configuration.
@@ -66,6 +71,11 @@ def build_chrome_driver(
     Args:
         headless: Run in headless mode (uses config default if None)
         user_agent: Custom user agent string (optional)
+        lean: Text-only profile - eager page loads, no extensions, and
+            images/fonts/CSS/media/trackers blocked (uses config if None)
+        capture_network: Record network events so XHR/fetch response bodies
+            can be read back; attaches ``driver.network_capture`` (uses
+            config if None)
     
     Returns:
         Configured Chrome WebDriver instance
@@ -112,6 +122,23 @@ def build_chrome_driver(
     if user_agent:
         options.add_argument(f"--user-agent={user_agent}")
     
+    # Lean mode: we only need text and the reply widget
+    if lean is None:
+        lean = config.chrome_lean
+    if lean:
+        options.page_load_strategy = config.chrome_page_load_strategy
+        if config.chrome_disable_extensions:
+            options.add_argument("--disable-extensions")
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+    
+    # Network events land in the performance log
+    if capture_network is None:
+        capture_network = config.chrome_capture_network
+    if capture_network:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    
     # Remove webdriver property
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
@@ -129,6 +156,19 @@ def build_chrome_driver(
             {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"}
         )
         
+        # Drop asset/tracker requests before they leave the browser
+        blocked = config.chrome_blocked_url_patterns if lean else []
+        if blocked:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked})
+        
+        driver.network_capture = None
+        if capture_network:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.network_capture = NetworkCapture(
+                driver, url_patterns=config.chrome_capture_url_patterns
+            )
+        
         return driver
     
     except Exception as e:
@@ -138,6 +178,81 @@ def build_chrome_driver(
         ) from e
 
 
+class NetworkCapture:
+    """
+    Read XHR/fetch response bodies of the current page.
+    
+    Network events come from Chrome's performance log; bodies are pulled
+    with CDP ``Network.getResponseBody`` once a request has finished loading.
+    ``stats`` counts matching ``responses``, ``bodies`` read and body ``errors``
+    (e.g. evicted from Chrome's buffer).
+    """
+    
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        url_patterns: Iterable[str] = (),
+        resource_types: Tuple[str, ...] = ("XHR", "Fetch"),
+        mime_markers: Tuple[str, ...] = ("json", "html", "text")
+    ):
+        self.driver = driver
+        self.url_patterns = tuple(url_patterns)
+        self.resource_types = resource_types
+        self.mime_markers = mime_markers
+        self.stats: Counter = Counter(responses=0, bodies=0, errors=0)
+        self._pending = {}  # requestId -> response URL
+    
+    def reset(self) -> None:
+        """Drop events and pending requests (call before loading a new page)."""
+        for _event in self._events():
+            pass
+        self._pending.clear()
+    
+    def _events(self) -> Iterator[Tuple[str, dict]]:
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            yield message.get("method", ""), message.get("params", {})
+    
+    def _wanted(self, params: dict) -> bool:
+        response = params.get("response", {})
+        url = response.get("url", "")
+        mime = response.get("mimeType", "")
+        return (
+            params.get("type") in self.resource_types
+            and any(marker in mime for marker in self.mime_markers)
+            and (not self.url_patterns or any(p in url for p in self.url_patterns))
+        )
+    
+    def bodies(self) -> List[Tuple[str, str]]:
+        """(url, body) for matching responses that finished since the last call."""
+        finished = []
+        for method, params in self._events():
+            request_id = params.get("requestId")
+            if method == "Network.responseReceived" and self._wanted(params):
+                self._pending[request_id] = params["response"]["url"]
+                self.stats["responses"] += 1
+            elif method == "Network.loadingFinished" and request_id in self._pending:
+                finished.append((request_id, self._pending.pop(request_id)))
+            elif method == "Network.loadingFailed":
+                self._pending.pop(request_id, None)
+        
+        bodies = []
+        for request_id, url in finished:
+            try:
+                result = self.driver.execute_cdp_cmd(
+                    "Network.getResponseBody", {"requestId": request_id}
+                )
+            except Exception:
+                self.stats["errors"] += 1
+                continue
+            body = result.get("body", "")
+            if result.get("base64Encoded"):
+                body = base64.b64decode(body).decode("utf-8", "replace")
+            self.stats["bodies"] += 1
+            bodies.append((url, body))
+        return bodies
+
+
 def safe_find(
     driver: webdriver.Chrome,
     by: By,
@@ -211,6 +326,113 @@ def safe_click(
         return False
 
 
+# Milliseconds since the DOM last changed; installs the observer on first call.
+_MUTATION_AGE_JS = """
+if (!window.__wspObserver) {
+    window.__wspLastMutation = performance.now();
+    window.__wspObserver = new MutationObserver(function () {
+        window.__wspLastMutation = performance.now();
+    });
+    window.__wspObserver.observe(document, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+}
+return performance.now() - window.__wspLastMutation;
+"""
+
+
+# True once any element matching arguments[0] shows non-blank text or value.
+_HAS_CONTENT_JS = """
+return Array.prototype.some.call(
+    document.querySelectorAll(arguments[0]),
+    function (el) { return ((el.innerText || el.value || "") + "").trim().length > 0; }
+);
+"""
+
+
+def watch_mutations(driver: webdriver.Chrome) -> None:
+    """
+    Start recording DOM mutations on the current page.
+    
+    Call before an action (e.g. a click) so the mutations it causes are seen
+    by a following ``wait_for_any``.
+    """
+    driver.execute_script(_MUTATION_AGE_JS)
+
+
+def wait_for_document_ready(
+    driver: webdriver.Chrome,
+    timeout: Optional[int] = None
+) -> bool:
+    """
+    Wait until the document is interactive (returns immediately if it already is).
+    
+    Returns:
+        True if ready before the timeout, False otherwise
+    """
+    config = get_config()
+    timeout = timeout or config.timeout_seconds
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+            lambda d: d.execute_script("return document.readyState") != "loading"
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def wait_for_any(
+    driver: webdriver.Chrome,
+    css_selector: str,
+    timeout: Optional[int] = None,
+    quiet_ms: int = 500,
+    also: Optional[Callable[[webdriver.Chrome], bool]] = None,
+    require_text: bool = True
+) -> str:
+    """
+    Event-driven wait for content to appear.
+    
+    Polls until an element matching ``css_selector`` has non-blank text,
+    ``also`` returns True (e.g. the content arrived in a network response),
+    or the DOM has had no mutations for ``quiet_ms`` (the page settled
+    without it), whichever comes first. Empty placeholders that a page
+    renders before filling them in therefore do not count as found.
+    
+    Args:
+        driver: Chrome WebDriver instance
+        css_selector: Elements to wait for (comma-separated selectors allowed)
+        timeout: Upper bound in seconds (uses config default if None)
+        quiet_ms: Mutation-free period after which the page counts as settled
+        also: Extra condition checked on every poll
+        require_text: False to accept any matching element (e.g. icon buttons)
+    
+    Returns:
+        "found", "network", "quiet" or "timeout"
+    """
+    config = get_config()
+    timeout = timeout or config.timeout_seconds
+    
+    def _present(d) -> bool:
+        if require_text:
+            return bool(d.execute_script(_HAS_CONTENT_JS, css_selector))
+        return bool(d.find_elements(By.CSS_SELECTOR, css_selector))
+    
+    def _settled(d):
+        if _present(d):
+            return "found"
+        if also is not None and also(d):
+            return "network"
+        if d.execute_script(_MUTATION_AGE_JS) >= quiet_ms:
+            return "quiet"
+        return False
+    
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.05).until(_settled)
+    except TimeoutException:
+        return "timeout"
+
+
 # Smoke test
 if __name__ == "__main__":
     print("🧪 Selenium Driver Smoke Test")
@@ -0,0 +1,111 @@
+"""
+Negative cache for contact enrichment.
+
+Listings that come back ``no_contacts`` or ``failed`` are recorded by their
+row id (the md5 prefix the enricher assigns) and not retried until an
+exponentially growing backoff has passed: ``base_hours`` after the first
+miss, doubling with each consecutive miss up to ``max_hours``. A success
+clears the entry.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS misses (
+    id TEXT PRIMARY KEY,
+    url TEXT,
+    attempts INTEGER DEFAULT 0,
+    failures INTEGER DEFAULT 0,
+    last_status TEXT,
+    last_attempt REAL,
+    next_attempt REAL
+)
+"""
+_MISS_STATUSES = ("no_contacts", "failed")
+
+
+class SkipCache:
+    """
+    SQLite record of listings that keep yielding nothing.
+
+    ``stats`` counts ``skipped`` (lookups inside a backoff window),
+    ``recorded`` (misses written) and ``cleared`` (misses that later succeeded).
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = "data/cache/enrich_skip.sqlite",
+        base_hours: float = 12,
+        max_hours: float = 24 * 30,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.base_seconds = base_hours * 3600
+        self.max_seconds = max_hours * 3600
+        self.stats: Counter = Counter(skipped=0, recorded=0, cleared=0)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def backoff_seconds(self, attempts: int) -> float:
+        """Wait after ``attempts`` consecutive misses."""
+        if attempts <= 0:
+            return 0.0
+        return min(self.max_seconds, self.base_seconds * 2 ** (attempts - 1))
+
+    def entry(self, row_id: str) -> Optional[Dict[str, object]]:
+        with self._lock:
+            cursor = self._conn.execute("SELECT * FROM misses WHERE id=?", (row_id,))
+            row = cursor.fetchone()
+            columns = [c[0] for c in cursor.description]
+        return dict(zip(columns, row)) if row else None
+
+    def should_attempt(self, row_id: str) -> bool:
+        """False while row_id is inside its backoff window."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT next_attempt FROM misses WHERE id=?", (row_id,)
+            ).fetchone()
+            if row is not None and self._clock() < (row[0] or 0):
+                self.stats["skipped"] += 1
+                return False
+            return True
+
+    def record(self, row_id: str, url: str, status: str) -> None:
+        """Store an enrichment outcome; misses extend the backoff, anything else clears it."""
+        now = self._clock()
+        with self._lock:
+            if status not in _MISS_STATUSES:
+                if self._conn.execute("DELETE FROM misses WHERE id=?", (row_id,)).rowcount:
+                    self.stats["cleared"] += 1
+                self._conn.commit()
+                return
+            row = self._conn.execute(
+                "SELECT attempts, failures FROM misses WHERE id=?", (row_id,)
+            ).fetchone()
+            attempts, failures = row or (0, 0)
+            attempts += 1
+            failures += status == "failed"
+            self._conn.execute(
+                "INSERT OR REPLACE INTO misses "
+                "(id, url, attempts, failures, last_status, last_attempt, next_attempt) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (row_id, url, attempts, failures, status, now,
+                 now + self.backoff_seconds(attempts)),
+            )
+            self._conn.commit()
+            self.stats["recorded"] += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
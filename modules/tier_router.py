@@ -0,0 +1,172 @@
+"""
+HTTP-first, browser-fallback routing for contact enrichment.
+
+Every page is first tried with the lightweight ``scraper.page_emails_phones``
+path. A WebDriver is used only for domains flagged as needing one (configured
+or learned) or for pages where the HTTP tier found no contacts, which is what
+JavaScript-rendered and reply-button-gated listings look like over plain HTTP.
+Per-domain outcomes are kept in SQLite so later runs route straight to the
+tier that works.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .fetcher import Fetcher
+from .page_archive import PageArchive
+from .page_cache import PageCache
+from .ratelimit import HostScheduler
+from .scraper import page_emails_phones
+from .urls import host_of
+
+Contacts = Tuple[List[str], List[str]]
+BrowserExtract = Callable[[str], Contacts]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS domains (
+    domain TEXT PRIMARY KEY,
+    http_ok INTEGER DEFAULT 0,
+    http_empty INTEGER DEFAULT 0,
+    browser_ok INTEGER DEFAULT 0,
+    browser_empty INTEGER DEFAULT 0,
+    updated_at REAL
+)
+"""
+_OUTCOMES = ("http_ok", "http_empty", "browser_ok", "browser_empty")
+
+
+class TierRouter:
+    """
+    Route each URL to the cheapest tier that yields contacts.
+
+    ``stats`` counts, per page:
+    ``http``          - resolved by the HTTP tier
+    ``browser``       - resolved by the browser tier
+    ``escalated``     - HTTP found nothing, so the browser was tried
+    ``forced``        - domain flagged for the browser; HTTP skipped
+    ``not_escalated`` - HTTP found nothing and the browser never helps on this domain
+    ``empty``         - no contacts from any tier tried
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = "data/cache/tiers.sqlite",
+        browser_domains: Iterable[str] = (),
+        min_samples: int = 2,
+        fetcher: Optional[Fetcher] = None,
+        page_cache: Optional[PageCache] = None,
+        archive: Optional[PageArchive] = None,
+        scheduler: Optional[HostScheduler] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.browser_domains = tuple(d.lower().lstrip(".") for d in browser_domains)
+        self.min_samples = max(1, min_samples)
+        self._owns_fetcher = fetcher is None
+        self.fetcher = fetcher or Fetcher(scheduler=scheduler)
+        self.page_cache = page_cache
+        self.archive = archive
+        self.scheduler = scheduler
+        self.stats: Counter = Counter(
+            http=0, browser=0, escalated=0, forced=0, not_escalated=0, empty=0
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def memory(self, domain: str) -> Dict[str, int]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_OUTCOMES)} FROM domains WHERE domain=?", (domain,)
+            ).fetchone()
+        return dict(zip(_OUTCOMES, row or (0,) * len(_OUTCOMES)))
+
+    def _remember(self, domain: str, outcome: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO domains (domain) VALUES (?)", (domain,)
+            )
+            self._conn.execute(
+                f"UPDATE domains SET {outcome}={outcome}+1, updated_at=? WHERE domain=?",
+                (self._clock(), domain),
+            )
+            self._conn.commit()
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def needs_browser(self, domain: str) -> bool:
+        """True for configured browser domains, or where only the browser has worked."""
+        if any(domain == d or domain.endswith("." + d) for d in self.browser_domains):
+            return True
+        seen = self.memory(domain)
+        return (
+            seen["http_ok"] == 0
+            and seen["http_empty"] >= self.min_samples
+            and seen["browser_ok"] >= self.min_samples
+        )
+
+    def browser_helps(self, domain: str) -> bool:
+        """False once the browser has repeatedly found nothing on this domain."""
+        seen = self.memory(domain)
+        return seen["browser_ok"] > 0 or seen["browser_empty"] < self.min_samples
+
+    def route(self, url: str, browser: BrowserExtract) -> Tuple[List[str], List[str], str]:
+        """Return (emails, phones, tier) for url; ``browser`` runs the WebDriver tier."""
+        domain = host_of(url)
+        if self.needs_browser(domain):
+            self._count("forced")
+        else:
+            emails, phones = page_emails_phones(
+                url,
+                fetcher=self.fetcher,
+                page_cache=self.page_cache,
+                archive=self.archive,
+            )
+            if emails or phones:
+                self._remember(domain, "http_ok")
+                self._count("http")
+                return emails, phones, "http"
+            self._remember(domain, "http_empty")
+            if not self.browser_helps(domain):
+                self._count("not_escalated")
+                self._count("empty")
+                return [], [], "http"
+            self._count("escalated")
+
+        if self.scheduler is not None:
+            self.scheduler.wait(domain)
+        emails, phones = browser(url)
+        if emails or phones:
+            self._remember(domain, "browser_ok")
+            self._count("browser")
+        else:
+            self._remember(domain, "browser_empty")
+            self._count("empty")
+        return emails, phones, "browser"
+
+    def summary(self) -> Dict[str, float]:
+        """Tier-usage counts plus the share of pages that needed a browser."""
+        with self._lock:
+            stats: Dict[str, float] = dict(self.stats)
+        routed = stats["http"] + stats["escalated"] + stats["forced"] + stats["not_escalated"]
+        browser_pages = stats["escalated"] + stats["forced"]
+        stats["pages"] = routed
+        stats["browser_share"] = round(browser_pages / routed, 3) if routed else 0.0
+        return stats
+
+    def close(self) -> None:
+        if self._owns_fetcher:
+            self.fetcher.close()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,69 @@
+"""
+URL helpers shared by the search and scrape stages.
+"""
+
+from __future__ import annotations
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+# Query parameters that identify the click, not the page.
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "dclid",
+    "msclkid",
+    "yclid",
+    "mc_cid",
+    "mc_eid",
+    "srsltid",
+    "_ga",
+    "_gl",
+    "ref_src",
+    "referrer",
+    "spm",
+}
+TRACKING_PREFIXES = ("utm_",)
+# Parameters whose value is the site default and can be dropped. ``ref`` and
+# ``p`` are left alone: many sites use them for listing and post IDs.
+DEFAULT_PARAMS = {("page", "1"), ("pg", "1")}
+
+
+def host_of(url: str) -> str:
+    """Lower-cased hostname used as the politeness/connection key."""
+    return (urlsplit(url or "").hostname or "").lower()
+
+
+def _keep_param(key: str, value: str) -> bool:
+    lowered = key.lower()
+    if lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PREFIXES):
+        return False
+    return (lowered, value) not in DEFAULT_PARAMS
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Return a canonical form of url for de-duplication and cache keys.
+
+    Lower-cases the scheme and host, drops default ports, the fragment,
+    tracking parameters (``utm_*``, ``gclid``, ...) and ``page=1``-style
+    defaults, sorts the remaining query, and strips a trailing slash from
+    non-root paths. Path case is preserved since servers may treat it as
+    significant.
+    """
+    parts = urlsplit((url or "").strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if _keep_param(key, value)
+        )
+    )
+    return urlunsplit((scheme, host, path, query, ""))
@@ -6,6 +6,7 @@ Orchestrates the WSP2AGENT pipeline. This is a safe, manual-gate controller.
 
 import os
 import argparse
+import asyncio
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -22,14 +23,147 @@ def safe_import(module_name):
         return None
 
 
-def main(dry_run=True):
+def _load_settings():
+    config = safe_import("modules.config")
+    return config.get_config() if config else None
+
+
+def _scrape_kwargs(settings):
+    if not settings:
+        return {}
+    kwargs = {
+        "workers": settings.fetch_workers,
+        "per_host": settings.per_host_connections,
+        "max_bytes": settings.max_page_bytes,
+    }
+    ratelimit = safe_import("modules.ratelimit")
+    if ratelimit:
+        kwargs["scheduler"] = ratelimit.HostScheduler(
+            settings.politeness_delay_min,
+            jitter=max(0.0, settings.politeness_delay_max - settings.politeness_delay_min),
+        )
+    page_cache_module = safe_import("modules.page_cache")
+    if page_cache_module and settings.page_cache_enabled:
+        kwargs["page_cache"] = page_cache_module.PageCache(
+            settings.page_cache_path,
+            max_age_seconds=settings.page_cache_max_age_seconds,
+        )
+    page_archive_module = safe_import("modules.page_archive")
+    if page_archive_module and settings.archive_enabled:
+        archive = page_archive_module.PageArchive(
+            settings.archive_dir,
+            max_age_seconds=settings.archive_max_age_seconds,
+            max_bytes=settings.archive_max_bytes,
+        )
+        pruned = archive.prune()
+        if pruned:
+            print(f"[archive] pruned {pruned} pages past the retention limits")
+        kwargs["archive"] = archive
+    return kwargs
+
+
+def _parse_kwargs(settings):
+    if not settings:
+        return {}
+    return {
+        "parse_workers": settings.parse_workers,
+        "parse_batch": settings.parse_batch,
+        "parse_chunksize": settings.parse_chunksize,
+    }
+
+
+def _build_seen_store(settings):
+    seen_store_module = safe_import("modules.seen_store")
+    if not (seen_store_module and settings and settings.seen_set_enabled):
+        return None
+    return seen_store_module.SeenStore(
+        settings.seen_set_path,
+        revisit_seconds=settings.revisit_after_seconds,
+        duplicate_seconds=settings.dedupe_suppress_seconds,
+    )
+
+
+def _build_score_cache(settings):
+    score_cache_module = safe_import("modules.score_cache")
+    if not (score_cache_module and settings and settings.curator_score_cache_enabled):
+        return None
+    return score_cache_module.ScoreCache(settings.curator_score_cache_path)
+
+
+def _build_search_cache(settings, search_cache):
+    search_cache_module = safe_import("modules.search_cache")
+    if not search_cache_module:
+        return None
+    mode = search_cache or (settings.search_cache_mode if settings else "off")
+    if mode == "off":
+        return None
+    if settings:
+        return search_cache_module.SearchCache(
+            settings.search_cache_dir,
+            mode=mode,
+            ttl_seconds=settings.search_cache_ttl_seconds,
+            max_bytes=settings.search_cache_max_bytes,
+        )
+    return search_cache_module.SearchCache(DATA_DIR / "cache" / "serpapi", mode=mode)
+
+
+def _run_search_stage(searcher, settings, search_mode, search_cache, on_item=None):
+    mode = search_mode or (settings.search_mode if settings else "sync")
+    cache = _build_search_cache(settings, search_cache)
+    if mode == "async":
+        kwargs = {}
+        if settings:
+            kwargs = {
+                "concurrency": settings.search_concurrency,
+                "rate": settings.search_rate_per_second,
+                "burst": settings.search_burst,
+            }
+        return asyncio.run(
+            searcher.run_searches_async(cache=cache, on_item=on_item, **kwargs)
+        )
+    return searcher.run_searches(cache=cache, on_item=on_item)
+
+
+def main(
+    dry_run=True,
+    search_mode=None,
+    search_cache=None,
+    stream=False,
+    run_id=None,
+    resume=False,
+    profile=None,
+    top_n=None,
+    curate_chunksize=None,
+):
     print("WSP2AGENT pipeline starting. Dry run =", dry_run)
+    settings = _load_settings()
     # 1) Searches
     searcher = safe_import("modules.searcher")
-    if searcher:
+    scraper = safe_import("modules.scraper")
+    streamed = False
+    if resume and (DATA_DIR / "search_results.json").exists():
+        print("Resuming: reusing data/search_results.json, skipping search stage.")
+    elif searcher:
         print("Running search stage...")
         try:
-            results = searcher.run_searches()
+            if stream and scraper:
+                # Scrape each hit as soon as it arrives instead of after all searches.
+                print("Streaming search hits straight into the scrape stage...")
+                with scraper.StreamingScraper(
+                    DATA_DIR / "contacts_raw.csv", **_scrape_kwargs(settings)
+                ) as streamer:
+                    results = _run_search_stage(
+                        searcher,
+                        settings,
+                        search_mode,
+                        search_cache,
+                        on_item=streamer.submit,
+                    )
+                streamed = True
+            else:
+                results = _run_search_stage(
+                    searcher, settings, search_mode, search_cache
+                )
             print(f"Collected {len(results)} search hits.")
             # Optionally save search_results.json
             import json
@@ -43,13 +177,22 @@ def main(dry_run=True):
         print("searcher module missing; skipping search stage.")
 
     # 2) Scrape
-    scraper = safe_import("modules.scraper")
-    if scraper:
+    if streamed:
+        print("Scrape stage complete (streamed): data/contacts_raw.csv")
+    elif scraper:
         print("Running scrape stage...")
         try:
             scraper.scrape_results(
                 DATA_DIR / "search_results.json",
                 out_csv=DATA_DIR / "contacts_raw.csv",
+                run_id=run_id,
+                resume=resume,
+                return_rows=False,
+                seen_store=_build_seen_store(settings),
+                journal_keep_runs=settings.journal_keep_runs if settings else 3,
+                report_dir=settings.log_dir if settings else "logs",
+                **_parse_kwargs(settings),
+                **_scrape_kwargs(settings),
             )
             print("Scrape stage complete: data/contacts_raw.csv")
         except Exception as e:  # noqa: BLE001 - show friendly warning
@@ -57,14 +200,34 @@ def main(dry_run=True):
     else:
         print("scraper module missing; skipping scrape stage.")
 
-    # 3) Curate
+    # 3) Collapse cross-posted listings, then curate
+    curate_input = DATA_DIR / "contacts_raw.csv"
+    near_dupes = safe_import("modules.near_dupes")
+    if near_dupes and settings and settings.dedupe_enabled:
+        print("Running near-duplicate stage...")
+        try:
+            near_dupes.dedupe_contacts(
+                curate_input,
+                out_csv=DATA_DIR / "contacts_deduped.csv",
+                threshold=settings.dedupe_threshold,
+                seen_store=_build_seen_store(settings),
+            )
+            curate_input = DATA_DIR / "contacts_deduped.csv"
+            print("Near-duplicate stage complete: data/contacts_deduped.csv")
+        except Exception as e:  # noqa: BLE001 - show friendly warning
+            print("Near-duplicate stage failed:", e)
+
     curator = safe_import("modules.curator")
     if curator:
         print("Running curate stage...")
         try:
             curator.curate_contacts(
-                DATA_DIR / "contacts_raw.csv",
+                curate_input,
                 out_csv=DATA_DIR / "top10_landlords.csv",
+                top_n=top_n,
+                profile=profile,
+                chunksize=curate_chunksize,
+                cache=_build_score_cache(settings),
             )
             print("Curate stage complete: data/top10_landlords.csv")
         except Exception as e:  # noqa: BLE001 - show friendly warning
@@ -129,5 +292,59 @@ if __name__ == "__main__":
         default=True,
         help="Stop at approval checkpoint",
     )
+    parser.add_argument(
+        "--search-mode",
+        choices=["sync", "async"],
+        default=None,
+        help="Run SerpApi queries sequentially or concurrently (default from config)",
+    )
+    parser.add_argument(
+        "--search-cache",
+        choices=["off", "read", "refresh"],
+        default=None,
+        help="SerpApi response cache: off, read (reuse fresh entries) or refresh",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Scrape search hits while later queries are still running",
+    )
+    parser.add_argument(
+        "--run-id",
+        default=None,
+        help="Scrape journal run ID (default: new timestamp, or latest with --resume)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted scrape, skipping URLs already journaled",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        help="Curation profile JSON (default: config/curator.json)",
+    )
+    parser.add_argument(
+        "--top-n",
+        type=int,
+        default=None,
+        help="Shortlist size (default: the profile's top_n)",
+    )
+    parser.add_argument(
+        "--curate-chunksize",
+        type=int,
+        default=None,
+        help="Stream contacts_raw.csv in chunks of this many rows, keeping only the top N",
+    )
     args = parser.parse_args()
-    main(dry_run=args.dry_run)
+    main(
+        dry_run=args.dry_run,
+        search_mode=args.search_mode,
+        search_cache=args.search_cache,
+        stream=args.stream,
+        run_id=args.run_id,
+        resume=args.resume,
+        profile=args.profile,
+        top_n=args.top_n,
+        curate_chunksize=args.curate_chunksize,
+    )
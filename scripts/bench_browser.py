@@ -0,0 +1,159 @@
+"""
+Compare the full and lean Chrome profiles, and lean with network capture,
+against a local fixture site.
+
+The fixture mimics a listing page: a posting body, a reply button whose
+widget fetches the contact as JSON and renders it a little later, plus the
+weight real sites carry
+(images, web fonts, a stylesheet and a tag-manager script). Every asset is
+served with a fixed latency so runs are reproducible; bytes served are
+counted per mode.
+
+Usage:
+    python -m scripts.bench_browser --pages 10 --asset-latency 0.05
+"""
+
+import argparse
+import json
+import tempfile
+import threading
+import time
+from collections import Counter
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from modules.config import get_config
+from modules.logger import create_logger
+from modules.selenium_driver_v2 import build_chrome_driver
+from scripts.contact_enricher_v2 import extract_contacts_from_page
+
+LISTING = """<!doctype html>
+<html><head>
+<link rel="stylesheet" href="/assets/site.css?v={n}">
+<script async src="/trackers/googletagmanager.com/gtm.js?v={n}"></script>
+</head><body>
+<img src="/assets/hero.jpg?v={n}">
+{gallery}
+<section id="postingbody">Sunny room near Lake Howard, $650/mo. Listing {n}.</section>
+<button class="reply-button" onclick="reveal()">reply</button>
+<div id="reply"></div>
+<script>
+function reveal() {{
+  fetch('/api/reply{n}.json?v={n}').then(function (r) {{ return r.json(); }})
+    .then(function (c) {{
+      setTimeout(function () {{
+        document.getElementById('reply').innerHTML =
+          '<span class="reply-email">' + c.email + '</span>' +
+          '<span class="reply-phone">' + c.phone + '</span>';
+      }}, 150);
+    }});
+}}
+</script>
+</body></html>
+"""
+
+
+def build_fixture(root: Path, pages: int) -> None:
+    """Write listing pages and deterministic binary assets under root."""
+    assets = root / "assets"
+    trackers = root / "trackers" / "googletagmanager.com"
+    api = root / "api"
+    assets.mkdir(parents=True)
+    trackers.mkdir(parents=True)
+    api.mkdir()
+    payload = bytes(range(256))
+    for name, size in [("hero.jpg", 400_000), ("font.woff2", 120_000)] + [
+        (f"photo{i}.jpg", 150_000) for i in range(6)
+    ]:
+        (assets / name).write_bytes(payload * (size // 256))
+    (assets / "site.css").write_text(
+        "@font-face{font-family:x;src:url(/assets/font.woff2)}\n"
+        + "body{font-family:x}\n" * 2000
+    )
+    (trackers / "gtm.js").write_text("var dataLayer=[];" + "//" + "x" * 80_000)
+    for n in range(pages):
+        # Per-page query strings defeat the browser cache, like distinct listings
+        gallery = "".join(f'<img src="/assets/photo{i}.jpg?v={n}">' for i in range(6))
+        (root / f"listing{n}.html").write_text(LISTING.format(gallery=gallery, n=n))
+        (api / f"reply{n}.json").write_text(json.dumps(
+            {"email": f"owner{n}@example.org", "phone": f"(863) 555-01{n:02d}"}
+        ))
+
+
+def serve(root: Path, latency: float, served: Counter) -> ThreadingHTTPServer:
+    class FixtureHandler(SimpleHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802 - http.server naming
+            if not self.path.endswith(".html"):
+                time.sleep(latency)
+            target = Path(self.translate_path(self.path))
+            if target.is_file():
+                served[self.server.mode] += target.stat().st_size
+            super().do_GET()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(FixtureHandler, directory=str(root))
+    )
+    server.mode = "full"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_mode(server, mode: str, pages: int, selectors, logger):
+    server.mode = mode
+    driver = build_chrome_driver(
+        headless=True, lean=mode != "full", capture_network=mode == "capture"
+    )
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    found = 0
+    try:
+        driver.get(f"{base}/listing0.html")  # warm up the browser process
+        started = time.perf_counter()
+        for n in range(pages):
+            emails, phones = extract_contacts_from_page(
+                driver, f"{base}/listing{n}.html", selectors, logger
+            )
+            found += bool(emails and phones)
+        return (time.perf_counter() - started) / pages, found
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full vs lean Chrome profile benchmark")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--asset-latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    config = get_config()
+    selectors = config.selectors.get("craigslist", {})
+    logger = create_logger(log_dir=str(config.log_dir), run_id="bench_browser")
+    served: Counter = Counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build_fixture(root, args.pages)
+        server = serve(root, args.asset_latency, served)
+        try:
+            results = {
+                mode: run_mode(server, mode, args.pages, selectors, logger)
+                for mode in ("full", "lean", "capture")
+            }
+        finally:
+            server.shutdown()
+
+    mb = 1024 * 1024
+    print(f"pages: {args.pages}, asset latency {args.asset_latency * 1000:.0f} ms")
+    for mode, (seconds, found) in results.items():
+        print(f"{mode + ':':9}{seconds * 1000:7.0f} ms/page  {served[mode] / mb:7.2f} MB  "
+              f"contacts on {found}/{args.pages}")
+    full_time, lean_time = results["full"][0], results["lean"][0]
+    print(f"lean speedup {full_time / lean_time:.2f}x, "
+          f"{1 - served['lean'] / max(1, served['full']):.0%} fewer bytes")
+    print(f"capture speedup over lean {lean_time / results['capture'][0]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
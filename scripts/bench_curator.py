@@ -0,0 +1,101 @@
+"""
+Microbenchmark for curator keyword matching.
+
+Scores synthetic listing snippets against a curation profile's keywords
+with the old per-keyword substring loop and with ``KeywordMatcher`` in
+both modes (substring scan and Aho-Corasick automaton), checking that all
+three agree. ``--extra-keywords`` pads the profile with synthetic phrases
+to show where the automaton overtakes the scan.
+
+Usage:
+    python -m scripts.bench_curator --rows 100000
+    python -m scripts.bench_curator --profile config/curation_profile_winter_haven.json --extra-keywords 200
+"""
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from modules.keyword_matcher import KeywordMatcher
+
+VOCABULARY = (
+    "room rent private sunny quiet house near lake howard downtown bus line "
+    "furnished unfurnished utilities included month-to-month deposit pets "
+    "laundry parking kitchen bath shared owner tenant lease garden yard lawn "
+    "church senior caretaker apartment complex community management company "
+    "corporate application portal winter haven polk 33880 $550 $650 $800"
+).split()
+
+
+def profile_keywords(path: Path) -> List[str]:
+    profile = json.loads(path.read_text(encoding="utf-8"))
+    return list(profile.get("positive", {})) + list(profile.get("negative", {}))
+
+
+def synthetic_keywords(count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(VOCABULARY)} {rng.choice(VOCABULARY)}{rng.randint(0, 99)}"
+        for _ in range(count)
+    ]
+
+
+def synthetic_snippets(count: int, seed: int = 42) -> List[str]:
+    """Organization + snippet + URL shaped text, 20-60 words each."""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(20, 60)))
+        + f" https://example.org/listing/{index}"
+        for index in range(count)
+    ]
+
+
+def naive_find(keywords: List[str]) -> Callable[[str], frozenset]:
+    """The curator's original loop: one substring test per keyword."""
+    def find(value: str) -> frozenset:
+        text = (value or "").lower()
+        return frozenset(kw for kw in keywords if kw in text)
+    return find
+
+
+def seconds(find: Callable[[str], frozenset], snippets: List[str]) -> float:
+    started = time.perf_counter()
+    for snippet in snippets:
+        find(snippet)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Curator keyword matching microbenchmark")
+    parser.add_argument("--profile", type=Path, default=Path("config/curator.json"))
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--extra-keywords", type=int, default=0)
+    args = parser.parse_args()
+
+    keywords = [k.lower() for k in profile_keywords(args.profile)]
+    keywords += synthetic_keywords(args.extra_keywords)
+    snippets = synthetic_snippets(args.rows)
+
+    naive = naive_find(keywords)
+    scan = KeywordMatcher(keywords, use_automaton=False)
+    automaton = KeywordMatcher(keywords, use_automaton=True)
+    sample = snippets[:2000]
+    if not all(naive(s) == scan.find(s) == automaton.find(s) for s in sample):
+        raise SystemExit("matchers disagree")
+
+    base = seconds(naive, snippets)
+    print(f"rows: {len(snippets)}, keywords: {len(scan)}")
+    print(f"per-keyword loop:  {base:7.2f} s  ({len(snippets) / base:9.0f} rows/s)")
+    for name, matcher in (("matcher scan:", scan), ("matcher automaton:", automaton)):
+        elapsed = seconds(matcher.find, snippets)
+        print(f"{name:18} {elapsed:7.2f} s  ({len(snippets) / elapsed:9.0f} rows/s, "
+              f"{base / elapsed:4.2f}x)")
+    default = "automaton" if KeywordMatcher(keywords).use_automaton else "scan"
+    print(f"default for this profile: {default}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Microbenchmark for modules.scraper extraction.
+
+Reports CPU time per page with the full lxml parse forced on every page
+(old behaviour) versus the tiered regex-first extractor, and with
+``--workers`` the parse-stage throughput of a process pool at each size up
+to that count.
+
+Usage:
+    python -m scripts.bench_extract --pages 200 --size-kb 400
+    python -m scripts.bench_extract --corpus data/saved_pages --workers 8
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List
+
+from modules import scraper
+
+
+def synthetic_pages(count: int, size_kb: int, mailto_share: float) -> List[str]:
+    """Listing-site shaped pages: lots of markup, a few contacts, some mailto links."""
+    rng = random.Random(42)
+    filler = (
+        '<div class="card"><span class="price">$650/mo</span>'
+        '<a href="/homedetails/{n}">Room near Lake Howard {n}</a>'
+        '<script>window.__STATE__={{"id":{n},"beds":1}}</script></div>\n'
+    )
+    pages = []
+    for index in range(count):
+        blocks = []
+        while sum(len(b) for b in blocks) < size_kb * 1024:
+            blocks.append(filler.format(n=rng.randint(1, 10**6)))
+        blocks.insert(len(blocks) // 2, "<p>Call owner at (863) 555-0142</p>")
+        if rng.random() < mailto_share:
+            blocks.insert(1, f'<a href="mailto:owner{index}@example.org">Email</a>')
+        pages.append("<html><body>" + "".join(blocks) + "</body></html>")
+    return pages
+
+
+def load_corpus(directory: Path) -> List[str]:
+    return [
+        path.read_text(encoding="utf-8", errors="replace")
+        for path in sorted(directory.glob("*.htm*"))
+    ]
+
+
+def cpu_per_page(pages: List[str], always_parse: bool) -> float:
+    started = time.process_time()
+    for page in pages:
+        scraper.extract_contacts(page, always_parse=always_parse)
+    return (time.process_time() - started) / max(1, len(pages))
+
+
+def pool_throughput(pages: List[str], workers: int, chunksize: int) -> float:
+    """Wall-clock pages per second through parse_bodies (0 workers = inline)."""
+    if not workers:
+        started = time.perf_counter()
+        scraper.parse_bodies(pages)
+        return len(pages) / (time.perf_counter() - started)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        scraper.parse_bodies(pages[:workers], pool)  # warm up worker processes
+        started = time.perf_counter()
+        scraper.parse_bodies(pages, pool, chunksize=chunksize)
+        return len(pages) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Contact extraction microbenchmark")
+    parser.add_argument("--corpus", type=Path, help="Directory of saved .html pages")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--size-kb", type=int, default=400)
+    parser.add_argument("--mailto-share", type=float, default=0.1)
+    parser.add_argument("--workers", type=int, default=0, help="Max process-pool size")
+    parser.add_argument("--chunksize", type=int, default=4)
+    args = parser.parse_args()
+
+    if args.corpus:
+        pages = load_corpus(args.corpus)
+    else:
+        pages = synthetic_pages(args.pages, args.size_kb, args.mailto_share)
+    if not pages:
+        raise SystemExit("no pages to benchmark")
+
+    before = cpu_per_page(pages, always_parse=True)
+    scraper.EXTRACT_STATS.clear()
+    after = cpu_per_page(pages, always_parse=False)
+    stats = scraper.extractor_tier_stats()
+
+    print(f"pages:            {len(pages)}")
+    print(f"always parse:     {before * 1000:8.2f} ms CPU/page")
+    print(f"tiered:           {after * 1000:8.2f} ms CPU/page")
+    print(f"speedup:          {before / after:8.2f}x")
+    print(
+        f"tier hit rates:   regex-only {stats['regex_rate']:.0%}, "
+        f"full parse {stats['parse_rate']:.0%}"
+    )
+
+    if args.workers:
+        print(f"\nprocess-pool parse stage ({os.cpu_count()} CPUs):")
+        inline = pool_throughput(pages, 0, args.chunksize)
+        print(f"  inline      {inline:8.1f} pages/s")
+        for workers in range(1, args.workers + 1):
+            rate = pool_throughput(pages, workers, args.chunksize)
+            print(f"  {workers:2d} workers  {rate:8.1f} pages/s  ({rate / inline:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
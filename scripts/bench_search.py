@@ -0,0 +1,92 @@
+"""
+Benchmark the sequential and concurrent search stages against a local fake
+SerpApi endpoint, so no API credits are spent.
+
+Usage:
+    python -m scripts.bench_search --latency 0.8 --concurrency 4
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+from urllib.request import urlopen
+
+from modules.searcher import DEFAULT_QUERIES, run_searches, run_searches_async
+
+
+def _make_handler(latency: float):
+    class FakeSerpApiHandler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802 - http.server naming
+            query = parse_qs(urlparse(self.path).query).get("q", [""])[0]
+            time.sleep(latency)
+            # Neighbouring queries share some links so de-duplication is exercised.
+            organic = [
+                {
+                    "title": f"{query} #{rank}",
+                    "link": f"https://example.test/{(hash(query) + rank) % 25}",
+                    "snippet": f"snippet for {query}",
+                }
+                for rank in range(5)
+            ]
+            body = json.dumps({"organic_results": organic}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):  # silence per-request logging
+            pass
+
+    return FakeSerpApiHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search stage benchmark")
+    parser.add_argument("--latency", type=float, default=0.8, help="Fake API latency (s)")
+    parser.add_argument("--pause", type=float, default=1.2, help="Sequential pause (s)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=2.0)
+    parser.add_argument("--burst", type=float, default=2.0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(args.latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}/search"
+
+    def fetch(params: dict) -> dict:
+        with urlopen(f"{endpoint}?{urlencode(params)}", timeout=30) as resp:
+            return json.load(resp)
+
+    try:
+        started = time.perf_counter()
+        sequential = run_searches(api_key="fake", pause=args.pause, fetch=fetch)
+        sequential_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        concurrent = asyncio.run(
+            run_searches_async(
+                api_key="fake",
+                concurrency=args.concurrency,
+                rate=args.rate,
+                burst=args.burst,
+                fetch=fetch,
+            )
+        )
+        concurrent_s = time.perf_counter() - started
+    finally:
+        server.shutdown()
+
+    print(f"queries:     {len(DEFAULT_QUERIES)}")
+    print(f"sequential:  {sequential_s:6.2f}s  ({len(sequential)} results)")
+    print(f"concurrent:  {concurrent_s:6.2f}s  ({len(concurrent)} results)")
+    print(f"speedup:     {sequential_s / concurrent_s:6.2f}x")
+    print(f"same output: {sequential == concurrent}")
+
+
+if __name__ == "__main__":
+    main()
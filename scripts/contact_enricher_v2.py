@@ -5,12 +5,13 @@ Selenium-based scraper with retry logic, structured logging, and data integrity
 
 import argparse
 import hashlib
-import random
+import json
 import re
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 from selenium.webdriver.common.by import By
@@ -22,13 +23,22 @@ from modules.data_schema import (
     load_csv_with_schema,
     TOP10_SCHEMA
 )
+from modules.driver_pool import DriverPool
+from modules.journal import Journal
 from modules.logger import create_logger
+from modules.ratelimit import HostScheduler
 from modules.selenium_driver_v2 import (
     build_chrome_driver,
     ElementNotFoundError,
     safe_click,
-    safe_find
+    safe_find,
+    wait_for_any,
+    wait_for_document_ready,
+    watch_mutations
 )
+from modules.skip_cache import SkipCache
+from modules.tier_router import TierRouter
+from modules.urls import host_of
 
 # Regex patterns for contact extraction
 EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
@@ -44,6 +54,20 @@ def is_valid_email(email: str) -> bool:
     return domain not in GARBAGE_DOMAINS
 
 
+def contacts_in_text(text: str) -> Tuple[set, set]:
+    """Valid emails and phone numbers found in text."""
+    emails = {e for e in EMAIL_PATTERN.findall(text) if is_valid_email(e)}
+    return emails, set(PHONE_PATTERN.findall(text))
+
+
+def _response_text(body: str) -> str:
+    """JSON bodies are re-serialized so escapes like \\u0040 and \\/ read as plain text."""
+    try:
+        return json.dumps(json.loads(body), ensure_ascii=False)
+    except ValueError:
+        return body
+
+
 def extract_contacts_from_page(
     driver,
     url: str,
@@ -53,6 +77,11 @@ def extract_contacts_from_page(
     """
     Extract emails and phone numbers from a listing page.
     
+    When the driver has network capture on, contacts are also read from the
+    XHR/fetch responses the page and its reply widget load; the reveal wait
+    then ends as soon as such a response carries a contact, without waiting
+    for the DOM to re-render.
+    
     Args:
         driver: Selenium WebDriver instance
         url: Listing URL to scrape
@@ -64,51 +93,101 @@ def extract_contacts_from_page(
     """
     emails = set()
     phones = set()
+    quiet_ms = get_config().reveal_quiet_ms
+    reveal_selector = ', '.join(
+        sel for sel in (selectors.get('email_span'), selectors.get('phone_span')) if sel
+    )
+    waited = 0.0
+    reveal = "none"
+    capture = getattr(driver, 'network_capture', None)
+    
+    def harvest_network(_driver=None) -> bool:
+        """Scan finished responses; True once any contact has been seen."""
+        for _response_url, body in capture.bodies():
+            found_emails, found_phones = contacts_in_text(_response_text(body))
+            emails.update(found_emails)
+            phones.update(found_phones)
+        return bool(emails or phones)
     
     try:
-        # Navigate to listing
+        # Navigate to listing; wait only while the document is still loading
+        if capture is not None:
+            capture.reset()
         driver.get(url)
-        time.sleep(0.5)  # Brief pause for page load
+        started = time.perf_counter()
+        wait_for_document_ready(driver, timeout=5)
+        waited += time.perf_counter() - started
         
         # Try to click reply button to reveal hidden contacts
         reply_selector = selectors.get('reply_button')
         if reply_selector:
             try:
-                clicked = safe_click(driver, By.CSS_SELECTOR, reply_selector, timeout=3)
+                started = time.perf_counter()
+                watch_mutations(driver)
+                button = wait_for_any(
+                    driver, reply_selector, timeout=3, quiet_ms=quiet_ms, require_text=False
+                )
+                clicked = button == "found" and safe_click(
+                    driver, By.CSS_SELECTOR, reply_selector, timeout=3
+                )
+                if clicked and reveal_selector:
+                    # Returns as soon as the reply email/phone shows up
+                    reveal = wait_for_any(
+                        driver,
+                        reveal_selector,
+                        timeout=5,
+                        quiet_ms=quiet_ms,
+                        also=harvest_network if capture is not None else None
+                    )
+                    for element in driver.find_elements(By.CSS_SELECTOR, reveal_selector):
+                        found_emails, found_phones = contacts_in_text(element.text)
+                        emails.update(found_emails)
+                        phones.update(found_phones)
+                waited += time.perf_counter() - started
                 if clicked:
-                    time.sleep(1)  # Wait for contact reveal
-                    logger.info("reply_button_clicked", url=url)
+                    logger.info("reply_button_clicked", url=url, reveal=reveal)
             except Exception:
                 pass  # Reply button not critical
         
         # Extract from page body
         body_selector = selectors.get('listing_body', 'body')
         try:
+            started = time.perf_counter()
             body_element = safe_find(driver, By.CSS_SELECTOR, body_selector, timeout=5)
+            waited += time.perf_counter() - started
             if body_element:
-                text = body_element.text
-                
-                # Find emails
-                found_emails = EMAIL_PATTERN.findall(text)
-                emails.update([e for e in found_emails if is_valid_email(e)])
-                
-                # Find phones
-                found_phones = PHONE_PATTERN.findall(text)
+                found_emails, found_phones = contacts_in_text(body_element.text)
+                emails.update(found_emails)
                 phones.update(found_phones)
         
         except ElementNotFoundError:
             logger.warn("listing_body_not_found", url=url)
+        
+        # Responses that finished after the reveal wait
+        if capture is not None:
+            harvest_network()
     
     except Exception as e:
         logger.error("page_extraction_failed", url=url, error=str(e))
     
+    logger.record_timing("page_wait", waited)
+    logger.debug("page_wait", url=url, wait_ms=round(waited * 1000), reveal=reveal)
     return list(emails), list(phones)
 
 
+def listing_id(url: str) -> str:
+    """Stable row id for a listing URL (md5 prefix)."""
+    return hashlib.md5(url.encode()).hexdigest()[:12]
+
+
+def _filled(value) -> bool:
+    """True for a non-blank cell value (NaN and empty strings count as blank)."""
+    return bool(pd.notna(value) and str(value).strip())
+
+
 def enrich_single_listing(
-    driver,
+    extract: Callable[[str], Tuple[List[str], List[str]]],
     row: pd.Series,
-    selectors: Dict[str, str],
     logger,
     max_retries: int = 2
 ) -> Dict[str, any]:
@@ -116,9 +195,8 @@ def enrich_single_listing(
     Enrich a single listing with retry logic.
     
     Args:
-        driver: Selenium WebDriver
+        extract: Callable returning (emails, phones) for a URL
         row: CSV row as pandas Series
-        selectors: CSS selectors dict
         logger: StructuredLogger
         max_retries: Number of retry attempts
     
@@ -130,10 +208,10 @@ def enrich_single_listing(
     
     for attempt in range(max_retries + 1):
         try:
-            emails, phones = extract_contacts_from_page(driver, url, selectors, logger)
+            emails, phones = extract(url)
             
             # Generate unique ID from URL
-            row_id = hashlib.md5(url.encode()).hexdigest()[:12]
+            row_id = listing_id(url)
             
             return {
                 'id': row_id,
@@ -162,7 +240,7 @@ def enrich_single_listing(
             else:
                 # Final failure
                 logger.error("listing_failed_after_retries", url=url, error=str(e))
-                row_id = hashlib.md5(url.encode()).hexdigest()[:12]
+                row_id = listing_id(url)
                 
                 return {
                     'id': row_id,
@@ -178,12 +256,69 @@ def enrich_single_listing(
                 }
 
 
+def enrich_journal_path(csv_path: Path) -> Path:
+    """Per-row checkpoint journal kept next to the CSV."""
+    csv_path = Path(csv_path)
+    return csv_path.with_name(f"{csv_path.stem}.enrich.journal.jsonl")
+
+
+def _scraped_at(value) -> Optional[datetime]:
+    """Parse a last_scraped_at cell; None for blanks/NaN/garbage."""
+    try:
+        return datetime.fromisoformat(str(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _jsonable(record: Dict) -> Dict:
+    """Unwrap numpy scalars (bool_, int64, ...) so the record can be journaled."""
+    return {k: (v.item() if hasattr(v, 'item') else v) for k, v in record.items()}
+
+
+def _apply_journal(df: pd.DataFrame, journal: Journal) -> Tuple[pd.DataFrame, int]:
+    """
+    Overlay journaled results that are newer than the CSV (e.g. rows finished
+    before a crash, never written to the CSV).
+    
+    Returns:
+        (updated DataFrame, number of rows recovered)
+    """
+    offsets = journal.offsets_by('url', None)
+    records = df.to_dict('records')
+    recovered = 0
+    for record in records:
+        offset = offsets.get(record.get('url'))
+        if offset is None:
+            continue
+        saved = journal.read_at(offset).get('row') or {}
+        saved_at = _scraped_at(saved.get('last_scraped_at'))
+        current_at = _scraped_at(record.get('last_scraped_at'))
+        if saved_at and (current_at is None or saved_at > current_at):
+            record.update({k: saved[k] for k in TOP10_SCHEMA if k in saved})
+            recovered += 1
+    return pd.DataFrame(records, columns=list(TOP10_SCHEMA)), recovered
+
+
+def _merged_frame(df: pd.DataFrame, enriched_by_index: Dict) -> pd.DataFrame:
+    """Full CSV in original order: enriched results where available, else the input row."""
+    rows = [
+        enriched_by_index.get(idx, row.to_dict())
+        for idx, row in df.iterrows()
+    ]
+    return pd.DataFrame(rows, columns=list(TOP10_SCHEMA))
+
+
 def enrich_csv_contacts(
     csv_path: Path,
     headless: bool = True,
     max_rows: Optional[int] = None,
     dry_run: bool = False,
-    env: str = "dev"
+    env: str = "dev",
+    http_first: Optional[bool] = None,
+    workers: Optional[int] = None,
+    resume: bool = False,
+    fresh_hours: Optional[float] = None,
+    retry_skipped: bool = False
 ) -> Dict[str, int]:
     """
     Enrich CSV with Selenium scraping (production-grade).
@@ -191,15 +326,31 @@ def enrich_csv_contacts(
     Args:
         csv_path: Path to CSV file
         headless: Run browser in headless mode
-        max_rows: Limit number of rows to process (None = all)
+        max_rows: Limit number of rows to enrich (None = all); rows skipped
+            as fresh, already holding contacts or in backoff do not count
         dry_run: Don't write results to CSV
         env: Environment name (dev/staging/prod)
+        http_first: Try plain HTTP before Chrome (default from config)
+        workers: Parallel workers / pooled browsers (default from config)
+        resume: Recover journaled rows from an interrupted run and skip rows
+            scraped within ``fresh_hours``
+        fresh_hours: Resume freshness threshold (default from config)
+        retry_skipped: Ignore the skip-cache backoff and retry every row
+            (outcomes are still recorded)
+    
+    Every finished row is appended to a checkpoint journal next to the CSV,
+    and the CSV itself is rewritten atomically every ``checkpoint_every``
+    rows, so an interrupted run loses at most the rows in flight. The
+    journal is emptied once a run completes and its final CSV is written.
     
     Returns:
-        Dict with stats: processed, success, failed, skipped
+        Dict with stats: processed, success, failed, skipped (+ tiers)
     """
     # Setup
     config = get_config(env=env)
+    if http_first is None:
+        http_first = config.http_first
+    workers = max(1, workers or config.browser_pool_size)
     run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     logger = create_logger(log_dir=str(config.log_dir), run_id=run_id, env=env)
     
@@ -209,83 +360,187 @@ def enrich_csv_contacts(
         headless=headless,
         max_rows=max_rows,
         dry_run=dry_run,
-        env=env
+        env=env,
+        workers=workers
     )
     
     # Load CSV with schema validation
     df = load_csv_with_schema(csv_path, schema=TOP10_SCHEMA)
+    logger.info("csv_loaded", rows=len(df))
     
-    if max_rows:
-        df = df.head(max_rows)
+    journal = None if dry_run else Journal(enrich_journal_path(csv_path))
+    fresh_cutoff = None
+    if resume:
+        if journal is not None:
+            df, recovered = _apply_journal(df, journal)
+            logger.info("journal_recovered", rows=recovered)
+        if fresh_hours is None:
+            fresh_hours = config.resume_fresh_hours
+        fresh_cutoff = datetime.now() - timedelta(hours=fresh_hours)
     
-    logger.info("csv_loaded", rows=len(df))
+    # Rows that keep coming back empty are retried on an exponential backoff
+    skip_cache = None
+    if config.skip_cache_enabled and not dry_run:
+        skip_cache = SkipCache(
+            config.skip_cache_path,
+            base_hours=config.skip_base_hours,
+            max_hours=config.skip_max_hours
+        )
+    
+    # Rows this invocation will enrich; the rest pass through untouched.
+    # Skips are decided here so that max_rows counts only rows still due.
+    selected = []
+    for idx, row in df.iterrows():
+        if max_rows and len(selected) >= max_rows:
+            break
+        scraped_at = _scraped_at(row.get('last_scraped_at'))
+        if fresh_cutoff and scraped_at and scraped_at >= fresh_cutoff:
+            logger.record_processed()
+            logger.record_skipped()
+            logger.info("listing_skipped_fresh", url=row.get('url', ''))
+            continue
+        # Already enriched (has contacts); blank CSV cells load as NaN, which is truthy
+        if _filled(row.get('emails')) or _filled(row.get('phones')):
+            logger.record_processed()
+            logger.record_skipped()
+            logger.info("listing_skipped_has_contacts", url=row.get('url', ''))
+            continue
+        url = str(row.get('url', ''))
+        if (skip_cache is not None and not retry_skipped
+                and not skip_cache.should_attempt(listing_id(url))):
+            logger.record_processed()
+            logger.record_skipped()
+            logger.info("listing_skipped_backoff", url=url)
+            continue
+        selected.append((idx, row))
+    if fresh_cutoff:
+        logger.info("resume_selected", rows=len(selected), fresh_hours=fresh_hours)
     
     # Get selectors from config
     selectors = config.selectors.get('craigslist', {})
     
-    # Build WebDriver
-    driver = build_chrome_driver(headless=headless)
+    # Per-host politeness: consecutive rows on different sites don't wait
+    scheduler = HostScheduler(
+        config.politeness_delay_min,
+        jitter=max(0.0, config.politeness_delay_max - config.politeness_delay_min)
+    )
+    ordered = HostScheduler.interleave(
+        selected,
+        key=lambda item: host_of(str(item[1].get('url', '')))
+    )
+    
+    # One pooled browser per worker, started only once a row needs one
+    pool = DriverPool(
+        lambda: build_chrome_driver(headless=headless),
+        size=workers,
+        max_pages=config.driver_max_pages
+    )
+    
+    def browser_extract(url: str) -> Tuple[List[str], List[str]]:
+        with pool.driver() as driver:
+            return extract_contacts_from_page(driver, url, selectors, logger)
+    
+    router = None
+    if http_first:
+        router = TierRouter(
+            config.tier_memory_path,
+            browser_domains=config.browser_domains,
+            min_samples=config.tier_min_samples,
+            scheduler=scheduler
+        )
+    
+    def extract(url: str) -> Tuple[List[str], List[str]]:
+        if router is None:
+            scheduler.wait(host_of(url))
+            return browser_extract(url)
+        emails, phones, tier = router.route(url, browser_extract)
+        logger.info("listing_routed", url=url, tier=tier)
+        return emails, phones
+    
+    checkpoint_every = max(1, config.checkpoint_every)
+    backed_up = False
+    
+    def write_csv(enriched_by_index: Dict) -> None:
+        nonlocal backed_up
+        atomic_write_csv(
+            _merged_frame(df, enriched_by_index),
+            csv_path,
+            backup=not backed_up,
+            validate=True,
+            schema=TOP10_SCHEMA
+        )
+        backed_up = True
     
     try:
-        enriched_rows = []
+        enriched_by_index = {}
+        completed = 0
         
-        for idx, row in df.iterrows():
-            logger.record_processed()
-            
-            # Check if already enriched (has contacts)
-            if row.get('emails') or row.get('phones'):
-                logger.record_skipped()
-                logger.info("listing_skipped_has_contacts", url=row.get('url', ''))
-                enriched_rows.append(row.to_dict())
-                continue
-            
-            # Enrich listing with retries
-            result = enrich_single_listing(
-                driver,
-                row,
-                selectors,
-                logger,
-                max_retries=config.max_retries
-            )
-            
-            # Track results
-            if result['scrape_status'] == 'success':
-                logger.record_success()
-            elif result['scrape_status'] == 'failed':
-                logger.record_failed(result['scrape_error'])
-            else:
-                logger.record_skipped()
-            
-            enriched_rows.append(result)
-            
-            # Politeness delay (randomized)
-            if idx < len(df) - 1:  # Don't delay after last row
-                delay = random.uniform(
-                    config.politeness_delay_min,
-                    config.politeness_delay_max
+        # Work queue: rows fan out to parallel workers, results are
+        # tallied here on the main thread as they complete
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich") as executor:
+            futures = {}
+            for idx, row in ordered:
+                logger.record_processed()
+                
+                # Enrich listing with retries (HTTP first, browser if needed)
+                future = executor.submit(
+                    enrich_single_listing,
+                    extract,
+                    row,
+                    logger,
+                    max_retries=config.max_retries
                 )
-                time.sleep(delay)
+                futures[future] = idx
+            
+            for future in as_completed(futures):
+                result = future.result()
+                
+                # Track results
+                if result['scrape_status'] == 'success':
+                    logger.record_success()
+                elif result['scrape_status'] == 'failed':
+                    logger.record_failed(result['scrape_error'])
+                else:
+                    logger.record_skipped()
+                
+                enriched_by_index[futures[future]] = result
+                if skip_cache is not None:
+                    skip_cache.record(result['id'], result['url'], result['scrape_status'])
+                
+                # Durable per-row checkpoint, plus periodic atomic CSV writes
+                if journal is not None:
+                    journal.append({
+                        'run_id': run_id,
+                        'url': result['url'],
+                        'row': _jsonable(result)
+                    })
+                    completed += 1
+                    if completed % checkpoint_every == 0:
+                        write_csv(enriched_by_index)
         
-        # Write results
-        enriched_df = pd.DataFrame(enriched_rows)
+        # Restore the CSV's original row order
+        enriched_df = _merged_frame(df, enriched_by_index)
         
         if dry_run:
             logger.info("dry_run_complete", message="No CSV written")
             print("\n🧪 DRY RUN - Results preview:")
             print(enriched_df[['organization', 'emails', 'phones', 'scrape_status']].head())
         else:
-            atomic_write_csv(
-                enriched_df,
-                csv_path,
-                backup=True,
-                validate=True,
-                schema=TOP10_SCHEMA
-            )
+            write_csv(enriched_by_index)
+            # Every journaled row is now in the CSV; a later resume starts clean
+            journal.clear()
             cleanup_old_backups(csv_path, retention_days=7)
             logger.info("csv_written", path=str(csv_path))
     
     finally:
-        driver.quit()
+        pool.close()
+        logger.stats["driver_pool"] = dict(pool.stats)
+        if router is not None:
+            logger.stats["tiers"] = router.summary()
+            router.close()
+        if skip_cache is not None:
+            logger.stats["skip_cache"] = dict(skip_cache.stats)
+            skip_cache.close()
         stats = logger.finalize()
     
     # Print summary
@@ -296,6 +551,17 @@ def enrich_csv_contacts(
     print(f"Success: {stats['success']}")
     print(f"Failed: {stats['failed']}")
     print(f"Skipped: {stats['skipped']}")
+    if 'tiers' in stats:
+        tiers = stats['tiers']
+        print(
+            f"Tiers: {tiers['http']} via HTTP, {tiers['browser']} via browser "
+            f"({tiers['browser_share']:.0%} of pages opened a browser)"
+        )
+    if 'skip_cache' in stats:
+        print(f"Backoff skips: {stats['skip_cache']['skipped']} rows not retried yet")
+    if 'page_wait' in stats.get('timings', {}):
+        waits = stats['timings']['page_wait']
+        print(f"Page waits: p50 {waits['p50']}s, p95 {waits['p95']}s over {waits['count']} pages")
     print(f"Log: logs/run_report_{run_id}.json")
     
     return stats
@@ -339,6 +605,31 @@ def main():
         default='dev',
         help='Environment profile'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Parallel workers and pooled browsers (default from config)'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Recover checkpointed rows and skip recently scraped ones'
+    )
+    parser.add_argument(
+        '--fresh-hours',
+        type=float,
+        help='With --resume, skip rows scraped within this many hours (default from config)'
+    )
+    parser.add_argument(
+        '--retry-skipped',
+        action='store_true',
+        help='Retry rows still in their no-contacts/failed backoff window'
+    )
+    parser.add_argument(
+        '--browser-only',
+        action='store_true',
+        help='Skip the HTTP tier and open every row in Chrome'
+    )
     
     args = parser.parse_args()
     
@@ -350,7 +641,12 @@ def main():
         headless=headless,
         max_rows=args.max_rows,
         dry_run=args.dry_run,
-        env=args.env
+        env=args.env,
+        http_first=False if args.browser_only else None,
+        workers=args.workers,
+        resume=args.resume,
+        fresh_hours=args.fresh_hours,
+        retry_skipped=args.retry_skipped
     )
 
 
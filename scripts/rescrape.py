@@ -0,0 +1,120 @@
+"""
+Re-run the scrape stage over existing search results.
+
+By default pages are fetched live. With ``--from-archive`` nothing touches
+the network: the latest archived body of every page is re-extracted, so
+changes to EMAIL_RE / PHONE_RE / the no-reply filters take effect at disk
+speed. ``--compare`` reports how many rows changed against an earlier CSV.
+
+Usage:
+    python -m scripts.rescrape --from-archive
+    python -m scripts.rescrape --from-archive --run-id 20250101_120000 --parse-workers 4
+    python -m scripts.rescrape --from-archive --compare data/contacts_raw.csv
+"""
+
+import argparse
+import csv
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from modules import scraper
+from modules.config import get_config
+from modules.page_archive import PageArchive
+from modules.ratelimit import HostScheduler
+from modules.urls import canonicalize_url
+
+
+def _contacts_by_url(path: Path) -> Dict[str, Tuple[str, str]]:
+    with path.open("r", newline="", encoding="utf-8") as handle:
+        return {
+            canonicalize_url(row["url"]): (row.get("emails", ""), row.get("phones", ""))
+            for row in csv.DictReader(handle)
+            if row.get("url")
+        }
+
+
+def _report_changes(before_path: Path, after_path: Path) -> None:
+    before = _contacts_by_url(before_path)
+    after = _contacts_by_url(after_path)
+    shared = before.keys() & after.keys()
+    changed = sum(1 for url in shared if before[url] != after[url])
+    print(
+        f"compared with {before_path}: {changed} of {len(shared)} shared rows changed, "
+        f"{len(after.keys() - before.keys())} new, {len(before.keys() - after.keys())} missing"
+    )
+
+
+def _live_archive(settings) -> Optional[PageArchive]:
+    if not settings.archive_enabled:
+        return None
+    archive = PageArchive(
+        settings.archive_dir,
+        max_age_seconds=settings.archive_max_age_seconds,
+        max_bytes=settings.archive_max_bytes,
+    )
+    archive.prune()
+    return archive
+
+
+def main():
+    settings = get_config()
+    parser = argparse.ArgumentParser(description="Re-run contact extraction")
+    parser.add_argument(
+        "--from-archive",
+        action="store_true",
+        help="Re-extract archived pages offline instead of fetching live",
+    )
+    parser.add_argument("--archive-dir", type=Path, default=settings.archive_dir)
+    parser.add_argument("--run-id", default=None, help="Only pages archived by this run")
+    parser.add_argument(
+        "--search-results", type=Path, default=Path("data/search_results.json")
+    )
+    parser.add_argument("--out", type=Path, default=Path("data/contacts_rescraped.csv"))
+    parser.add_argument("--parse-workers", type=int, default=settings.parse_workers)
+    parser.add_argument("--compare", type=Path, help="Earlier contacts CSV to diff against")
+    args = parser.parse_args()
+
+    search_results = args.search_results if args.search_results.exists() else None
+    started = time.perf_counter()
+    if args.from_archive:
+        archive = PageArchive(args.archive_dir)
+        try:
+            written = scraper.rescrape_archive(
+                archive,
+                out_csv=args.out,
+                search_results=search_results,
+                run_id=args.run_id,
+                parse_workers=args.parse_workers,
+                parse_batch=settings.parse_batch,
+                parse_chunksize=settings.parse_chunksize,
+            )
+        finally:
+            archive.close()
+    else:
+        if search_results is None:
+            raise SystemExit(f"{args.search_results} not found")
+        rows = scraper.scrape_results(
+            search_results,
+            out_csv=args.out,
+            workers=settings.fetch_workers,
+            per_host=settings.per_host_connections,
+            max_bytes=settings.max_page_bytes,
+            parse_workers=args.parse_workers,
+            scheduler=HostScheduler(
+                settings.politeness_delay_min,
+                jitter=max(0.0, settings.politeness_delay_max - settings.politeness_delay_min),
+            ),
+            archive=_live_archive(settings),
+            report_dir=settings.log_dir,
+        )
+        written = len(rows)
+    elapsed = time.perf_counter() - started
+    print(f"{written} pages in {elapsed:.2f}s ({written / max(elapsed, 1e-9):.1f} pages/s)")
+
+    if args.compare:
+        _report_changes(args.compare, args.out)
+
+
+if __name__ == "__main__":
+    main()
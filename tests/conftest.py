@@ -0,0 +1,84 @@
+"""
+Shared fixtures: a local HTTP server standing in for scraped sites.
+"""
+
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class SiteServer:
+    """
+    Serves ``pages[path] = (status, content_type, body)`` on localhost.
+
+    ``hits`` counts requests per path and ``peak`` the most requests being
+    handled at once. A path in ``body_delays`` sends its headers, then waits
+    that many seconds before sending the body.
+    """
+
+    def __init__(self):
+        self.pages = {}
+        self.body_delays = {}
+        self.hits = Counter()
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with site._lock:
+                    site.hits[self.path] += 1
+                    site.active += 1
+                    site.peak = max(site.peak, site.active)
+                try:
+                    self._respond()
+                finally:
+                    with site._lock:
+                        site.active -= 1
+
+            def _respond(self):
+                status, content_type, body = site.pages.get(
+                    self.path, (404, "text/plain", b"not found")
+                )
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.flush()
+                if self.path in site.body_delays:
+                    time.sleep(site.body_delays[self.path])
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self._server.server_port}"
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+
+    def url(self, path):
+        return self.base + path
+
+    def page(self, path, body, status=200, content_type="text/html; charset=utf-8"):
+        self.pages[path] = (status, content_type, body)
+        return self.url(path)
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def site():
+    server = SiteServer()
+    yield server
+    server.close()
@@ -0,0 +1,124 @@
+"""
+Tests for enrichment checkpointing and resume, with HTTP-tier pages served
+locally (no Chrome needed).
+
+Run with:
+    pytest tests/test_contact_enricher.py -v
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("selenium")
+
+import pandas as pd  # noqa: E402
+
+from modules import config as config_module  # noqa: E402
+from modules.journal import Journal  # noqa: E402
+from modules.skip_cache import SkipCache  # noqa: E402
+from scripts import contact_enricher_v2 as enricher  # noqa: E402
+
+COLUMNS = list(enricher.TOP10_SCHEMA)
+
+
+def frame(rows):
+    return pd.DataFrame([{**dict.fromkeys(COLUMNS, ""), **row} for row in rows], columns=COLUMNS)
+
+
+def test_apply_journal_recovers_only_newer_rows(tmp_path):
+    now = datetime.now()
+    df = frame([
+        {"url": "https://x.org/a", "last_scraped_at": (now - timedelta(days=2)).isoformat()},
+        {"url": "https://x.org/b", "last_scraped_at": now.isoformat()},
+        {"url": "https://x.org/c"},
+    ])
+    journal = Journal(tmp_path / "j.jsonl", fsync=False)
+    for url, emails, age in (("a", "a@x.org", 1), ("b", "stale@x.org", 3), ("a", "a2@x.org", 0.5)):
+        journal.append({"url": f"https://x.org/{url}", "row": {
+            "url": f"https://x.org/{url}", "emails": emails, "scrape_status": "success",
+            "last_scraped_at": (now - timedelta(days=age)).isoformat(),
+        }})
+
+    recovered, count = enricher._apply_journal(df, journal)
+
+    assert count == 1
+    assert recovered["emails"].tolist() == ["a2@x.org", "", ""]
+    assert recovered["scrape_status"].tolist() == ["success", "", ""]
+    assert list(recovered.columns) == COLUMNS
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    """Config whose caches, logs and delays suit a fast local run."""
+    config = config_module.Config(env="test")
+    config._yaml_config = {
+        **config._yaml_config,
+        "scraper": {"politeness_delay_min": 0, "politeness_delay_max": 0, "max_retries": 0},
+        "enrichment": {
+            "http_first": True,
+            "browser_pool_size": 2,
+            "checkpoint_every": 1,
+            "skip_cache": False,
+            "tier_memory_path": str(tmp_path / "tiers.sqlite"),
+        },
+        "logging": {"output_dir": str(tmp_path / "logs")},
+    }
+    monkeypatch.setattr(config_module, "_config", config)
+    return config
+
+
+def test_resume_skips_rows_finished_before_a_crash(tmp_path, site, settings):
+    urls = [site.page(f"/{n}", f"<p>owner{n}@example.org</p>") for n in range(3)]
+    csv_path = tmp_path / "top10.csv"
+    frame([{"organization": f"Room {n}", "url": url, "score": 1.0} for n, url in enumerate(urls)]).to_csv(
+        csv_path, index=False
+    )
+    # Row 0 finished and was journaled, but the crash came before the CSV write
+    Journal(enricher.enrich_journal_path(csv_path)).append({"run_id": "r1", "url": urls[0], "row": {
+        "url": urls[0], "emails": "owner0@example.org", "scrape_status": "success",
+        "last_scraped_at": datetime.now().isoformat(),
+    }})
+
+    enricher.enrich_csv_contacts(csv_path, env="test", resume=True, fresh_hours=1)
+
+    assert site.hits == {"/1": 1, "/2": 1}
+    df = pd.read_csv(csv_path, dtype=str)
+    assert df["emails"].tolist() == [f"owner{n}@example.org" for n in range(3)]
+    assert df["url"].tolist() == urls
+    assert enricher.enrich_journal_path(csv_path).read_text() == ""
+
+
+def test_max_rows_counts_only_rows_still_due(tmp_path, site, settings):
+    urls = [site.page(f"/{n}", f"<p>owner{n}@example.org</p>") for n in range(4)]
+    csv_path = tmp_path / "top10.csv"
+    frame([
+        {"organization": f"Room {n}", "url": url, "score": 1.0, "emails": "known@example.org" if n < 2 else ""}
+        for n, url in enumerate(urls)
+    ]).to_csv(csv_path, index=False)
+
+    stats = enricher.enrich_csv_contacts(csv_path, env="test", resume=True, max_rows=2)
+
+    assert site.hits == {"/2": 1, "/3": 1}
+    assert stats["success"] == 2
+    df = pd.read_csv(csv_path, dtype=str)
+    assert df["emails"].tolist() == ["known@example.org"] * 2 + ["owner2@example.org", "owner3@example.org"]
+
+
+def test_max_rows_skips_rows_in_backoff_before_counting(tmp_path, site, settings):
+    urls = [site.page(f"/{n}", f"<p>owner{n}@example.org</p>") for n in range(4)]
+    csv_path = tmp_path / "top10.csv"
+    frame([{"organization": f"Room {n}", "url": url, "score": 1.0} for n, url in enumerate(urls)]).to_csv(
+        csv_path, index=False
+    )
+    settings._yaml_config["enrichment"].update(skip_cache=True, skip_cache_path=str(tmp_path / "skip.sqlite"))
+    dead = SkipCache(tmp_path / "skip.sqlite")
+    for url in urls[:2]:
+        dead.record(enricher.listing_id(url), url, "no_contacts")
+    dead.close()
+
+    enricher.enrich_csv_contacts(csv_path, env="test", max_rows=2)
+    assert site.hits == {"/2": 1, "/3": 1}
+
+    enricher.enrich_csv_contacts(csv_path, env="test", max_rows=2, retry_skipped=True)
+    assert site.hits == {"/0": 1, "/1": 1, "/2": 1, "/3": 1}
@@ -0,0 +1,132 @@
+"""
+Tests for weighted curation profiles.
+
+Run with:
+    pytest tests/test_curator.py -v
+"""
+
+import json
+
+import pandas as pd
+
+from modules.curator import CurationProfile, curate_contacts, load_profile
+from modules.score_cache import ScoreCache
+
+PROFILE = CurationProfile(
+    positive={"owner": 8, "garden": 9},
+    negative={"property management": -9},
+    budget_min=400,
+    budget_max=700,
+    budget_bonus=3,
+    budget_penalty=-2,
+    contact_bonus={"has_email": 6, "has_phone": 5},
+    top_n=2,
+)
+
+
+def test_weighted_scores_and_details(tmp_path):
+    contacts = tmp_path / "contacts_raw.csv"
+    pd.DataFrame({
+        "organization": ["Owner with Garden", "Lakeside Property Management", "Quiet room"],
+        "snippet": ["Room $650/mo", "Units from $1,200", "no price"],
+        "url": ["https://a.org/1", "https://b.org/2", "https://c.org/3"],
+        "emails": ["owner@a.org", "", ""],
+        "phones": ["", "(863) 555-0100", ""],
+    }).to_csv(contacts, index=False)
+
+    shortlist = curate_contacts(contacts, out_csv=tmp_path / "top.csv", profile=PROFILE)
+
+    assert list(shortlist["organization"]) == ["Owner with Garden", "Quiet room"]
+    assert list(shortlist["score"]) == [8 + 9 + 3 + 6, 0]
+    details = json.loads(shortlist.iloc[0]["score_details"])
+    assert details["positive_hits"] == ["owner", "garden"]
+    assert details["negative_hits"] == []
+    assert details["price"] == 650
+
+
+def test_streamed_shortlist_matches_in_memory(tmp_path):
+    contacts = tmp_path / "contacts_raw.csv"
+    organizations = ["owner", "garden", "property management", "room"] * 25
+    pd.DataFrame({
+        "organization": organizations,
+        "snippet": [f"listing {i}" for i in range(len(organizations))],
+        "url": [f"https://x.org/{i}" for i in range(len(organizations))],
+    }).to_csv(contacts, index=False)
+
+    whole = curate_contacts(contacts, out_csv=tmp_path / "whole.csv", top_n=7, profile=PROFILE)
+    streamed = curate_contacts(
+        contacts, out_csv=tmp_path / "streamed.csv", top_n=7, profile=PROFILE, chunksize=6
+    )
+
+    assert (tmp_path / "whole.csv").read_text() == (tmp_path / "streamed.csv").read_text()
+    assert list(streamed["url"]) == list(whole["url"])
+
+
+def test_score_cache_rescores_only_changed_rows(tmp_path):
+    contacts = tmp_path / "contacts_raw.csv"
+    frame = pd.DataFrame({
+        "organization": ["owner", "garden", "room"],
+        "snippet": ["$650", "", "property management"],
+        "url": ["https://x.org/1", "https://x.org/2", "https://x.org/3"],
+    })
+    frame.to_csv(contacts, index=False)
+    cache = ScoreCache(tmp_path / "scores.sqlite")
+
+    first = curate_contacts(contacts, out_csv=tmp_path / "a.csv", profile=PROFILE, cache=cache, top_n=3)
+    frame.loc[2, "snippet"] = "garden"
+    frame.to_csv(contacts, index=False)
+    second = curate_contacts(contacts, out_csv=tmp_path / "b.csv", profile=PROFILE, cache=cache, top_n=3)
+
+    assert cache.stats == {"hits": 2, "misses": 4}
+    assert list(first["score"]) == [11, 9, -9]
+    assert list(second["score"]) == [11, 9, 9]
+    uncached = curate_contacts(contacts, out_csv=tmp_path / "c.csv", profile=PROFILE, top_n=3)
+    assert (tmp_path / "b.csv").read_text() == (tmp_path / "c.csv").read_text()
+    assert list(uncached["score"]) == [11, 9, 9]
+
+
+def test_score_cache_drops_removed_rows_and_old_profile_versions(tmp_path):
+    contacts = tmp_path / "contacts_raw.csv"
+    frame = pd.DataFrame({
+        "organization": ["owner", "garden", "room"],
+        "url": ["https://x.org/1", "https://x.org/2", "https://x.org/3"],
+    })
+    frame.to_csv(contacts, index=False)
+    cache = ScoreCache(tmp_path / "scores.sqlite")
+
+    def stored():
+        return dict(cache._conn.execute("SELECT profile, COUNT(*) FROM scores GROUP BY profile"))
+
+    curate_contacts(contacts, out_csv=tmp_path / "a.csv", profile=PROFILE, cache=cache)
+    frame.drop(index=0).to_csv(contacts, index=False)
+    curate_contacts(contacts, out_csv=tmp_path / "b.csv", profile=PROFILE, cache=cache, chunksize=1)
+    assert stored() == {PROFILE.fingerprint: 2}
+
+    edited = CurationProfile(positive={"garden": 1}, negative={}, top_n=2)
+    curate_contacts(contacts, out_csv=tmp_path / "c.csv", profile=edited, cache=cache)
+    assert edited.name == PROFILE.name
+    assert stored() == {edited.fingerprint: 2}
+
+
+def test_default_profile_does_not_depend_on_the_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    assert load_profile().name == "curator.json"
+
+
+def test_score_cache_rerun_with_far_apart_hashes(tmp_path):
+    # These two rows hash to int64s of opposite sign whose difference overflows
+    contacts = tmp_path / "contacts_raw.csv"
+    pd.DataFrame({
+        "organization": ["owner", "mgmt"],
+        "snippet": ["room", "$900"],
+        "url": ["https://x.org/1", "https://x.org/36"],
+        "phones": ["555", ""],
+    }).to_csv(contacts, index=False)
+    cache = ScoreCache(tmp_path / "scores.sqlite")
+
+    first = curate_contacts(contacts, out_csv=tmp_path / "a.csv", profile=PROFILE, cache=cache)
+    second = curate_contacts(contacts, out_csv=tmp_path / "b.csv", profile=PROFILE, cache=cache)
+
+    assert cache.stats == {"hits": 2, "misses": 2}
+    assert list(second["score"]) == list(first["score"])
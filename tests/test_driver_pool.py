@@ -0,0 +1,96 @@
+"""
+Tests for the WebDriver pool using fake drivers (no Chrome needed).
+
+Run with:
+    pytest tests/test_driver_pool.py -v
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from modules.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_drivers_start_lazily_and_are_reused():
+    built = []
+    pool = DriverPool(lambda: built.append(FakeDriver()) or built[-1], size=3)
+
+    assert built == []
+    for _ in range(5):
+        with pool.driver():
+            pass
+
+    assert len(built) == 1
+    assert pool.stats["pages"] == 5
+
+
+def test_recycles_after_max_pages():
+    built = []
+    pool = DriverPool(lambda: built.append(FakeDriver()) or built[-1], max_pages=2)
+
+    for _ in range(5):
+        with pool.driver():
+            pass
+
+    assert len(built) == 3
+    assert pool.stats["recycled"] == 2
+    assert built[0].quit_called and built[1].quit_called
+
+
+def test_crashed_driver_is_replaced():
+    built = []
+    pool = DriverPool(lambda: built.append(FakeDriver()) or built[-1])
+
+    with pytest.raises(RuntimeError):
+        with pool.driver() as driver:
+            driver.alive = False
+            raise RuntimeError("tab crashed")
+    with pool.driver() as driver:
+        assert driver is built[1]
+
+    # A driver that died while idle fails the checkout health check.
+    built[1].alive = False
+    with pool.driver() as driver:
+        assert driver is built[2]
+    assert pool.stats["replaced"] == 2
+
+
+def test_parallel_workers_scale_up_to_pool_size():
+    active = []
+    peak = [0]
+    lock = threading.Lock()
+    # Each group of four visits must hold drivers at the same time to pass
+    together = threading.Barrier(4, timeout=5)
+    pool = DriverPool(FakeDriver, size=4)
+
+    def visit(_):
+        with pool.driver():
+            with lock:
+                active.append(1)
+                peak[0] = max(peak[0], len(active))
+            together.wait()
+            with lock:
+                active.pop()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(visit, range(16)))
+    pool.close()
+
+    assert peak[0] == 4  # never more browsers than the pool holds
+    assert pool.stats["created"] == 4
@@ -0,0 +1,60 @@
+"""
+Tests for the obfuscated-email decoder chain.
+
+Run with:
+    pytest tests/test_email_decoders.py -v
+"""
+
+from modules.email_decoders import cf_decode, decode_obfuscated
+
+
+def _cf_encode(address, key=0x5A):
+    return f"{key:02x}" + "".join(f"{ord(char) ^ key:02x}" for char in address)
+
+
+def _decoded(text):
+    return {address for _name, address in decode_obfuscated(text)}
+
+
+def test_cloudflare_attribute_and_link():
+    page = (
+        f'<span class="__cf_email__" data-cfemail="{_cf_encode("owner@lake.org")}">'
+        "[email&#160;protected]</span>"
+        f'<a href="/cdn-cgi/l/email-protection#{_cf_encode("desk@rent.com", 0x21)}">x</a>'
+    )
+
+    assert cf_decode(_cf_encode("a@b.io")) == "a@b.io"
+    assert _decoded(page) == {"owner@lake.org", "desk@rent.com"}
+
+
+def test_entities_and_spelled_out_forms():
+    page = (
+        "<p>jo&#64;example&#46;org</p>"
+        "<p>mary [at] homes [dot] com, bob at rentals dot net</p>"
+    )
+
+    assert _decoded(page) == {"jo@example.org", "mary@homes.com", "bob@rentals.net"}
+
+
+def test_prose_with_at_is_not_an_address():
+    page = "<p>Tour dates at Winter Haven dot com are listed at Amazon.com today.</p>"
+
+    assert _decoded(page) == set()
+
+
+def test_javascript_tricks():
+    page = (
+        "<script>"
+        "var a = 'land' + 'lord' + '@' + 'example.com';"
+        "var b = String.fromCharCode(106, 64, 120, 46, 105, 111);"
+        'var c = "moc.tnr@yllas".split("").reverse().join("");'
+        'var d = "pat\\x40site.io";'
+        "</script>"
+    )
+
+    assert _decoded(page) == {
+        "landlord@example.com",
+        "j@x.io",
+        "sally@rnt.com",
+        "pat@site.io",
+    }
@@ -0,0 +1,42 @@
+"""
+Tests for the pooled fetch engine, against a local HTTP server.
+
+Run with:
+    pytest tests/test_fetcher.py -v
+"""
+
+import pytest
+
+from modules.fetcher import Fetcher, PageSkipped
+
+
+def test_unknown_charset_falls_back_to_utf8(site):
+    url = site.page("/odd", "café owner@example.org", content_type="text/html; charset=x-bogus")
+    with Fetcher() as fetcher:
+        page = fetcher.fetch_page(url)
+    assert page.text == "café owner@example.org"
+
+
+def test_non_text_is_skipped_and_counted(site):
+    url = site.page("/doc.pdf", b"%PDF-1.4", content_type="application/pdf")
+    with Fetcher() as fetcher:
+        with pytest.raises(PageSkipped):
+            fetcher.fetch_page(url)
+        assert fetcher.stats["skipped_content_type"] == 1
+
+
+def test_body_is_capped_at_max_bytes(site):
+    url = site.page("/big", "x" * 5000)
+    with Fetcher(max_bytes=1000) as fetcher:
+        page = fetcher.fetch_page(url)
+        assert fetcher.stats["truncated"] == 1
+    assert len(page.content) == 1000 and page.truncated
+
+
+def test_per_host_limit_covers_body_transfer(site):
+    urls = [site.page(f"/slow{n}", "<p>slow body</p>") for n in range(4)]
+    site.body_delays.update({f"/slow{n}": 0.1 for n in range(4)})
+    with Fetcher(max_workers=4, per_host=1) as fetcher:
+        pages = fetcher.map(fetcher.fetch_page, urls)
+    assert [page.text for page in pages] == ["<p>slow body</p>"] * 4
+    assert site.peak == 1
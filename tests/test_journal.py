@@ -0,0 +1,57 @@
+"""
+Tests for the scrape progress journal and resuming a scrape.
+
+Run with:
+    pytest tests/test_journal.py -v
+"""
+
+import csv
+
+from modules.journal import Journal, new_run_id
+from modules.scraper import journal_path_for, scrape_results
+
+
+def test_run_ids_differ_within_one_second():
+    assert len({new_run_id() for _ in range(50)}) == 50
+
+
+def test_torn_line_is_ignored_and_latest_run_read_from_tail(tmp_path):
+    journal = Journal(tmp_path / "j.jsonl", fsync=False)
+    journal.append({"run_id": "r1", "url": "a"})
+    journal.append({"run_id": "r2", "url": "b"})
+    with journal.path.open("a", encoding="utf-8") as handle:
+        handle.write('{"run_id": "r3", "ur')
+
+    assert [record["url"] for _offset, record in journal.entries()] == ["a", "b"]
+    assert journal.latest_run_id() == "r2"
+    assert journal.offsets_by("url", "r1").keys() == {"a"}
+
+
+def test_compact_keeps_most_recent_runs(tmp_path):
+    journal = Journal(tmp_path / "j.jsonl", fsync=False)
+    for run_id in ("r1", "r2", "r3"):
+        for url in ("a", "b"):
+            journal.append({"run_id": run_id, "url": url})
+
+    assert journal.compact(keep_runs=2) == 2
+    assert [record["run_id"] for _offset, record in journal.entries()] == ["r2", "r2", "r3", "r3"]
+    assert journal.compact(keep_runs=2) == 0
+    assert journal.latest_run_id() == "r3"
+
+
+def test_resume_fetches_only_unfinished_urls(tmp_path, site):
+    results = [
+        {"title": f"Room {n}", "link": site.page(f"/{n}", f"<p>owner{n}@example.org</p>")}
+        for n in range(3)
+    ]
+    out_csv = tmp_path / "contacts_raw.csv"
+
+    # An interrupted run that got through the first two results
+    scrape_results(results[:2], out_csv=out_csv, run_id="r1", report_dir=None)
+    rows = scrape_results(results, out_csv=out_csv, resume=True, report_dir=None)
+
+    assert [row["emails"] for row in rows] == [f"owner{n}@example.org" for n in range(3)]
+    assert site.hits == {"/0": 1, "/1": 1, "/2": 1}
+    assert Journal(journal_path_for(out_csv)).latest_run_id() == "r1"
+    with out_csv.open(newline="", encoding="utf-8") as handle:
+        assert len(list(csv.DictReader(handle))) == 3
@@ -0,0 +1,37 @@
+"""
+Tests for the curator keyword matcher.
+
+Run with:
+    pytest tests/test_keyword_matcher.py -v
+"""
+
+import random
+
+from modules.keyword_matcher import KeywordMatcher
+
+
+def test_overlapping_and_nested_keywords():
+    matcher = KeywordMatcher(
+        ["owner", "Owner-Occupied", "home share", "share", "apartment"],
+        use_automaton=True,
+    )
+
+    assert matcher.find("OWNER-occupied home share near the lake") == {
+        "owner", "owner-occupied", "home share", "share",
+    }
+    assert matcher.find("") == set()
+
+
+def test_automaton_agrees_with_substring_scan():
+    rng = random.Random(3)
+    alphabet = "abc -"
+    for _ in range(200):
+        keywords = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5)))
+            for _ in range(rng.randint(1, 15))
+        ]
+        automaton = KeywordMatcher(keywords, use_automaton=True)
+        scan = KeywordMatcher(keywords, use_automaton=False)
+        for _ in range(10):
+            text = "".join(rng.choice(alphabet + "D") for _ in range(rng.randint(0, 30)))
+            assert automaton.find(text) == scan.find(text)
@@ -0,0 +1,83 @@
+"""
+Tests for near-duplicate listing detection.
+
+Run with:
+    pytest tests/test_near_dupes.py -v
+"""
+
+import numpy as np
+import pandas as pd
+
+from modules.near_dupes import MinHasher, cluster_near_duplicates, dedupe_contacts
+from modules.seen_store import SeenStore
+
+ROOM = "$750 Private Room/Bath in 2x2 MH available 11/14 near Lake Howard, Winter Haven"
+
+
+def test_cross_posts_cluster_and_unrelated_text_does_not():
+    labels = cluster_near_duplicates([
+        f"lakeland rooms & shares {ROOM}",
+        "Meals on Wheels thrift store, 620 6th St NW",
+        f"Rooms & Shares near Winter Haven {ROOM}",
+        "",
+        "",
+    ])
+
+    assert labels == [0, 1, 0, 3, 4]
+
+
+def test_chance_collision_first_in_a_bucket_does_not_hide_a_pair(monkeypatch):
+    # With 4 permutations at threshold 0.5 every slot is its own band.
+    # "a" and "d" each collide with the b/c pair in one band and come first there.
+    signatures = {
+        "a": [1, 5, 6, 7],
+        "d": [8, 2, 9, 10],
+        "b": [1, 2, 3, 4],
+        "c": [1, 2, 33, 44],
+    }
+    monkeypatch.setattr(
+        MinHasher, "signature", lambda self, text: np.array(signatures[text], dtype=np.uint64)
+    )
+
+    assert cluster_near_duplicates(["a", "d", "b", "c"], threshold=0.5, num_perm=4) == [0, 1, 2, 2]
+
+
+def test_dedupe_keeps_best_representative_and_marks_the_rest(tmp_path):
+    contacts = tmp_path / "contacts_raw.csv"
+    pd.DataFrame({
+        "organization": ["Craigslist room", "Roomies room", "Church bulletin"],
+        "url": ["https://a.org/1", "https://b.org/2", "https://c.org/3"],
+        "emails": ["", "owner@b.org", ""],
+        "phones": ["", "", ""],
+        "snippet": [ROOM, ROOM + ".", "Community notices and volunteer news"],
+    }).to_csv(contacts, index=False)
+    seen = SeenStore(tmp_path / "seen.sqlite")
+
+    deduped = dedupe_contacts(contacts, out_csv=tmp_path / "deduped.csv", seen_store=seen)
+
+    assert list(deduped["url"]) == ["https://b.org/2", "https://c.org/3"]
+    assert list(deduped["cluster_size"]) == [2, 1]
+    assert not seen.should_fetch("https://a.org/1")
+    assert seen.should_fetch("https://b.org/2")
+    assert seen.stats["near_duplicates"] == 1
+
+
+def test_new_representative_is_unmarked_on_the_next_run(tmp_path):
+    contacts = tmp_path / "contacts_raw.csv"
+    seen = SeenStore(tmp_path / "seen.sqlite")
+
+    def run(emails):
+        pd.DataFrame({
+            "organization": ["Craigslist room", "Roomies room"],
+            "url": ["https://a.org/1", "https://b.org/2"],
+            "emails": emails,
+            "phones": ["", ""],
+            "snippet": [ROOM, ROOM + "."],
+        }).to_csv(contacts, index=False)
+        return dedupe_contacts(contacts, out_csv=tmp_path / "deduped.csv", seen_store=seen)
+
+    assert list(run(["owner@a.org", ""])["url"]) == ["https://a.org/1"]
+    assert list(run(["", "owner@b.org"])["url"]) == ["https://b.org/2"]
+
+    assert seen.should_fetch("https://b.org/2")
+    assert not seen.should_fetch("https://a.org/1")
@@ -0,0 +1,149 @@
+"""
+Tests for reading contacts from captured XHR/fetch responses, using a fake
+driver that replays performance-log events (no Chrome needed).
+
+Run with:
+    pytest tests/test_network_capture.py -v
+"""
+
+import base64
+import json
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from modules import config as config_module  # noqa: E402
+from modules.logger import StructuredLogger  # noqa: E402
+from modules.selenium_driver_v2 import NetworkCapture  # noqa: E402
+from scripts import contact_enricher_v2 as enricher  # noqa: E402
+
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeDriver:
+    """
+    Loading a URL queues the performance-log events of ``pages[url]``, a list
+    of ``(response_url, resource_type, mime, body)``; a body of None means the
+    request failed to load.
+    """
+
+    def __init__(self, pages, body_text=""):
+        self.pages = pages
+        self.body_text = body_text
+        self.log = []
+        self.bodies = {}
+        self.missing = set()
+        self.encoded = set()
+
+    def _event(self, method, **params):
+        return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+    def get(self, url):
+        for n, (response_url, kind, mime, body) in enumerate(self.pages.get(url, [])):
+            request_id = f"{url}#{n}"
+            self.log.append(self._event(
+                "Network.responseReceived", requestId=request_id, type=kind,
+                response={"url": response_url, "mimeType": mime},
+            ))
+            if body is None:
+                self.log.append(self._event("Network.loadingFailed", requestId=request_id))
+                continue
+            self.bodies[request_id] = body
+            self.log.append(self._event("Network.loadingFinished", requestId=request_id))
+
+    def get_log(self, kind):
+        assert kind == "performance"
+        entries, self.log = self.log, []
+        return entries
+
+    def execute_cdp_cmd(self, command, params):
+        assert command == "Network.getResponseBody"
+        if params["requestId"] in self.missing:
+            raise RuntimeError("No resource with given identifier found")
+        body = self.bodies[params["requestId"]]
+        if params["requestId"] in self.encoded:
+            return {"body": base64.b64encode(body.encode()).decode(), "base64Encoded": True}
+        return {"body": body, "base64Encoded": False}
+
+    def execute_script(self, script, *args):
+        return "complete"
+
+    def find_element(self, _by, _selector):
+        return FakeElement(self.body_text)
+
+
+def test_capture_keeps_finished_responses_matching_the_filters():
+    page = "https://x.org/post/1"
+    driver = FakeDriver({page: [
+        ("https://x.org/reply/1", "XHR", "application/json", '{"email": "a@x.org"}'),
+        ("https://analytics.example/collect", "Fetch", "application/json", '{"id": 1}'),
+        ("https://x.org/reply/1.png", "Image", "image/png", "..."),
+        ("https://x.org/reply/2", "Fetch", "application/octet-stream", "..."),
+        ("https://x.org/reply/3", "XHR", "text/html", None),
+    ]})
+    capture = NetworkCapture(driver, url_patterns=["/reply/"])
+
+    driver.get(page)
+
+    assert capture.bodies() == [("https://x.org/reply/1", '{"email": "a@x.org"}')]
+    assert capture.stats["responses"] == 2
+    assert capture.bodies() == []
+
+
+def test_capture_decodes_base64_and_counts_evicted_bodies():
+    page = "https://x.org/post/1"
+    driver = FakeDriver({page: [
+        ("https://x.org/reply/1", "XHR", "text/plain", "a@x.org"),
+        ("https://x.org/reply/2", "XHR", "text/plain", "b@x.org"),
+    ]})
+    capture = NetworkCapture(driver)
+    driver.get(page)
+    driver.encoded.add(f"{page}#0")
+    driver.missing.add(f"{page}#1")
+
+    assert capture.bodies() == [("https://x.org/reply/1", "a@x.org")]
+    assert capture.stats["errors"] == 1
+
+
+def test_json_escapes_are_read_as_plain_text():
+    raw = '{"contact": "owner\\u0040example.org", "site": "https:\\/\\/x.org\\/reply"}'
+
+    emails, _phones = enricher.contacts_in_text(enricher._response_text(raw))
+
+    assert emails == {"owner@example.org"}
+    assert "https://x.org/reply" in enricher._response_text(raw)
+    assert enricher._response_text("owner@example.org") == "owner@example.org"
+
+
+def test_extract_harvests_contacts_from_captured_responses(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_module, "_config", config_module.Config(env="test"))
+    page = "https://x.org/post/1"
+    driver = FakeDriver({
+        "https://x.org/post/0": [("https://x.org/reply/0", "XHR", "text/plain", "old@example.org")],
+        page: [("https://x.org/reply/1", "XHR", "application/json", '{"email": "owner\\u0040example.org"}')],
+    }, body_text="Nice room, reply for details.")
+    driver.network_capture = NetworkCapture(driver, url_patterns=["/reply/"])
+    # Events left over from the previous page must not leak into this one
+    driver.get("https://x.org/post/0")
+
+    emails, phones = enricher.extract_contacts_from_page(
+        driver, page, {"listing_body": "body"}, StructuredLogger(tmp_path, run_id="r1")
+    )
+
+    assert emails == ["owner@example.org"]
+    assert phones == []
+    assert driver.network_capture.stats["bodies"] == 1
+
+
+def test_capture_is_off_and_scoped_by_default():
+    config = config_module.Config(env="test")
+    shipped = config._yaml_config["chrome"]
+    config._yaml_config = {}
+
+    assert config.chrome_capture_network is False
+    assert shipped["capture_network"] is config.chrome_capture_network
+    assert shipped["capture_url_patterns"] == config.chrome_capture_url_patterns
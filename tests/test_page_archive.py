@@ -0,0 +1,94 @@
+"""
+Tests for the raw page archive and offline re-extraction.
+
+Run with:
+    pytest tests/test_page_archive.py -v
+"""
+
+import csv
+import gzip
+import json
+import sys
+
+from modules.fetcher import Page
+from modules.page_archive import PageArchive
+from modules.scraper import rescrape_archive
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def page(url, text):
+    return Page(url, 200, {"Content-Type": "text/html"}, "text/html", text.encode(), text)
+
+
+def test_latest_record_per_canonical_url(tmp_path):
+    archive = PageArchive(tmp_path)
+    archive.append(page("https://x.org/1?utm_source=a", "old"), "r1")
+    archive.append(page("https://x.org/2", "two"), "r1")
+    archive.append(page("https://x.org/1", "new"), "r2")
+
+    assert archive.lookup("https://X.org/1/")["text"] == "new"
+    assert [r["text"] for r in archive.records()] == ["two", "new"]
+    assert [r["text"] for r in archive.records("r1")] == ["old", "two"]
+    assert archive.count() == 3
+    # The data file stays a plain concatenated gzip stream
+    with gzip.open(archive.data_path, "rt", encoding="utf-8") as handle:
+        assert [json.loads(line)["text"] for line in handle] == ["old", "two", "new"]
+
+
+def test_prune_by_age_then_size(tmp_path):
+    clock = FakeClock()
+    archive = PageArchive(tmp_path, clock=clock, max_age_seconds=150)
+    for n in range(4):
+        archive.append(page(f"https://x.org/{n}", f"body {n} " + "x" * 200), "r1")
+        clock.now += 60
+
+    assert archive.prune() == 2  # fetched 240 s and 180 s ago
+    assert [r["url"] for r in archive.records()] == ["https://x.org/2", "https://x.org/3"]
+
+    archive.max_bytes = archive.size() - 1
+    assert archive.prune() == 1
+    assert archive.lookup("https://x.org/3")["text"].startswith("body 3")
+    assert archive.data_path.stat().st_size == archive.size()
+    assert archive.prune() == 0
+
+
+def test_rescrape_archive_offline(tmp_path):
+    archive = PageArchive(tmp_path / "archive")
+    archive.append(page("https://x.org/1", '<a href="mailto:a@example.org">a</a>'), "r1")
+    archive.append(page("https://x.org/2", "Call (863) 555-0142"), "r1")
+    results = [{"title": "Room one", "link": "https://x.org/1?utm_source=feed"}]
+
+    out_csv = tmp_path / "rescraped.csv"
+    assert rescrape_archive(archive, out_csv=out_csv, search_results=results) == 2
+    with out_csv.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [(r["organization"], r["emails"], r["phones"]) for r in rows] == [
+        ("Room one", "a@example.org", ""),
+        ("", "", "(863) 555-0142"),
+    ]
+
+
+def test_rescrape_script_compares_with_earlier_csv(tmp_path, monkeypatch, capsys):
+    from scripts import rescrape
+
+    archive = PageArchive(tmp_path / "archive")
+    archive.append(page("https://x.org/1", "new@example.org"), "r1")
+    archive.close()
+    before = tmp_path / "before.csv"
+    before.write_text("organization,url,emails,phones,snippet\n,https://x.org/1,old@example.org,,\n")
+
+    monkeypatch.setattr(sys, "argv", [
+        "rescrape", "--from-archive", "--archive-dir", str(tmp_path / "archive"),
+        "--search-results", str(tmp_path / "none.json"),
+        "--out", str(tmp_path / "after.csv"), "--compare", str(before),
+    ])
+    rescrape.main()
+
+    assert "1 of 1 shared rows changed, 0 new, 0 missing" in capsys.readouterr().out
@@ -0,0 +1,118 @@
+"""
+Simulated-clock tests for the politeness scheduler and token bucket.
+
+Run with:
+    pytest tests/test_ratelimit.py -v
+"""
+
+import random
+
+import pytest
+
+from modules.ratelimit import HostScheduler, TokenBucket
+
+
+class SimClock:
+    """Deterministic clock; sleep() advances time instead of blocking."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def simulate(hosts, scheduler, clock, workers, service_time):
+    """
+    Replay a worker pool against the scheduler: each request goes to the
+    worker that frees up first, waits for its host slot, then holds the
+    worker for service_time. Returns [(host, start_time)].
+    """
+    free_at = [0.0] * workers
+    starts = []
+    for host in hosts:
+        worker = min(range(workers), key=free_at.__getitem__)
+        clock.now = free_at[worker]
+        start = clock.now + scheduler.reserve(host)
+        free_at[worker] = start + service_time
+        starts.append((host, start))
+    return starts
+
+
+@pytest.fixture
+def workload():
+    """Five hosts with eight requests each, listed host by host."""
+    return [f"site{h}.test" for h in range(5) for _ in range(8)]
+
+
+def test_per_host_spacing_is_enforced(workload):
+    clock = SimClock()
+    scheduler = HostScheduler(2.0, clock=clock, sleep=clock.sleep)
+    ordered = HostScheduler.interleave(workload, key=lambda host: host)
+
+    starts = simulate(ordered, scheduler, clock, workers=5, service_time=0.3)
+
+    for host in set(workload):
+        times = sorted(start for h, start in starts if h == host)
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        assert min(gaps) >= 2.0 - 1e-9, f"{host} spaced too tightly: {gaps}"
+
+
+def test_aggregate_rate_scales_with_host_count(workload):
+    clock = SimClock()
+    scheduler = HostScheduler(2.0, clock=clock, sleep=clock.sleep)
+    ordered = HostScheduler.interleave(workload, key=lambda host: host)
+
+    starts = simulate(ordered, scheduler, clock, workers=5, service_time=0.3)
+    makespan = max(start for _, start in starts) + 0.3
+
+    # Eight requests per host at 2s spacing: each timeline needs 7 gaps.
+    assert makespan == pytest.approx(7 * 2.0 + 0.3)
+    # A blanket 2s sleep between every request would need 39 gaps.
+    blanket = (len(workload) - 1) * 2.0 + 0.3
+    assert blanket / makespan > 4.5
+    assert len(workload) / makespan > 2.5  # requests per second overall
+
+
+def test_interleave_round_robins_and_keeps_host_order():
+    items = [("a", 1), ("a", 2), ("a", 3), ("b", 1), ("c", 1), ("c", 2)]
+
+    ordered = HostScheduler.interleave(items, key=lambda item: item[0])
+
+    assert ordered == [("a", 1), ("b", 1), ("c", 1), ("a", 2), ("c", 2), ("a", 3)]
+
+
+def test_wait_sleeps_only_for_the_same_host():
+    clock = SimClock()
+    scheduler = HostScheduler(3.0, clock=clock, sleep=clock.sleep)
+
+    assert scheduler.wait("a.test") == 0
+    assert scheduler.wait("b.test") == 0
+    assert scheduler.wait("a.test") == pytest.approx(3.0)
+    assert clock.now == pytest.approx(3.0)
+
+
+def test_jitter_stays_within_bounds():
+    clock = SimClock()
+    scheduler = HostScheduler(
+        1.0, jitter=2.0, clock=clock, sleep=clock.sleep, rng=random.Random(7)
+    )
+
+    starts = simulate(["a.test"] * 50, scheduler, clock, workers=3, service_time=0.1)
+    gaps = [b - a for (_, a), (_, b) in zip(starts, starts[1:])]
+
+    assert all(1.0 - 1e-9 <= gap <= 3.0 + 1e-9 for gap in gaps)
+
+
+def test_token_bucket_rate_after_burst():
+    clock = SimClock()
+    bucket = TokenBucket(rate=4.0, capacity=2.0, clock=clock)
+
+    for _ in range(10):
+        clock.sleep(bucket.reserve())
+
+    # Two tokens come from the burst, the other eight at 4 per second.
+    assert clock.now == pytest.approx(8 / 4.0)
@@ -0,0 +1,56 @@
+"""
+Tests for the scrape stage's fetch/parse pipeline.
+
+Run with:
+    pytest tests/test_scraper.py -v
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from modules import scraper
+
+
+def _pages(site):
+    return [
+        {"title": "Mailto", "link": site.page("/a", '<a href="mailto:a@example.org">Email</a>')},
+        {"title": "Plain", "link": site.page("/b", "Call (863) 555-0142 or b@example.org")},
+        {"title": "Encoded", "link": site.page("/c", "c [at] example [dot] org")},
+        {"title": "Empty", "link": site.page("/d", "<p>No contacts here</p>")},
+        {"title": "Missing", "link": site.url("/e")},
+    ]
+
+
+def test_pooled_and_inline_parsing_give_same_rows(tmp_path, site):
+    inline = scraper.scrape_results(_pages(site), out_csv=tmp_path / "inline.csv")
+    pooled = scraper.scrape_results(
+        _pages(site), out_csv=tmp_path / "pooled.csv", parse_workers=2, parse_chunksize=2
+    )
+
+    assert pooled == inline
+    assert [row["emails"] for row in inline] == [
+        "a@example.org", "b@example.org", "c@example.org", "", "",
+    ]
+
+
+def test_parsing_overlaps_downloads_still_in_flight():
+    parsed_first = threading.Event()
+    waited = []
+    parsed = []
+
+    def network(name):
+        if name == "slow":
+            # Only finishes early if "fast" was parsed while this fetch ran
+            waited.append(parsed_first.wait(timeout=2))
+        fetched = scraper._Fetched(name, text=f"{name}@example.org")
+        return {"url": name}, {}, fetched
+
+    def on_parsed(staged, extraction):
+        parsed.append(extraction.emails)
+        parsed_first.set()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        scraper._pipeline(["fast", "slow"], network, on_parsed, 2, pool, window=8, chunksize=1)
+
+    assert waited == [True]
+    assert parsed == [["fast@example.org"], ["slow@example.org"]]
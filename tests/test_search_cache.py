@@ -0,0 +1,102 @@
+"""
+Tests for the on-disk SerpApi response cache.
+
+Run with:
+    pytest tests/test_search_cache.py -v
+"""
+
+import os
+
+import pytest
+
+from modules.search_cache import SearchCache, fingerprint
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def params(query):
+    return {"engine": "google", "q": query, "location": "Winter Haven", "num": 10}
+
+
+def test_fingerprint_ignores_case_whitespace_and_api_key():
+    assert fingerprint({**params("Room  For Rent"), "api_key": "a"}) == fingerprint(
+        params("room for rent")
+    )
+    assert fingerprint(params("room for rent")) != fingerprint(params("room to rent"))
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    clock = FakeClock()
+    cache = SearchCache(tmp_path, ttl_seconds=60, clock=clock)
+    cache.store(params("q"), {"organic_results": [1]})
+
+    clock.now += 59
+    assert cache.lookup(params("q")) == {"organic_results": [1]}
+    clock.now += 1
+    assert cache.lookup(params("q")) is None
+    assert not list(tmp_path.glob("*.json.gz"))
+    assert (cache.stats["hits"], cache.stats["misses"]) == (1, 1)
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    clock = FakeClock()
+    cache = SearchCache(tmp_path, max_bytes=10**9, clock=clock)
+    for query in ("a", "b", "c"):
+        clock.now += 1
+        cache.store(params(query), {"text": query * 200})
+    clock.now += 1
+    cache.lookup(params("a"))  # "b" is now the oldest entry
+
+    entry_size = max(p.stat().st_size for p in tmp_path.glob("*.json.gz"))
+    cache.max_bytes = 3 * entry_size
+    clock.now += 1
+    cache.store(params("d"), {"text": "d" * 200})
+
+    assert cache.lookup(params("b")) is None
+    assert all(cache.lookup(params(q)) is not None for q in ("a", "c", "d"))
+    assert cache.stats["evictions"] == 1
+
+
+@pytest.mark.parametrize(
+    "mode, served, written",
+    [("read", True, True), ("refresh", False, True), ("off", False, False)],
+)
+def test_modes(tmp_path, mode, served, written):
+    SearchCache(tmp_path).store(params("q"), {"old": True})
+    cache = SearchCache(tmp_path, mode=mode)
+
+    assert (cache.lookup(params("q")) is not None) == served
+    cache.store(params("q"), {"new": True})
+    assert (cache.stats["writes"] == 1) == written
+    assert SearchCache(tmp_path).lookup(params("q")) == ({"new": True} if written else {"old": True})
+
+
+def test_invalid_mode_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        SearchCache(tmp_path, mode="write")
+
+
+def test_cached_run_needs_no_api_key(tmp_path, monkeypatch):
+    searcher = pytest.importorskip("modules.searcher", exc_type=ImportError)
+    monkeypatch.delenv("SERPAPI_KEY", raising=False)
+    queries = ["room for rent"]
+    cache = SearchCache(tmp_path)
+    cache.store(
+        searcher._build_params(queries[0], searcher.DEFAULT_LOCATION, 10),
+        {"organic_results": [{"title": "t", "link": "https://x.org/1"}]},
+    )
+
+    def fetch(_params):
+        raise AssertionError("cached query must not reach the API")
+
+    results = searcher.run_searches(queries=queries, fetch=fetch, cache=cache, pause=0)
+    assert [r["link"] for r in results] == ["https://x.org/1"]
+    with pytest.raises(RuntimeError):
+        searcher.run_searches(queries=["uncached"], fetch=fetch, cache=cache, pause=0)
+    assert os.getenv("SERPAPI_KEY") is None
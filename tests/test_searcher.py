@@ -0,0 +1,37 @@
+"""
+Tests for the concurrent search stage.
+
+Run with:
+    pytest tests/test_searcher.py -v
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+searcher = pytest.importorskip("modules.searcher", exc_type=ImportError)
+
+
+def test_blocking_on_item_does_not_stall_other_queries():
+    released = threading.Event()
+    waited = []
+
+    def fetch(params):
+        return {"organic_results": [{"title": params["q"], "link": f"https://x.org/{params['q']}"}]}
+
+    def on_item(item):
+        if item["title"] == "a":
+            # A full scrape queue: block until the other query's hit arrives
+            waited.append(released.wait(timeout=2))
+        else:
+            released.set()
+
+    results = asyncio.run(
+        searcher.run_searches_async(
+            api_key="k", queries=["a", "b"], fetch=fetch, on_item=on_item, rate=100, burst=10
+        )
+    )
+
+    assert waited == [True]
+    assert [r["title"] for r in results] == ["a", "b"]
@@ -0,0 +1,79 @@
+"""
+Tests for the cross-run seen-set and how the scraper uses it.
+
+Run with:
+    pytest tests/test_seen_store.py -v
+"""
+
+from modules.journal import Journal
+from modules.scraper import journal_path_for, scrape_results
+from modules.seen_store import SeenStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_revisit_age_and_canonical_keys(tmp_path):
+    clock = FakeClock()
+    store = SeenStore(tmp_path / "seen.sqlite", revisit_seconds=3600, clock=clock)
+
+    assert store.should_fetch("https://x.org/1")
+    store.mark("https://x.org/1?utm_source=feed")
+    assert not store.should_fetch("HTTPS://X.ORG/1/")
+    clock.now += 3600
+    assert store.should_fetch("https://x.org/1")
+    assert store.stats["saved"] == 1
+    assert store.stats["fetched"] == 1
+
+
+def test_duplicate_marks_expire_and_can_be_cleared(tmp_path):
+    clock = FakeClock()
+    store = SeenStore(tmp_path / "seen.sqlite", duplicate_seconds=3600, clock=clock)
+
+    store.mark_duplicate("https://x.org/1", "c1")
+    assert not store.should_fetch("https://x.org/1")
+    clock.now += 3600
+    assert store.should_fetch("https://x.org/1")
+
+    store.mark_duplicate("https://x.org/1", "c1")  # re-marked by the next dedupe run
+    assert not store.should_fetch("https://x.org/1")
+    store.clear_duplicate("https://x.org/1")
+    assert store.should_fetch("https://x.org/1")
+    assert store.stats["near_duplicates"] == 2
+
+
+def _results(site):
+    return [
+        {"title": "Room", "link": site.page("/ok", "<p>owner@example.org</p>")},
+        {"title": "Gone", "link": site.page("/gone", "oops", status=500)},
+    ]
+
+
+def test_failed_fetches_are_retried_next_run(tmp_path, site):
+    store = SeenStore(tmp_path / "seen.sqlite")
+    out_csv = tmp_path / "contacts_raw.csv"
+
+    scrape_results(_results(site), out_csv=out_csv, seen_store=store, report_dir=None)
+    rows = scrape_results(_results(site), out_csv=out_csv, seen_store=store, report_dir=None)
+
+    assert site.hits == {"/ok": 1, "/gone": 2}
+    assert [row["emails"] for row in rows] == ["owner@example.org", ""]
+
+
+def test_seen_url_without_journaled_row_is_fetched(tmp_path, site):
+    store = SeenStore(tmp_path / "seen.sqlite")
+    out_csv = tmp_path / "contacts_raw.csv"
+    results = _results(site)[:1]
+
+    scrape_results(results, out_csv=out_csv, seen_store=store, report_dir=None)
+    journal_path_for(out_csv).unlink()
+    rows = scrape_results(results, out_csv=out_csv, seen_store=store, report_dir=None)
+
+    assert site.hits["/ok"] == 2
+    assert [row["emails"] for row in rows] == ["owner@example.org"]
+    assert Journal(journal_path_for(out_csv)).latest_run_id() is not None
@@ -0,0 +1,75 @@
+"""
+Tests for the event-driven page waits, using a fake driver (no Chrome needed).
+
+Run with:
+    pytest tests/test_selenium_waits.py -v
+"""
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from modules import selenium_driver_v2 as drv  # noqa: E402
+from modules.logger import StructuredLogger  # noqa: E402
+
+
+class FakeDriver:
+    """
+    A page with elements matched by one selector. ``texts`` is the visible
+    text of each match per poll (the last entry repeats); ``quiet_after``
+    is the poll from which the DOM counts as settled.
+    """
+
+    def __init__(self, texts, quiet_after=None):
+        self.texts = texts
+        self.quiet_after = quiet_after
+        self.polls = 0
+
+    def _current(self):
+        return self.texts[min(self.polls, len(self.texts) - 1)]
+
+    def find_elements(self, _by, _selector):
+        return list(self._current())
+
+    def execute_script(self, script, *args):
+        if script == drv._HAS_CONTENT_JS:
+            filled = any(text.strip() for text in self._current())
+            self.polls += 1
+            return filled
+        if script == drv._MUTATION_AGE_JS:
+            settled = self.quiet_after is not None and self.polls >= self.quiet_after
+            return 10_000 if settled else 0
+        raise AssertionError(f"unexpected script {script!r}")
+
+
+def test_empty_placeholder_is_not_found_until_filled():
+    driver = FakeDriver([[""], [""], ["  "], ["owner@example.org"]])
+
+    assert drv.wait_for_any(driver, ".reply-email", timeout=2) == "found"
+    assert driver.polls == 4
+
+
+def test_page_that_stays_empty_settles_as_quiet():
+    driver = FakeDriver([[""]], quiet_after=3)
+
+    assert drv.wait_for_any(driver, ".reply-email", timeout=2) == "quiet"
+
+
+def test_network_condition_ends_the_wait():
+    driver = FakeDriver([[""]])
+
+    assert drv.wait_for_any(driver, ".reply-email", timeout=2, also=lambda d: d.polls >= 2) == "network"
+
+
+def test_presence_is_enough_for_icon_buttons():
+    driver = FakeDriver([[""]])
+
+    assert drv.wait_for_any(driver, ".reply-button", timeout=2, require_text=False) == "found"
+
+
+def test_debug_events_go_to_the_file_only(tmp_path, capsys):
+    logger = StructuredLogger(tmp_path, run_id="r1")
+    logger.debug("page_wait", wait_ms=12)
+
+    assert capsys.readouterr().out == ""
+    assert '"level": "DEBUG"' in logger.log_file.read_text(encoding="utf-8")
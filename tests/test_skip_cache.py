@@ -0,0 +1,48 @@
+"""
+Tests for the enrichment negative cache.
+
+Run with:
+    pytest tests/test_skip_cache.py -v
+"""
+
+from modules.skip_cache import SkipCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_backoff_doubles_per_consecutive_miss(tmp_path):
+    clock = FakeClock()
+    cache = SkipCache(tmp_path / "skip.sqlite", base_hours=1, max_hours=3, clock=clock)
+
+    cache.record("abc", "https://x.org/1", "no_contacts")
+    assert not cache.should_attempt("abc")
+    clock.now += 3600
+    assert cache.should_attempt("abc")
+
+    cache.record("abc", "https://x.org/1", "failed")
+    clock.now += 3600
+    assert not cache.should_attempt("abc")  # second miss waits 2 h
+    clock.now += 3600
+    assert cache.should_attempt("abc")
+
+    cache.record("abc", "https://x.org/1", "no_contacts")
+    assert cache.entry("abc")["next_attempt"] == clock.now + 3 * 3600  # capped
+    assert cache.entry("abc")["failures"] == 1
+    assert cache.stats["skipped"] == 2
+
+
+def test_success_clears_the_entry(tmp_path):
+    cache = SkipCache(tmp_path / "skip.sqlite")
+
+    cache.record("abc", "https://x.org/1", "failed")
+    cache.record("abc", "https://x.org/1", "success")
+
+    assert cache.entry("abc") is None
+    assert cache.should_attempt("abc")
+    assert cache.stats["cleared"] == 1
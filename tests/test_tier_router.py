@@ -0,0 +1,130 @@
+"""
+Tests for HTTP-first / browser-fallback routing, against a local HTTP server.
+
+Run with:
+    pytest tests/test_tier_router.py -v
+"""
+
+import pytest
+
+from modules.tier_router import TierRouter
+
+
+class FakeBrowser:
+    """Stand-in for the WebDriver tier: returns canned contacts per URL."""
+
+    def __init__(self, contacts=None):
+        self.contacts = contacts or {}
+        self.calls = []
+
+    def __call__(self, url):
+        self.calls.append(url)
+        return self.contacts.get(url, ([], []))
+
+
+@pytest.fixture
+def router(tmp_path):
+    router = TierRouter(tmp_path / "tiers.sqlite", min_samples=2)
+    yield router
+    router.close()
+
+
+def test_http_hit_never_opens_a_browser(router, site):
+    url = site.page("/a", "<p>owner@example.org</p>")
+    browser = FakeBrowser()
+
+    assert router.route(url, browser) == (["owner@example.org"], [], "http")
+    assert browser.calls == []
+    assert router.memory("127.0.0.1")["http_ok"] == 1
+
+
+def test_empty_http_page_escalates_to_browser(router, site):
+    url = site.page("/js", "<div id='app'></div>")
+    browser = FakeBrowser({url: (["owner@example.org"], [])})
+
+    assert router.route(url, browser) == (["owner@example.org"], [], "browser")
+    assert router.summary()["escalated"] == 1
+    assert router.summary()["browser_share"] == 1.0
+
+
+def test_configured_browser_domain_skips_http(tmp_path, site):
+    router = TierRouter(tmp_path / "tiers.sqlite", browser_domains=["127.0.0.1"])
+    url = site.page("/a", "<p>owner@example.org</p>")
+    browser = FakeBrowser({url: ([], ["(863) 555-0142"])})
+
+    assert router.route(url, browser)[2] == "browser"
+    assert site.hits["/a"] == 0
+    assert router.stats["forced"] == 1
+    router.close()
+
+
+def test_domain_promoted_to_browser_after_http_keeps_failing(router, site):
+    urls = [site.page(f"/js{n}", "<div id='app'></div>") for n in range(3)]
+    browser = FakeBrowser({url: (["owner@example.org"], []) for url in urls})
+
+    for url in urls[:2]:
+        router.route(url, browser)
+    assert router.needs_browser("127.0.0.1")
+    router.route(urls[2], browser)
+
+    assert site.hits["/js2"] == 0
+    assert router.stats["forced"] == 1
+
+
+def test_domain_demoted_when_browser_never_helps(router, site):
+    urls = [site.page(f"/empty{n}", "<p>No contacts</p>") for n in range(3)]
+    browser = FakeBrowser()
+
+    tiers = [router.route(url, browser)[2] for url in urls]
+
+    assert tiers == ["browser", "browser", "http"]
+    assert browser.calls == urls[:2]
+    assert router.stats["not_escalated"] == 1
+    assert not router.browser_helps("127.0.0.1")
+
+
+def test_an_http_success_cancels_promotion(router, site):
+    empty = [site.page(f"/js{n}", "<div id='app'></div>") for n in range(2)]
+    browser = FakeBrowser({url: (["owner@example.org"], []) for url in empty})
+    for url in empty:
+        router.route(url, browser)
+    assert router.needs_browser("127.0.0.1")
+    router._remember("127.0.0.1", "http_ok")
+
+    assert not router.needs_browser("127.0.0.1")
+
+
+def test_enrich_single_listing_uses_the_extract_callable(tmp_path, site, monkeypatch):
+    pytest.importorskip("selenium")
+    import pandas as pd
+    from scripts import contact_enricher_v2 as enricher
+
+    monkeypatch.setattr(enricher.time, "sleep", lambda _seconds: None)
+    router = TierRouter(tmp_path / "tiers.sqlite")
+    url = site.page("/a", "<p>owner@example.org</p>")
+    failures = iter([RuntimeError("timeout")])
+
+    def extract(page_url):
+        for error in failures:
+            raise error
+        emails, phones, _tier = router.route(page_url, FakeBrowser())
+        return emails, phones
+
+    class Log:
+        def __getattr__(self, _name):
+            return lambda *args, **kwargs: None
+
+    row = pd.Series({"organization": "Room", "url": url, "emails": "", "phones": ""})
+    result = enricher.enrich_single_listing(extract, row, Log(), max_retries=1)
+    router.close()
+
+    assert result["scrape_status"] == "success"
+    assert result["emails"] == "owner@example.org"
+    assert result["id"] == enricher.listing_id(url)
+
+    def broken(_url):
+        raise RuntimeError("chrome not reachable")
+
+    failed = enricher.enrich_single_listing(broken, row, Log(), max_retries=1)
+    assert failed["scrape_status"] == "failed"
+    assert "chrome not reachable" in failed["scrape_error"]
@@ -0,0 +1,44 @@
+"""
+Tests for URL canonicalization.
+
+Run with:
+    pytest tests/test_urls.py -v
+"""
+
+import pytest
+
+from modules.urls import canonicalize_url, host_of
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        "HTTPS://Example.ORG:443/rooms/12/?utm_source=x&gclid=abc#photos",
+        "https://example.org/rooms/12?fbclid=1&page=1",
+        "https://example.org/rooms/12/",
+    ],
+)
+def test_variants_share_one_canonical_form(variant):
+    assert canonicalize_url(variant) == "https://example.org/rooms/12"
+
+
+def test_query_is_sorted_and_path_case_kept():
+    assert canonicalize_url("http://x.org:8080/Rooms?b=2&a=1") == "http://x.org:8080/Rooms?a=1&b=2"
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("https://x.org/view?ref=listing-1", "https://x.org/view?ref=listing-2"),
+        ("https://x.org/?p=1", "https://x.org/?p=2"),
+        ("https://x.org/?p=1", "https://x.org/"),
+        ("https://x.org/list?page=2", "https://x.org/list"),
+    ],
+)
+def test_content_bearing_params_keep_pages_apart(first, second):
+    assert canonicalize_url(first) != canonicalize_url(second)
+
+
+def test_host_of():
+    assert host_of("https://WWW.Example.org:8443/a") == "www.example.org"
+    assert host_of("") == ""